@@ -0,0 +1,529 @@
+"""This script benchmarks and checks the HOM extensions in the inline module.
+
+It must be run with hython from this directory:
+
+    hython benchmark_inline.py [rows] [columns]
+
+The element construction used by adjacency and lookup functions is timed
+against globbing one number, or one '{prim}v{idx}' string, per element.  The
+native adjacency arrays, sort permutations, group expressions and packed
+group bits are then checked against results computed with plain HOM calls.
+The script exits with a non-zero status if any check fails.
+
+"""
+__author__ = "Graham Thompson"
+__email__ = "captainhammy@gmail.com"
+
+# Python Imports
+import random
+import sys
+import timeit
+
+# Houdini Imports
+import hou
+
+import inline
+
+# The number of times each benchmark is repeated.  The fastest time is used.
+_REPEAT = 5
+
+
+#-----------------------------------------------------------------------------
+# Name: _createGrid
+#
+# Args:
+#     rows : (int)
+#         The number of rows of points.
+#     columns : (int)
+#         The number of columns of points.
+#
+# Returns: hou.Geometry
+#              Writable geometry containing a grid of polygons.
+#
+# Raises: N/A
+#
+# Desc: Cook a grid SOP and return a frozen copy of its geometry.
+#-----------------------------------------------------------------------------
+def _createGrid(rows, columns):
+    geo_node = hou.node("/obj").createNode("geo")
+
+    grid = geo_node.createNode("grid")
+    grid.parm("rows").set(rows)
+    grid.parm("cols").set(columns)
+
+    geometry = grid.geometry().freeze()
+
+    geo_node.destroy()
+
+    return geometry
+
+
+#-----------------------------------------------------------------------------
+# Name: _timeCall
+#
+# Args:
+#     function : (callable)
+#         The function to time.
+#     args : (tuple)
+#         The arguments to call the function with.
+#
+# Returns: float
+#              The fastest time, in seconds, of _REPEAT calls.
+#
+# Raises: N/A
+#
+# Desc: Time a function call.
+#-----------------------------------------------------------------------------
+def _timeCall(function, *args):
+    times = []
+
+    for _ in range(_REPEAT):
+        start = timeit.default_timer()
+        function(*args)
+        times.append(timeit.default_timer() - start)
+
+    return min(times)
+
+
+#-----------------------------------------------------------------------------
+# Name: _check
+#
+# Args:
+#     condition : (bool)
+#         Whether the check passed.
+#     message : (str)
+#         A description of the check.
+#
+# Returns: N/A
+#
+# Raises:
+#     AssertionError
+#         This exception is raised if the check failed.
+#
+# Desc: Report the result of a check.
+#-----------------------------------------------------------------------------
+def _check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+    print "ok: {0}".format(message)
+
+
+#-----------------------------------------------------------------------------
+# Name: _globPoints
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the points belong to.
+#     point_list : (list|tuple)
+#         A list of integers representing point numbers.
+#
+# Returns: tuple
+#              A tuple of hou.Point objects.
+#
+# Raises: N/A
+#
+# Desc: Glob points using a pattern with one number per point.
+#-----------------------------------------------------------------------------
+def _globPoints(geometry, point_list):
+    return geometry.globPoints(' '.join([str(value) for value in point_list]))
+
+
+#-----------------------------------------------------------------------------
+# Name: _globPrims
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the primitives belong to.
+#     prim_list : (list|tuple)
+#         A list of integers representing primitive numbers.
+#
+# Returns: tuple
+#              A tuple of hou.Prim objects.
+#
+# Raises: N/A
+#
+# Desc: Glob primitives using a pattern with one number per primitive.
+#-----------------------------------------------------------------------------
+def _globPrims(geometry, prim_list):
+    return geometry.globPrims(' '.join([str(value) for value in prim_list]))
+
+
+#-----------------------------------------------------------------------------
+# Name: _globVertices
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the vertices belong to.
+#     prim_list : (list|tuple)
+#         A list of integers representing primitive numbers.
+#     index_list : (list|tuple)
+#         A list of integers representing vertex indices in the primitives.
+#
+# Returns: tuple
+#              A tuple of hou.Vertex objects.
+#
+# Raises: N/A
+#
+# Desc: Glob vertices using a '{prim}v{idx}' pattern for each vertex.
+#-----------------------------------------------------------------------------
+def _globVertices(geometry, prim_list, index_list):
+    return geometry.globVertices(
+        ' '.join(
+            ["{0}v{1}".format(prim_num, idx)
+             for prim_num, idx in zip(prim_list, index_list)]
+        )
+    )
+
+
+#-----------------------------------------------------------------------------
+# Name: _vertexKeys
+#
+# Args:
+#     vertices : (tuple)
+#         A tuple of hou.Vertex objects.
+#
+# Returns: list
+#              A list of (prim number, vertex number) tuples.
+#
+# Raises: N/A
+#
+# Desc: Convert vertices to values that can be compared.
+#-----------------------------------------------------------------------------
+def _vertexKeys(vertices):
+    return [(vertex.prim().number(), vertex.number()) for vertex in vertices]
+
+
+#-----------------------------------------------------------------------------
+# Name: benchmarkElementConstruction
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry to build elements from.
+#
+# Returns: N/A
+#
+# Raises: N/A
+#
+# Desc: Time building points, primitives and vertices from index lists
+#       against globbing one pattern per element, and check both give the
+#       same elements in the same order.
+#-----------------------------------------------------------------------------
+def benchmarkElementConstruction(geometry):
+    num_points = len(geometry.iterPoints())
+    num_prims = len(geometry.iterPrims())
+
+    shuffled_points = range(num_points)
+    random.shuffle(shuffled_points)
+
+    point_cases = (
+        ("contiguous", range(num_points)),
+        ("every other", range(0, num_points, 2)),
+        ("shuffled", shuffled_points),
+    )
+
+    for label, point_list in point_cases:
+        old = _timeCall(_globPoints, geometry, point_list)
+        new = _timeCall(inline._getPointsFromList, geometry, point_list)
+
+        print "points, {0}: glob {1:.4f}s, ranges {2:.4f}s ({3:.1f}x)".format(
+            label,
+            old,
+            new,
+            old / max(new, 1e-9)
+        )
+
+        _check(
+            [point.number() for point in
+             inline._getPointsFromList(geometry, point_list)] ==
+            [point.number() for point in _globPoints(geometry, point_list)],
+            "points from a {0} list match globbing".format(label)
+        )
+
+    prim_list = range(num_prims)
+
+    old = _timeCall(_globPrims, geometry, prim_list)
+    new = _timeCall(inline._getPrimsFromList, geometry, prim_list)
+
+    print "prims: glob {0:.4f}s, ranges {1:.4f}s ({2:.1f}x)".format(
+        old,
+        new,
+        old / max(new, 1e-9)
+    )
+
+    _check(
+        [prim.number() for prim in
+         inline._getPrimsFromList(geometry, prim_list)] == prim_list,
+        "prims from a contiguous list match globbing"
+    )
+
+    # Every vertex of every primitive.
+    prims = []
+    indices = []
+
+    for prim in geometry.iterPrims():
+        for idx in range(prim.numVertices()):
+            prims.append(prim.number())
+            indices.append(idx)
+
+    old = _timeCall(_globVertices, geometry, prims, indices)
+    new = _timeCall(inline._getVerticesFromList, geometry, prims, indices)
+
+    print "vertices: glob {0:.4f}s, direct {1:.4f}s ({2:.1f}x)".format(
+        old,
+        new,
+        old / max(new, 1e-9)
+    )
+
+    _check(
+        _vertexKeys(inline._getVerticesFromList(geometry, prims, indices)) ==
+        _vertexKeys(_globVertices(geometry, prims, indices)),
+        "vertices from lists match globbing"
+    )
+
+    # The vertices referencing a point in the middle of the grid.
+    point = geometry.iterPoints()[num_points / 2]
+    all_prims = geometry.iterPrims()
+
+    expected = sorted(
+        [(prim_num, idx) for prim_num, idx in zip(prims, indices)
+         if all_prims[prim_num].vertex(idx).point() == point]
+    )
+
+    _check(
+        sorted(_vertexKeys(point.referencingVertices())) == expected,
+        "referencingVertices matches the primitives' vertices"
+    )
+
+
+#-----------------------------------------------------------------------------
+# Name: checkPrimAdjacency
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry to check.
+#
+# Returns: N/A
+#
+# Raises: N/A
+#
+# Desc: Check the compressed sparse row adjacency arrays against adjacency
+#       found from the points and edges of each primitive.
+#-----------------------------------------------------------------------------
+def checkPrimAdjacency(geometry):
+    prim_points = []
+    prim_edges = []
+
+    for prim in geometry.iterPrims():
+        numbers = [vertex.point().number() for vertex in prim.vertices()]
+
+        prim_points.append(set(numbers))
+        prim_edges.append(
+            set(
+                [tuple(sorted((numbers[i], numbers[i - 1])))
+                 for i in range(len(numbers))]
+            )
+        )
+
+    for kind, elements in (("point", prim_points), ("edge", prim_edges)):
+        offsets, neighbors = geometry.primAdjacency(kind)
+
+        _check(
+            len(offsets) == len(elements) + 1 and
+            offsets[-1] == len(neighbors),
+            "{0} adjacency offsets cover the neighbors".format(kind)
+        )
+
+        valid = True
+
+        for i, shared in enumerate(elements):
+            expected = set(
+                [j for j, other in enumerate(elements)
+                 if j != i and shared & other]
+            )
+
+            found = neighbors[offsets[i]:offsets[i + 1]]
+
+            if len(found) != len(set(found)) or set(found) != expected:
+                valid = False
+                break
+
+        _check(valid, "{0} adjacency matches shared elements".format(kind))
+
+
+#-----------------------------------------------------------------------------
+# Name: checkSortPermutations
+#
+# Args:
+#     rows : (int)
+#         The number of rows of points.
+#     columns : (int)
+#         The number of columns of points.
+#
+# Returns: N/A
+#
+# Raises: N/A
+#
+# Desc: Check the permutations returned by the sort functions describe the
+#       new order of the elements, and that applying them to other geometry
+#       reproduces the sort.
+#-----------------------------------------------------------------------------
+def checkSortPermutations(rows, columns):
+    geometry = _createGrid(rows, columns)
+
+    # Record the number of each point before sorting.
+    attrib = geometry.addAttrib(hou.attribType.Point, "original", 0)
+
+    for point in geometry.iterPoints():
+        point.setAttribValue(attrib, point.number())
+
+    values = [random.random() for _ in range(len(geometry.iterPoints()))]
+
+    other = geometry.freeze()
+
+    permutation = geometry.sortByValues(
+        hou.geometryType.Points,
+        values,
+        return_permutation=True
+    )
+
+    points = geometry.iterPoints()
+
+    _check(
+        all(
+            [points[new].attribValue(attrib) == old
+             for old, new in enumerate(permutation)]
+        ),
+        "sortByValues permutation maps old numbers to new numbers"
+    )
+
+    _check(
+        sorted(values) == [values[point.attribValue(attrib)]
+                           for point in points],
+        "sortByValues orders the points by value"
+    )
+
+    other.applyPermutation(hou.geometryType.Points, permutation)
+
+    _check(
+        [point.attribValue("original") for point in other.iterPoints()] ==
+        [point.attribValue(attrib) for point in points],
+        "applyPermutation reproduces the sort"
+    )
+
+    # Expressions that are evaluated natively, and the Python equivalent.
+    expressions = (
+        ("-$TY", lambda pos, num: -pos[1]),
+        ("$TX+$TZ", lambda pos, num: pos[0] + pos[2]),
+        ("($TX-1)*2 + $PT%3", lambda pos, num: (pos[0] - 1) * 2 + num % 3),
+    )
+
+    for expression, evaluate in expressions:
+        keys = [evaluate(point.position(), point.number())
+                for point in geometry.iterPoints()]
+
+        geometry.sortByExpression(hou.geometryType.Points, expression)
+
+        result = [
+            keys[point.attribValue(attrib)] for point in geometry.iterPoints()
+        ]
+
+        # Sorting is done in double precision so allow a small difference.
+        _check(
+            all([b - a > -1e-6 for a, b in zip(result, result[1:])]),
+            "sortByExpression orders the points by '{0}'".format(expression)
+        )
+
+        # Renumber the original points to the current order.
+        for point in geometry.iterPoints():
+            point.setAttribValue(attrib, point.number())
+
+
+#-----------------------------------------------------------------------------
+# Name: checkGroups
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry to create groups on.
+#
+# Returns: N/A
+#
+# Raises: N/A
+#
+# Desc: Check group expressions and packed group bits against sets of point
+#       numbers.
+#-----------------------------------------------------------------------------
+def checkGroups(geometry):
+    points = geometry.iterPoints()
+    numbers = range(len(points))
+
+    members = {}
+
+    for name in ("a", "b", "c"):
+        members[name] = set(random.sample(numbers, len(numbers) / 2))
+
+        group = geometry.createPointGroup(name)
+        group.add([points[i] for i in sorted(members[name])])
+
+    # Expressions and the equivalent set operations.
+    expressions = (
+        ("a | b", members["a"] | members["b"]),
+        ("a & ~b", members["a"] - members["b"]),
+        ("(a | b) & ~c ^ a", ((members["a"] | members["b"]) -
+                              members["c"]) ^ members["a"]),
+    )
+
+    for expression, expected in expressions:
+        group = geometry.evalGroupExpression(expression, "result")
+
+        _check(
+            set([point.number() for point in group.points()]) == expected,
+            "evalGroupExpression evaluates '{0}'".format(expression)
+        )
+
+    group = geometry.findPointGroup("a")
+
+    bits = group.membershipBits()
+
+    # Pack the bits with the first element of each byte in the lowest bit.
+    expected = bytearray((len(numbers) + 7) / 8)
+
+    for i in members["a"]:
+        expected[i / 8] |= 1 << (i % 8)
+
+    _check(bytearray(bits) == expected, "membershipBits packs the members")
+
+    copy = geometry.createGroupFromBits(
+        "unpacked",
+        hou.geometryType.Points,
+        bits
+    )
+
+    _check(
+        set([point.number() for point in copy.points()]) == members["a"],
+        "createGroupFromBits unpacks the members"
+    )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else rows
+
+    # Use the same random values each run.
+    random.seed(0)
+
+    geometry = _createGrid(rows, columns)
+
+    try:
+        benchmarkElementConstruction(geometry)
+        checkPrimAdjacency(_createGrid(min(rows, 30), min(columns, 30)))
+        checkSortPermutations(min(rows, 50), min(columns, 50))
+        checkGroups(geometry)
+
+    except AssertionError as inst:
+        print "FAILED: {0}".format(inst)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,64 @@ and modules they are meant to extend.
 __author__ = "Graham Thompson"
 __email__ = "captainhammy@gmail.com"
 
+# Python Imports
+import collections
+
 # Houdini Imports
 import hou
 import inlinecpp
 
+# The maximum number of group bounding boxes to cache.
+_GROUP_BOUNDS_CACHE_SIZE = 256
+
+# Cached group bounding boxes, ordered from least to most recently used.
+_GROUP_BOUNDS_CACHE = collections.OrderedDict()
+
+# The kinds of numbers represented by struct style type codes.  Buffers are
+# only shared with ctypes arrays of the same kind and size.
+_TYPECODE_KINDS = dict(
+    [(code, "int") for code in "bhilq"] +
+    [(code, "uint") for code in "BHILQ"] +
+    [(code, "float") for code in "fd"]
+)
+
+# The largest value of a signed 64 bit integer.
+_INT64_MAX = 2 ** 63 - 1
+
+# Component suffixes that can be used to refer to part of an attribute.
+_COMPONENT_SUFFIXES = {
+    "x": 0,
+    "y": 1,
+    "z": 2,
+    "w": 3,
+    "r": 0,
+    "g": 1,
+    "b": 2,
+    "a": 3,
+    "u": 0,
+    "v": 1,
+}
+
+# Standard local variables that map directly to a component of an attribute.
+_LOCAL_VARIABLE_ATTRIBS = {
+    "TX": ("P", 0),
+    "TY": ("P", 1),
+    "TZ": ("P", 2),
+    "NX": ("N", 0),
+    "NY": ("N", 1),
+    "NZ": ("N", 2),
+    "CR": ("Cd", 0),
+    "CG": ("Cd", 1),
+    "CB": ("Cd", 2),
+    "CA": ("Alpha", 0),
+    "VX": ("v", 0),
+    "VY": ("v", 1),
+    "VZ": ("v", 2),
+    "MAPU": ("uv", 0),
+    "MAPV": ("uv", 1),
+    "MAPW": ("uv", 2),
+}
+
 def addToModule(module):
     """This function decorator adds the function to a specified module.
 
@@ -123,6 +177,126 @@ def _buildCFloatArray(values):
     return arr
 
 
+#-----------------------------------------------------------------------------
+# Name: _createCIntArray
+#
+# Args:
+#     count : (int)
+#         The number of elements in the array.
+#
+# Returns: c_int_Array
+#              A ctypes int array.
+#
+# Raises: N/A
+#
+# Desc: Create a zero initialized ctypes int array for a C++ function to
+#       fill.  ctypes arrays support the buffer protocol so they can be
+#       viewed with numpy.frombuffer() without copying.
+#-----------------------------------------------------------------------------
+def _createCIntArray(count):
+    import ctypes
+    return (ctypes.c_int * count)()
+
+
+#-----------------------------------------------------------------------------
+# Name: _truncateCArray
+#
+# Args:
+#     arr : (ctypes.Array)
+#         A ctypes array.
+#     count : (int)
+#         The number of elements to keep.
+#
+# Returns: ctypes.Array
+#              A view of the first 'count' elements of the array.
+#
+# Raises: N/A
+#
+# Desc: Get a view of the start of an array that was sized to an upper
+#       bound.  The view shares memory with the original array so no values
+#       are copied.
+#-----------------------------------------------------------------------------
+def _truncateCArray(arr, count):
+    return (arr._type_ * count).from_buffer(arr)
+
+
+#-----------------------------------------------------------------------------
+# Name: _getBufferTypecode
+#
+# Args:
+#     values : (list|tuple|buffer)
+#         A sequence of numbers.
+#
+# Returns: str|None
+#              The struct style type code of the elements if the values are
+#              a ctypes array, array.array or numpy array of numbers,
+#              otherwise None.
+#
+# Raises: N/A
+#
+# Desc: Find the type of the numbers stored in a buffer.
+#-----------------------------------------------------------------------------
+def _getBufferTypecode(values):
+    import ctypes
+
+    if isinstance(values, ctypes.Array):
+        typecode = values._type_._type_
+    else:
+        typecode = getattr(values, "typecode", None)
+
+        if typecode is None:
+            typecode = getattr(getattr(values, "dtype", None), "char", None)
+
+    if typecode not in _TYPECODE_KINDS:
+        return None
+
+    return typecode
+
+
+#-----------------------------------------------------------------------------
+# Name: _getCArray
+#
+# Args:
+#     values : (list|tuple|buffer)
+#         A sequence of numbers.
+#     ctype : (ctypes type)
+#         The ctypes element type of the array.
+#
+# Returns: ctypes.Array
+#              A ctypes array of the values.
+#
+# Raises: N/A
+#
+# Desc: Convert a sequence of numbers to a ctypes array.  If the values are
+#       a writable ctypes array, array.array or numpy array whose elements
+#       already match the ctypes type the array shares their memory instead
+#       of copying the values.
+#-----------------------------------------------------------------------------
+def _getCArray(values, ctype):
+    import ctypes
+    import struct
+
+    typecode = _getBufferTypecode(values)
+
+    if typecode is not None:
+        # Only share memory if the element kind and size are the same.
+        same_kind = _TYPECODE_KINDS[typecode] == _TYPECODE_KINDS[ctype._type_]
+        same_size = struct.calcsize(typecode) == ctypes.sizeof(ctype)
+
+        if same_kind and same_size:
+            try:
+                return (ctype * len(values)).from_buffer(values)
+
+            # The buffer is read only or not contiguous.
+            except (TypeError, ValueError):
+                pass
+
+    arr = (ctype * len(values))()
+    arr[:] = values
+
+    return arr
+
+
 #-----------------------------------------------------------------------------
 # Name: _buildBoundingBox
 #
@@ -149,6 +323,45 @@ def _buildBoundingBox(bounds):
     )
 
 
+#-----------------------------------------------------------------------------
+# Name: _buildRangePattern
+#
+# Args:
+#     values : (list|tuple)
+#         A list of integers.
+#
+# Returns: str
+#              A space separated string of numbers and ranges.
+#
+# Raises: N/A
+#
+# Desc: Convert a list of integers to a range pattern.  Runs of consecutive
+#       increasing numbers are compressed into 'start-end' ranges so the
+#       pattern stays short when the values are mostly contiguous.  The order
+#       of the values is preserved.
+#-----------------------------------------------------------------------------
+def _buildRangePattern(values):
+    ranges = []
+
+    start = end = values[0]
+
+    for value in values[1:]:
+        # The value continues the current run.
+        if value == end + 1:
+            end = value
+            continue
+
+        ranges.append((start, end))
+        start = end = value
+
+    ranges.append((start, end))
+
+    return ' '.join(
+        [str(start) if start == end else "{0}-{1}".format(start, end)
+         for start, end in ranges]
+    )
+
+
 #-----------------------------------------------------------------------------
 # Name: _getPointsFromList
 #
@@ -170,8 +383,8 @@ def _getPointsFromList(geometry, point_list):
     if not point_list:
         return ()
 
-    # Convert the list of integers to a space separated string.
-    point_str = ' '.join([str(i) for i in point_list])
+    # Convert the list of integers to a compressed range pattern.
+    point_str = _buildRangePattern(point_list)
 
     # Glob for the specified points.
     return geometry.globPoints(point_str)
@@ -198,3523 +411,9423 @@ def _getPrimsFromList(geometry, prim_list):
     if not prim_list:
         return ()
 
-    # Convert the list of integers to a space separated string.
-    prim_str = ' '.join([str(i) for i in prim_list])
+    # Convert the list of integers to a compressed range pattern.
+    prim_str = _buildRangePattern(prim_list)
 
     # Glob for the specified prims.
     return geometry.globPrims(prim_str)
 
 
 #-----------------------------------------------------------------------------
-# Name: _getNodesFromPaths
+# Name: _getVerticesFromList
 #
 # Args:
-#     paths : (list|tuple)
-#         A list of strings node paths.
+#     geometry : (hou.Geometry)
+#         The geometry the vertices belongs to.
+#     prim_list : (list|tuple)
+#         A list of integers representing primitive numbers.
+#     index_list : (list|tuple)
+#         A list of integers representing vertex indices in the primitives.
 #
 # Returns: tuple
-#              A tuple of hou.Node objects.
+#              A tuple of hou.Vertex objects.
 #
 # Raises: N/A
 #
-# Desc: Convert a list of string paths to hou.Node objects.
+# Desc: Convert lists of primitive numbers and vertex indices to hou.Vertex
+#       objects directly from the primitives instead of globbing.
 #-----------------------------------------------------------------------------
-def _getNodesFromPaths(paths):
-    return tuple([hou.node(path) for path in paths if path])
+def _getVerticesFromList(geometry, prim_list, index_list):
+    prims = geometry.iterPrims()
+
+    return tuple(
+        [prims[prim_num].vertex(idx)
+         for prim_num, idx in zip(prim_list, index_list)]
+    )
 
 
 #-----------------------------------------------------------------------------
-# Name: _getTimeFromOpInfo
+# Name: _getElementRangeArgs
 #
 # Args:
-#     node : (hou.Node)
-#         A Houdini node.
-#     prefix : (str)
-#         An opinfo line prefix containing a date and time.
+#     group : (hou.PointGroup|hou.PrimGroup|None)
+#         An optional group to restrict the elements to.
+#     index_range : (tuple|None)
+#         An optional (start, end) range of element numbers to restrict the
+#         elements to.  The end number is not included.
+#     group_class : (type)
+#         The type of group expected, either hou.PointGroup or hou.PrimGroup.
 #
-# Returns: datetime.datetime|None
-#              The datetime matching the opinfo line, if it exists, otherwise
-#              None.
+# Returns: tuple
+#              A tuple of the group name and the start and end numbers.
+#
+# Raises:
+#     TypeError
+#         This exception is raised if the group is not of the expected type.
+#     ValueError
+#         This exception is raised if the index range is invalid.
+#
+# Desc: Convert an optional group and index range into the arguments used by
+#       the C++ functions to build a range of elements.  An empty group name
+#       and an end of -1 mean the elements are not restricted.
+#-----------------------------------------------------------------------------
+def _getElementRangeArgs(group, index_range, group_class):
+    # If the group is valid, use that group's name.
+    if group is not None:
+        if not isinstance(group, group_class):
+            raise TypeError(
+                "Got '{0}', expected 'hou.{1}'.".format(
+                    type(group).__name__,
+                    group_class.__name__
+                )
+            )
+
+        group_name = group.name()
+    # If not, pass an empty string to signify no group.
+    else:
+        group_name = ""
+
+    if index_range is None:
+        return group_name, 0, -1
+
+    start, end = index_range
+
+    if start < 0 or end < start:
+        raise ValueError("Invalid index range: {0}".format(index_range))
+
+    return group_name, start, end
+
+
+#-----------------------------------------------------------------------------
+# Name: _getVariableAttrib
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the variable will be evaluated on.
+#     geometry_type : (hou.geometryType)
+#         The type of geometry elements the variable is for.
+#     variable : (str)
+#         A local variable name, without the leading '$'.
+#
+# Returns: tuple|None
+#              A tuple of the attribute and component the variable refers
+#              to, if there is one, otherwise None.
 #
 # Raises: N/A
 #
-# Desc: Extract a datetime.datetime from the opinfo of a node.
+# Desc: Find the attribute component a local variable like 'TY' or 'CR'
+#       evaluates to.  Variables defined in the varmap are supported if they
+#       are for single component attributes.
 #-----------------------------------------------------------------------------
-def _getTimeFromOpInfo(node, prefix):
-    import datetime
+def _getVariableAttrib(geometry, geometry_type, variable):
+    if geometry_type == hou.geometryType.Points:
+        find_attrib = geometry.findPointAttrib
 
-    # Get the operator info and split info rows.
-    info = hou.hscript("opinfo -n {0}".format(node.path()))[0].split('\n')
+    else:
+        find_attrib = geometry.findPrimAttrib
 
-    # Check each row.
-    for row in info:
-        #  If the row doesn't start with our prefix, ignore it.
-        if not row.startswith(prefix):
-            continue
+    # The variable is one of the standard local variables.
+    if variable in _LOCAL_VARIABLE_ATTRIBS:
+        attrib_name, component = _LOCAL_VARIABLE_ATTRIBS[variable]
 
-        # Strip the prefix and any leading whitespace.
-        time_str = row[len(prefix):].strip()
+        attrib = find_attrib(attrib_name)
 
-        # Construct a datetime object.
-        return datetime.datetime.strptime(time_str, "%d %b %Y %I:%M %p")
+        if attrib is not None and component < attrib.size():
+            return attrib, component
 
-    return None
+        return None
 
+    varmap_dict = geometry.varmap()
 
-_cpp_methods = inlinecpp.createLibrary(
-    "cpp_methods",
-    acquire_hom_lock=True,
-    catch_crashes=True,
-    includes="""
-#include <GA/GA_AttributeRefMap.h>
-#include <GEO/GEO_Face.h>
-#include <GQ/GQ_Detail.h>
-#include <GU/GU_Detail.h>
-#include <OP/OP_Director.h>
-#include <OP/OP_Node.h>
-#include <OP/OP_OTLManager.h>
-#include <PRM/PRM_Parm.h>
-#include <UT/UT_WorkArgs.h>
-""",
-    structs=[
-        ("IntArray", "*i"),
-        ("StringArray", "**c"),
-        ("StringTuple", "*StringArray"),
-        ("VertexMap", (("prims", "*i"), ("indices", "*i"))),
-        ("Position3D", (("x", "d"), ("y", "d"), ("z", "d"))),
-        ("BoundingBox", (
-            ("xmin", "d"),
-            ("ymin", "d"),
-            ("zmin", "d"),
-            ("xmax", "d"),
-            ("ymax", "d"),
-            ("zmax", "d")
-            )
-        ),
-    ],
-    function_sources=[
-"""
-int
-addNumToRange(int num, int sec, void *data)
-{
-    std::vector<int>            *values;
+    # There are no other variables defined.
+    if varmap_dict is None:
+        return None
 
-    // Get the passed in vector.
-    values = (std::vector<int> *)data;
+    # Look for an attribute mapped to the variable.
+    for attrib_name, var in varmap_dict.iteritems():
+        if var != variable:
+            continue
 
-    // Add the number to it.
-    values->push_back(num);
+        attrib = find_attrib(attrib_name)
 
-    // Return 1 to keep going.
-    return 1;
-}
-""",
+        if attrib is not None and attrib.size() == 1:
+            return attrib, 0
 
-"""
-IntArray
-expandRange(const char *pattern)
-{
-    std::vector<int>            values;
+    return None
 
-    UT_String                   range;
-    UT_WorkArgs                 tokens;
 
-    range = pattern;
+#-----------------------------------------------------------------------------
+# Name: _getExpressionAttrib
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the expression will be evaluated on.
+#     geometry_type : (hou.geometryType)
+#         The type of geometry elements the expression is for.
+#     expression : (str)
+#         An expression to evaluate for each point or primitive.
+#
+# Returns: tuple|None
+#              A tuple of the attribute and component the expression refers
+#              to, if it is a single local variable, otherwise None.
+#
+# Raises: N/A
+#
+# Desc: Find the attribute component a simple variable expression like
+#       '$TY' or '$CR' evaluates to.
+#-----------------------------------------------------------------------------
+def _getExpressionAttrib(geometry, geometry_type, expression):
+    import re
 
-    // Tokenize the pattern to split out the groups of ranges.
-    range.tokenize(tokens, ' ');
+    match = re.match(r"^\s*\$\{?([A-Za-z_]\w*)\}?\s*$", expression)
 
-    for (int i=0; i<tokens.getArgc(); ++i)
-    {
-        // Get the current range.
-        UT_String tmp = tokens[i];
+    if match is None:
+        return None
 
-        // Add all the values in the range to the list.
-        tmp.traversePattern(-1, &values, addNumToRange);
-    }
+    return _getVariableAttrib(geometry, geometry_type, match.group(1))
 
-    return values;
-}
-""",
 
-"""
-void
-sortAlongAxis(GU_Detail *gdp, int mode, int axis)
-{
-    // Sort primitives.
-    if (mode)
-    {
-        gdp->sortPrimitiveList(axis);
+#-----------------------------------------------------------------------------
+# Name: _parseAttribExpression
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the expression will be evaluated on.
+#     geometry_type : (hou.geometryType)
+#         The type of geometry elements the expression is for.
+#     expression : (str)
+#         An expression to evaluate for each point or primitive.
+#
+# Returns: tuple|None
+#              A tuple of the list of (attribute name, component) pairs, the
+#              list of constants and the list of program codes, if the
+#              expression can be evaluated natively, otherwise None.
+#
+# Raises: N/A
+#
+# Desc: Convert an arithmetic expression of numbers, local variables that
+#       map to numeric attributes and the element number ('$PT' or '$PR')
+#       into a program in reverse polish notation for the C++ evaluator.
+#       The operators are '+', '-', '*', '/', '%', '^' and unary '-', with
+#       parentheses for grouping.  Non-negative codes are indices into the
+#       attributes followed by the constants and negative codes are the
+#       operators and the element number.  Any other expression returns None
+#       so it can be evaluated by hscript.
+#-----------------------------------------------------------------------------
+def _parseAttribExpression(geometry, geometry_type, expression):
+    import re
+
+    codes = {
+        "neg": -1, "+": -2, "-": -3, "*": -4, "/": -5, "%": -6, "^": -7
     }
-    // Sort points.
-    else
-    {
-        gdp->sortPointList(axis);
+    precedence = {
+        "+": 1, "-": 1, "*": 2, "/": 2, "%": 2, "neg": 3, "^": 4
     }
-}
-""",
 
-"""
-void
-sortByValues(GU_Detail *gdp, int mode, float *values)
-{
-    // Sort primitives.
-    if (mode)
-    {
-        gdp->sortPrimitiveList(values);
-    }
-    // Sort points.
-    else
-    {
-        gdp->sortPointList(values);
-    }
-}
-""",
+    number_pattern = r"(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
 
-"""
-void
-sortListRandomly(GU_Detail *gdp, int mode, float seed)
-{
-    // Sort primitives.
-    if (mode)
-    {
-        gdp->sortPrimitiveList(seed);
-    }
-    // Sort points.
-    else
-    {
-        gdp->sortPointList(seed);
-    }
-}
-""",
+    if geometry_type == hou.geometryType.Points:
+        number_variable = "PT"
 
-"""
-void
-shiftList(GU_Detail *gdp, int mode, int offset)
-{
-    // Sort primitives.
-    if (mode)
-    {
-        gdp->shiftPrimitiveList(offset);
-    }
-    // Sort points.
-    else
-    {
-        gdp->shiftPointList(offset);
-    }
-}
-""",
+    else:
+        number_variable = "PR"
 
-"""
-void
-reverseList(GU_Detail *gdp, int mode)
-{
-    // Sort primitives.
-    if (mode)
-    {
-        gdp->reversePrimitiveList();
-    }
-    // Sort points.
-    else
-    {
-        gdp->reversePointList();
-    }
-}
-""",
+    attribs = []
+    constants = []
+    program = []
+    operators = []
 
-"""
-void
-proximityToList(GU_Detail *gdp, int mode, const UT_Vector3D *point)
-{
-    UT_Vector3                  pos(*point);
+    # Whether the next token should be a value, a unary '-' or '('.
+    expect_operand = True
 
-    // Sort primitives.
-    if (mode)
-    {
-        gdp->proximityToPrimitiveList(pos);
-    }
-    // Sort points.
-    else
-    {
-        gdp->proximityToPointList(pos);
-    }
-}
-""",
+    tokens = re.findall(
+        r"\$\{{?\w+\}}?|{0}|\S".format(number_pattern),
+        expression
+    )
 
-"""
-void
-sortByVertexOrder(GU_Detail *gdp)
-{
-    gdp->sortByVertexOrder();
-}
-""",
+    for token in tokens:
+        if expect_operand:
+            if token == "(":
+                operators.append(token)
 
-"""
-void
-setIcon(OP_Operator *op, const char *icon_name)
-{
-    op->setIconName(icon_name);
-}
-""",
+            elif token == "-":
+                operators.append("neg")
 
-"""
-void
-setDefaultIcon(OP_Operator *op)
-{
-    op->setDefaultIconName();
-}
-""",
+            # A unary '+' doesn't change the value.
+            elif token == "+":
+                continue
 
-"""
-bool
-isSubnetType(OP_Operator *op)
-{
-    return op->getIsPrimarySubnetType();
-}
-""",
+            elif token.startswith("$"):
+                variable = token.strip("${}")
 
-"""
-bool
-isPython(OP_Operator *op)
-{
-    return op->getScriptIsPython();
-}
-""",
+                if variable == number_variable:
+                    program.append(-8)
 
-"""
-int
-createPoint(GU_Detail *gdp, UT_Vector3D *position)
-{
-    GA_Offset                   ptOff;
+                else:
+                    result = _getVariableAttrib(
+                        geometry,
+                        geometry_type,
+                        variable
+                    )
 
-    // Add a new point.
-    ptOff = gdp->appendPointOffset();
+                    if result is None:
+                        return None
 
-    // Set the position for the point.
-    gdp->setPos3(ptOff, *position);
+                    attrib, component = result
 
-    // Return the point number.
-    return gdp->pointIndex(ptOff);
-}
-""",
+                    if attrib.dataType() not in (hou.attribData.Int,
+                                                 hou.attribData.Float):
+                        return None
 
-"""
-IntArray
-createPoints(GU_Detail *gdp, int count)
-{
-    std::vector<int>            point_nums;
+                    key = (attrib.name(), component)
 
-    GA_Offset                   ptOff;
+                    if key not in attribs:
+                        attribs.append(key)
 
-    for (int i=0; i < count; ++i)
-    {
-        ptOff = gdp->appendPointOffset();
-        point_nums.push_back(gdp->pointIndex(ptOff));
-    }
+                    program.append(attribs.index(key))
 
-    return point_nums;
-}
-""",
+                expect_operand = False
 
-"""
-void
-setVarmap(GU_Detail *gdp, const char **strings, int num_strings)
-{
-    GA_Attribute                *attrib;
-    GA_RWAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
+            elif re.match(number_pattern + "$", token):
+                # Constants are stored as placeholders until the
+                # number of attributes is known.
+                program.append(("constant", len(constants)))
+                constants.append(float(token))
 
-    UT_String                   value;
+                expect_operand = False
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_DETAIL, "varmap");
+            else:
+                return None
 
-    // If it doesn't exist, add it.
-    if (attrib_gah.isInvalid())
-    {
-        attrib_gah = gdp->createStringAttribute(GA_ATTRIB_DETAIL, "varmap");
-    }
+        elif token in ("+", "-", "*", "/", "%", "^"):
+            # Apply any operators with higher precedence, or equal precedence
+            # if the operator is left associative, first.
+            while operators and operators[-1] != "(" and (
+                    precedence[operators[-1]] > precedence[token] or
+                    (precedence[operators[-1]] == precedence[token] and
+                     token != "^")):
+                program.append(codes[operators.pop()])
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+            operators.append(token)
+            expect_operand = True
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
+        elif token == ")":
+            while operators and operators[-1] != "(":
+                program.append(codes[operators.pop()])
 
-    // Resize the tuple to our needed size.
-    s_t->setTupleSize(attrib, num_strings);
+            # Unbalanced parentheses.
+            if not operators:
+                return None
 
-    // Iterate over all the strings to assign.
-    for (int i=0; i < num_strings; ++i)
-    {
-        // Get the string.
-        value = strings[i];
-        // Add it to the tuple at this point.
-        s_t->setString(attrib, GA_Offset(0), value, i);
-    }
-}
-""",
+            operators.pop()
 
-"""
-void
-addVariableName(GU_Detail *gdp, const char *attrib_name, const char *var_name)
-{
-    gdp->addVariableName(attrib_name, var_name);
-}
-""",
+        else:
+            return None
 
-"""
-void
-removeVariableName(GU_Detail *gdp, const char *var_name)
-{
-    gdp->removeVariableName(var_name);
-}
-""",
+    if expect_operand:
+        return None
 
-"""
-bool
-renameAttribute(GU_Detail *gdp,
-                int attrib_type,
-                const char *from_name,
-                const char *to_name)
-{
-    GA_AttributeOwner           owner;
+    while operators:
+        operator = operators.pop()
 
-    // Convert the int value to the attribute owner type.
-    owner = static_cast<GA_AttributeOwner>(attrib_type);
+        # Unbalanced parentheses.
+        if operator == "(":
+            return None
 
-    // Rename the attribute.
-    return gdp->renameAttribute(owner, GA_SCOPE_PUBLIC, from_name, to_name);
-}
-""",
+        program.append(codes[operator])
 
-"""
-int
-findPrimitiveByName(const GU_Detail *gdp,
-                    const char *name_to_match,
-                    const char *name_attribute,
-                    int match_number)
-{
-    const GEO_Primitive         *prim;
+    # The constants follow the attributes.
+    program = [
+        len(attribs) + code[1] if isinstance(code, tuple) else code
+        for code in program
+    ]
 
-    // Try to find a primitive.
-    prim = gdp->findPrimitiveByName(name_to_match,
-                                    GEO_PrimTypeCompat::GEOPRIMALL,
-                                    name_attribute,
-                                    match_number);
+    return attribs, constants, program
 
-    // If one was found, return its number.
-    if (prim)
-    {
-        return prim->getNum();
-    }
 
-    // Return -1 to indicate that no prim was found.
-    return -1;
-}
-""",
+#-----------------------------------------------------------------------------
+# Name: _getSortKeyArgs
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry being sorted.
+#     geometry_type : (hou.geometryType)
+#         The type of geometry elements being sorted.
+#     keys : (list|tuple)
+#         A list of attribute names, hou.Attrib objects or value sequences.
+#     descending : (list|tuple|None)
+#         An optional list of bools for each key.
+#
+# Returns: tuple
+#              A tuple of the attribute names, components, packed values and
+#              descending flags for the C++ function.
+#
+# Raises:
+#     OperationFailed
+#         This exception is raised if an attribute or component is invalid,
+#         or a sequence of values is the wrong length.
+#     ValueError
+#         This exception is raised if the number of descending flags does not
+#         match the number of keys.
+#
+# Desc: Convert a list of sort keys into the arguments used by the C++ sort
+#       functions.  Attribute names can include a component, like 'P.y' or
+#       'P[1]'.  Keys that are sequences of values use an empty attribute
+#       name and have their values packed one after the other.
+#-----------------------------------------------------------------------------
+def _getSortKeyArgs(geometry, geometry_type, keys, descending):
+    import ctypes
+    import re
 
-"""
-IntArray
-findAllPrimitivesByName(const GU_Detail *gdp,
-                        const char *name_to_match,
-                        const char *name_attribute)
-{
-    std::vector<int>            prim_nums;
+    if descending is None:
+        descending = [False] * len(keys)
 
-    GEO_ConstPrimitivePtrArray  prims;
-    GEO_ConstPrimitivePtrArray::const_iterator prims_it;
+    if len(descending) != len(keys):
+        raise ValueError("Length of descending must equal the number of keys.")
 
-    // Try to find all the primitives given the name.
-    gdp->findAllPrimitivesByName(prims,
-                                 name_to_match,
-                                 GEO_PrimTypeCompat::GEOPRIMALL,
-                                 name_attribute);
+    if geometry_type == hou.geometryType.Points:
+        find_attrib = geometry.findPointAttrib
+        num_elements = len(geometry.iterPoints())
 
-    // Add any found prims to the array.
-    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
-    {
-        prim_nums.push_back((*prims_it)->getNum());
-    }
+    else:
+        find_attrib = geometry.findPrimAttrib
+        num_elements = len(geometry.iterPrims())
 
-    return prim_nums;
-}
-""",
+    attrib_names = []
+    components = []
+    value_keys = []
 
-"""
-void
-copyPointAttributeValues(GU_Detail *dest_gdp,
-                         int dest_pt,
-                         const GU_Detail *src_gdp,
-                         int src_pt,
-                         const char **attribute_names,
-                         int num_attribs)
-{
-    GA_Offset                   srcOff, destOff;
+    for key in keys:
+        if isinstance(key, hou.Attrib):
+            key = key.name()
 
-    GA_ROAttributeRef           src_gah;
-    GA_RWAttributeRef           dest_gah;
+        # Sequences of values for each element.
+        if not isinstance(key, basestring):
+            if len(key) != num_elements:
+                raise hou.OperationFailed(
+                    "Length of values must equal the number of elements."
+                )
 
-    const GA_Attribute          *attr;
+            attrib_names.append("")
+            components.append(0)
+            value_keys.append(key)
 
-    UT_String                   attr_name;
+            continue
 
-    // Build an attribute reference map between the geometry.
-    GA_AttributeRefMap hmap(*dest_gdp, src_gdp);
+        # Split the attribute name into the name and an optional component.
+        match = re.match(r"^(\w+?)(?:\.(\w)|\[(\d+)\])?$", key)
 
-    // Iterate over all the attribute names.
-    for (int i=0; i < num_attribs; ++i)
-    {
-        // Get the attribute name.
-        attr_name = attribute_names[i];
+        if match is None:
+            raise hou.OperationFailed("Invalid sort key: {0}".format(key))
 
-        // Get the attribute reference from the source geometry.
-        src_gah = src_gdp->findPointAttribute(attr_name);
-        if (src_gah.isValid())
-        {
-            // Get the actual attribute.
-            attr = src_gah.getAttribute();
+        attrib_name, suffix, index = match.groups()
 
-            // Try to find the same attribute on the destination geometry.
-            dest_gah = dest_gdp->findPointAttrib(*attr);
+        if suffix is not None:
+            if suffix not in _COMPONENT_SUFFIXES:
+                raise hou.OperationFailed(
+                    "Invalid component: {0}".format(key)
+                )
 
-            // If it doesn't exist, create it.
-            if (dest_gah.isInvalid())
-            {
-                dest_gah = dest_gdp->addPointAttrib(attr);
-            }
+            component = _COMPONENT_SUFFIXES[suffix]
 
-            // Add a mapping between the source and dest attributes.
-            hmap.append(dest_gah.getAttribute(), attr);
-        }
-    }
+        elif index is not None:
+            component = int(index)
 
-    // Get the point offsets.
-    srcOff = src_gdp->pointOffset(src_pt);
-    destOff = src_gdp->pointOffset(dest_pt);
+        else:
+            component = 0
 
-    // Copy the attribute value.
-    hmap.copyValue(GA_ATTRIB_POINT, destOff, GA_ATTRIB_POINT, srcOff);
-}
-""",
+        attrib = find_attrib(attrib_name)
 
-"""
-void
-copyPrimAttributeValues(GU_Detail *dest_gdp,
-                        int dest_pr,
-                        const GU_Detail *src_gdp,
-                        int src_pr,
-                        const char **attribute_names,
-                        int num_attribs)
-{
-    GA_Offset                   srcOff, destOff;
+        if attrib is None:
+            raise hou.OperationFailed(
+                "Invalid attribute: {0}".format(attrib_name)
+            )
 
-    GA_ROAttributeRef           src_gah;
-    GA_RWAttributeRef           dest_gah;
+        if component >= attrib.size():
+            raise hou.OperationFailed("Invalid component: {0}".format(key))
 
-    const GA_Attribute          *attr;
+        attrib_names.append(attrib_name)
+        components.append(component)
 
-    UT_String                   attr_name;
+    # Pack all the value sequences into a single array.
+    values = (ctypes.c_double * (num_elements * len(value_keys)))()
 
-    // Build an attribute reference map between the geometry.
-    GA_AttributeRefMap hmap(*dest_gdp, src_gdp);
+    for i, value_key in enumerate(value_keys):
+        values[i * num_elements:(i + 1) * num_elements] = value_key
 
-    // Iterate over all the attribute names.
-    for (int i=0; i < num_attribs; ++i)
-    {
-        // Get the attribute name.
-        attr_name = attribute_names[i];
+    return (
+        _buildCStringArray(attrib_names),
+        _getCArray(components, ctypes.c_int),
+        values,
+        _getCArray([int(bool(value)) for value in descending], ctypes.c_int),
+    )
 
-        // Get the attribute reference from the source geometry.
-        src_gah = src_gdp->findPrimitiveAttribute(attr_name);
-        if (src_gah.isValid())
-        {
-            // Get the actual attribute.
-            attr = src_gah.getAttribute();
 
-            // Try to find the same attribute on the destination geometry.
-            dest_gah = dest_gdp->findPrimAttrib(*attr);
+#-----------------------------------------------------------------------------
+# Name: _getElementOffsets
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry about to be sorted.
+#     mode : (int)
+#         Get point offsets (0) or primitive offsets (1).
+#
+# Returns: c_int_Array
+#              An array of the offset of each element.
+#
+# Raises: N/A
+#
+# Desc: Record the offsets of the points or primitives in their current
+#       order.  Offsets do not change when elements are sorted so they can
+#       be used to find the new number of each element.
+#-----------------------------------------------------------------------------
+def _getElementOffsets(geometry, mode):
+    if mode:
+        num_elements = len(geometry.iterPrims())
 
-            // If it doesn't exist, create it.
-            if (dest_gah.isInvalid())
-            {
-                dest_gah = dest_gdp->addPrimAttrib(attr);
-            }
+    else:
+        num_elements = len(geometry.iterPoints())
 
-            // Add a mapping between the source and dest attributes.
-            hmap.append(dest_gah.getAttribute(), attr);
-        }
-    }
+    offsets = _createCIntArray(num_elements)
 
-    // Get the primitive offsets.
-    srcOff = src_gdp->primitiveOffset(src_pr);
-    destOff = src_gdp->primitiveOffset(dest_pr);
+    _sort_methods.elementOffsets(geometry, mode, offsets)
 
-    // Copy the attribute value.
-    hmap.copyValue(GA_ATTRIB_PRIMITIVE,
-                   destOff,
-                   GA_ATTRIB_PRIMITIVE,
-                   srcOff);
-}
-""",
+    return offsets
 
-"""
-IntArray
-pointAdjacentPolygons(GU_Detail *gdp, int prim_num)
-{
-    std::vector<int>            prim_nums;
 
-    GA_Offset                   primOff;
-    GA_OffsetArray              prims;
-    GA_OffsetArray::const_iterator prims_it;
+#-----------------------------------------------------------------------------
+# Name: _getSortPermutation
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The sorted geometry.
+#     mode : (int)
+#         The offsets are point offsets (0) or primitive offsets (1).
+#     offsets : (c_int_Array)
+#         The element offsets recorded before the sort.
+#
+# Returns: c_int_Array
+#              An array of the new number of each element, indexed by its
+#              number before the sort.
+#
+# Raises: N/A
+#
+# Desc: Convert the offsets recorded before a sort into the permutation the
+#       sort applied.
+#-----------------------------------------------------------------------------
+def _getSortPermutation(geometry, mode, offsets):
+    permutation = _createCIntArray(len(offsets))
 
-    // Find the offset for this primitive.
-    primOff = gdp->primitiveOffset(prim_num);
+    _sort_methods.sortPermutation(
+        geometry,
+        mode,
+        offsets,
+        len(offsets),
+        permutation
+    )
 
-    // Get a list of point adjacent polygons.
-    gdp->getPointAdjacentPolygons(prims, primOff);
+    return permutation
 
-    // Add the adjacent prim numbers to the list.
-    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
-    {
-        prim_nums.push_back(gdp->primitiveIndex(*prims_it));
-    }
 
-    return prim_nums;
-}
-""",
+#-----------------------------------------------------------------------------
+# Name: _getIndexArgs
+#
+# Args:
+#     indices : (list|tuple|buffer|str)
+#         A sequence of element numbers or a string of element numbers and
+#         ranges like '0-10 15'.
+#
+# Returns: tuple
+#              A tuple of a ctypes int array of element numbers and a ctypes
+#              int array of first and last element number pairs.
+#
+# Raises:
+#     ValueError
+#         This exception is raised if the string is invalid.
+#
+# Desc: Convert element numbers into the arguments used by the C++
+#       functions.  Ranges in strings are passed as pairs so they do not
+#       need to be expanded in Python.
+#-----------------------------------------------------------------------------
+def _getIndexArgs(indices):
+    import ctypes
 
-"""
-IntArray
-edgeAdjacentPolygons(GU_Detail *gdp, int prim_num)
-{
-    std::vector<int>            prim_nums;
+    if not isinstance(indices, basestring):
+        return _getCArray(indices, ctypes.c_int), _createCIntArray(0)
 
-    GA_Offset                   primOff;
-    GA_OffsetArray              prims;
-    GA_OffsetArray::const_iterator prims_it;
+    ranges = []
 
-    // Find the offset for this primitive.
-    primOff = gdp->primitiveOffset(prim_num);
+    for entry in indices.split():
+        start, _, end = entry.partition('-')
 
-    // Get a list of edge adjacent polygons.
-    gdp->getEdgeAdjacentPolygons(prims, primOff);
+        try:
+            start = int(start)
+            end = int(end) if end else start
 
-    // Add the adjacent prim numbers to the list.
-    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
-    {
-        prim_nums.push_back(gdp->primitiveIndex(*prims_it));
-    }
+        except ValueError:
+            raise ValueError("Invalid range: {0}".format(entry))
 
-    return prim_nums;
-}
-""",
+        if end < start:
+            raise ValueError("Invalid range: {0}".format(entry))
 
-"""
-IntArray
-connectedPrims(const GU_Detail *gdp, int pt_num)
-{
-    std::vector<int>    prim_nums;
+        ranges.extend((start, end))
 
-    GA_Offset           ptOff;
-    GA_OffsetArray      prims;
-    GA_OffsetArray::const_iterator prims_it;
+    return _createCIntArray(0), _getCArray(ranges, ctypes.c_int)
 
-    // Get the selected point offset.
-    ptOff = gdp->pointOffset(pt_num);
 
-    // Get all the primitives referencing this point.
-    gdp->getPrimitivesReferencingPoint(prims, ptOff);
+#-----------------------------------------------------------------------------
+# Name: _modifyGroupMembership
+#
+# Args:
+#     group : (hou.PointGroup|hou.PrimGroup)
+#         The group to modify.
+#     operation : (int)
+#         Add (0), remove (1) or toggle (2) the elements.
+#     indices : (list|tuple|buffer|str)
+#         A sequence of element numbers or a string of element numbers and
+#         ranges like '0-10 15'.
+#
+# Returns: N/A
+#
+# Raises:
+#     ValueError
+#         This exception is raised if the string is invalid.
+#     hou.OperationFailed
+#         This exception is raised if an element number is invalid.
+#
+# Desc: Change the membership of many elements of a group in a single call.
+#-----------------------------------------------------------------------------
+def _modifyGroupMembership(group, operation, indices):
+    group_type = int(isinstance(group, hou.PrimGroup))
+
+    index_arr, range_arr = _getIndexArgs(indices)
+
+    result = _group_methods.modifyMembership(
+        group.geometry(),
+        group.name(),
+        group_type,
+        operation,
+        index_arr,
+        len(index_arr),
+        range_arr,
+        len(range_arr) / 2
+    )
 
-    // Add all the primitive numbers to the list.
-    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
-    {
-        prim_nums.push_back(gdp->primitiveIndex(*prims_it));
-    }
+    if result == 1:
+        raise hou.OperationFailed("Invalid group.")
 
-    return prim_nums;
-}
-""",
+    elif result == 2:
+        raise hou.OperationFailed("Invalid element number.")
 
-"""
-IntArray
-connectedPoints(const GU_Detail *gdp, int pt_num)
-{
-    std::vector<int>            pt_nums;
 
-    GA_Offset                   ptOff;
-    GA_OffsetArray              prims;
+#-----------------------------------------------------------------------------
+# Name: _parseGroupExpression
+#
+# Args:
+#     expression : (str)
+#         A boolean expression of group names.
+#
+# Returns: tuple
+#              A tuple of the list of group names and the list of program
+#              codes.
+#
+# Raises:
+#     ValueError
+#         This exception is raised if the expression is invalid.
+#
+# Desc: Convert a group expression into a program in reverse polish notation
+#       for the C++ evaluator.  Non-negative codes are indices into the list
+#       of group names and negative codes are the operators.  Operators have
+#       the same precedence as in C: '~' then '&', '^' and '|'.
+#-----------------------------------------------------------------------------
+def _parseGroupExpression(expression):
+    import re
 
-    GA_Range                    pt_range;
+    codes = {"~": -1, "&": -2, "|": -3, "^": -4}
+    precedence = {"~": 4, "&": 3, "^": 2, "|": 1}
 
-    const GEO_Primitive         *prim;
+    names = []
+    program = []
+    operators = []
 
-    // The list of primitives in the geometry.
-    const GA_PrimitiveList &prim_list = gdp->getPrimitiveList();
+    # Whether the next token should be a group, '~' or '('.
+    expect_operand = True
 
-    ptOff = gdp->pointOffset(pt_num);
+    for token in re.findall(r"\w+|\S", expression):
+        if expect_operand:
+            if token in ("~", "("):
+                operators.append(token)
 
-    // Get the primitives referencing the point.
-    gdp->getPrimitivesReferencingPoint(prims, ptOff);
+            elif re.match(r"\w+$", token):
+                if token not in names:
+                    names.append(token)
 
-    // Build a range for those primitives.
-    GA_Range pr_range(gdp->getPrimitiveMap(), prims);
+                program.append(names.index(token))
+                expect_operand = False
 
-    for (GA_Iterator pr_it(pr_range.begin()); !pr_it.atEnd(); ++pr_it)
-    {
-        prim = (GEO_Primitive *)prim_list.get(*pr_it);
+            else:
+                raise ValueError("Invalid group expression: {0}".format(
+                    expression
+                ))
 
-        // Get the points referenced by the vertices of the primitive.
-        pt_range = prim->getPointRange();
+        elif token in ("&", "|", "^"):
+            # Apply any operators with equal or higher precedence first.
+            while operators and operators[-1] != "(" and \
+                    precedence[operators[-1]] >= precedence[token]:
+                program.append(codes[operators.pop()])
 
-        for (GA_Iterator pt_it(pt_range.begin()); !pt_it.atEnd(); ++pt_it)
-        {
-            // Build an edge between the source point and this point on the
-            // primitive.
-            GA_Edge edge(ptOff, *pt_it);
-            // If there is an edge between those 2 points, add the point
-            // to the list.
-            if (prim->hasEdge(edge))
-            {
-                pt_nums.push_back(gdp->pointIndex(*pt_it));
-            }
-        }
-    }
+            operators.append(token)
+            expect_operand = True
 
-    return pt_nums;
-}
-""",
+        elif token == ")":
+            while operators and operators[-1] != "(":
+                program.append(codes[operators.pop()])
 
-"""
-VertexMap
-referencingVertices(const GU_Detail *gdp, int pt_num)
-{
-    std::vector<int>            prim_indices, vert_indices;
+            if not operators:
+                raise ValueError("Unbalanced parentheses: {0}".format(
+                    expression
+                ))
 
-    GA_Index                    primIdx;
-    GA_Offset                   ptOff, primOff, vtxOff;
-    GA_OffsetArray              vertices;
+            operators.pop()
 
-    const GA_Primitive          *prim;
+        else:
+            raise ValueError("Invalid group expression: {0}".format(
+                expression
+            ))
 
-    GA_OffsetArray::const_iterator vert_it;
+    if expect_operand:
+        raise ValueError("Invalid group expression: {0}".format(expression))
 
-    ptOff = gdp->pointOffset(pt_num);
-    gdp->getVerticesReferencingPoint(vertices, ptOff);
+    while operators:
+        operator = operators.pop()
 
-    const GA_PrimitiveList &prim_list = gdp->getPrimitiveList();
+        if operator == "(":
+            raise ValueError("Unbalanced parentheses: {0}".format(
+                expression
+            ))
 
-    for (vert_it = vertices.begin(); !vert_it.atEnd(); ++vert_it)
-    {
-        vtxOff = *vert_it;
+        program.append(codes[operator])
 
-        primOff = gdp->vertexPrimitive(vtxOff);
-        primIdx = gdp->primitiveIndex(primOff);
-        prim = prim_list.get(primOff);
+    return names, program
 
-        for (unsigned i=0; i < prim->getVertexCount(); ++i)
-        {
-            if (prim->getVertexOffset(i) == vtxOff)
-            {
-                prim_indices.push_back(primIdx);
-                vert_indices.push_back(i);
-            }
-        }
-    }
 
-    VertexMap vert_map;
-    vert_map.prims.set(prim_indices);
-    vert_map.indices.set(vert_indices);
+#-----------------------------------------------------------------------------
+# Name: _getGroupOverlapCounts
+#
+# Args:
+#     geometry : (hou.Geometry)
+#         The geometry the groups belong to.
+#     groups : (list|tuple)
+#         A list of hou.PointGroup or hou.PrimGroup objects.
+#
+# Returns: ctypes.Array
+#              A flattened matrix of the number of elements shared by each
+#              pair of groups.
+#
+# Raises:
+#     hou.OperationFailed
+#         This exception is raised if the groups are not all point groups or
+#         all primitive groups, or a group does not exist.
+#
+# Desc: Count the overlaps of every pair of groups in a single native pass.
+#       The count for groups i and j is stored at i * len(groups) + j, and
+#       the diagonal holds the size of each group.
+#-----------------------------------------------------------------------------
+def _getGroupOverlapCounts(geometry, groups):
+    import ctypes
 
-    return vert_map;
-}
-""",
+    if all(isinstance(group, hou.PointGroup) for group in groups):
+        group_type = 0
 
-"""
-StringArray
-primStringAttribValues(const GU_Detail *gdp, const char *attrib_name)
-{
-    std::vector<std::string>    result;
+    elif all(isinstance(group, hou.PrimGroup) for group in groups):
+        group_type = 1
 
-    const GA_Attribute          *attrib;
-    GA_ROAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
+    else:
+        raise hou.OperationFailed(
+            "Groups must all be point groups or all be primitive groups."
+        )
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_PRIMITIVE, attrib_name);
+    counts = (ctypes.c_int64 * (len(groups) * len(groups)))()
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+    result = _group_methods.groupOverlapCounts(
+        geometry,
+        group_type,
+        _buildCStringArray([group.name() for group in groups]),
+        len(groups),
+        counts
+    )
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
+    if result == 1:
+        raise hou.OperationFailed("Invalid group.")
 
-    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
-    {
-        result.push_back(s_t->getString(attrib, *it, 0));
-    }
+    return counts
 
-    return result;
-}
-""",
 
-"""
-void
-setPrimStringAttribValues(GU_Detail *gdp,
-                          const char *attrib_name,
-                          const char **values,
-                          int num_values)
-{
-    GA_Attribute                *attrib;
-    GA_RWAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
+#-----------------------------------------------------------------------------
+# Name: _getNodesFromPaths
+#
+# Args:
+#     paths : (list|tuple)
+#         A list of strings node paths.
+#
+# Returns: tuple
+#              A tuple of hou.Node objects.
+#
+# Raises: N/A
+#
+# Desc: Convert a list of string paths to hou.Node objects.
+#-----------------------------------------------------------------------------
+def _getNodesFromPaths(paths):
+    return tuple([hou.node(path) for path in paths if path])
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_PRIMITIVE, attrib_name);
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+#-----------------------------------------------------------------------------
+# Name: _getTimeFromOpInfo
+#
+# Args:
+#     node : (hou.Node)
+#         A Houdini node.
+#     prefix : (str)
+#         An opinfo line prefix containing a date and time.
+#
+# Returns: datetime.datetime|None
+#              The datetime matching the opinfo line, if it exists, otherwise
+#              None.
+#
+# Raises: N/A
+#
+# Desc: Extract a datetime.datetime from the opinfo of a node.
+#-----------------------------------------------------------------------------
+def _getTimeFromOpInfo(node, prefix):
+    import datetime
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
+    # Get the operator info and split info rows.
+    info = hou.hscript("opinfo -n {0}".format(node.path()))[0].split('\n')
 
-    int i = 0;
-    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
-    {
-        s_t->setString(attrib, *it, values[i], 0);
-        i++;
-    }
-}
-""",
+    # Check each row.
+    for row in info:
+        #  If the row doesn't start with our prefix, ignore it.
+        if not row.startswith(prefix):
+            continue
 
-"""
-int
-setSharedPrimStringAttrib(GU_Detail *gdp,
-                          const char *attrib_name,
-                          const char *value,
-                          const char *group_name=0)
-{
-    GA_PrimitiveGroup           *group = 0;
+        # Strip the prefix and any leading whitespace.
+        time_str = row[len(prefix):].strip()
 
-    GA_Attribute                *attrib;
-    GA_RWAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
+        # Construct a datetime object.
+        return datetime.datetime.strptime(time_str, "%d %b %Y %I:%M %p")
 
-    // Find the primitive group if necessary.
-    if (group_name)
-    {
-        group = gdp->findPrimitiveGroup(group_name);
-    }
+    return None
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_PRIMITIVE, attrib_name);
 
-    // If it doesn't exist, return 1 to indicate we have an invalid attribute.
-    if (attrib_gah.isInvalid())
-    {
-        return 1;
-    }
+# The environment variable pointing to a directory of prebuilt libraries.
+_LIBRARY_CACHE_VARIABLE = "HT_INLINECPP_CACHE"
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+# Setting this environment variable creates all libraries at import time
+# instead of when one of their functions is first called.
+_LIBRARY_EAGER_VARIABLE = "HT_INLINECPP_EAGER"
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
+# A dictionary of library names to their library objects.
+_LIBRARIES = {}
 
-    if (group)
-    {
-        // Set all the primitives in the group to the value.
-        s_t->setString(attrib, GA_Range(*group), value, 0);
-    }
-    else
-    {
-        // Set all the primitives in the detail to the value.
-        s_t->setString(attrib, gdp->getPrimitiveRange(), value, 0);
-    }
 
-    // Return 0 to indicate success.
-    return 0;
-}
-""",
+#-----------------------------------------------------------------------------
+# Name: _getLocalLibraryDirectory
+#
+# Args: N/A
+#
+# Returns: str
+#              The directory inlinecpp compiles libraries into.
+#
+# Raises: N/A
+#
+# Desc: Get the user directory that inlinecpp stores compiled libraries in.
+#-----------------------------------------------------------------------------
+def _getLocalLibraryDirectory():
+    import os
 
-"""
-StringArray
-pointStringAttribValues(const GU_Detail *gdp, const char *attrib_name)
-{
-    std::vector<std::string>    result;
+    return os.path.join(hou.homeHoudiniDirectory(), "inlinecpp")
 
-    const GA_Attribute          *attrib;
-    GA_ROAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_POINT, attrib_name);
+#-----------------------------------------------------------------------------
+# Name: _getLibraryManifestPath
+#
+# Args:
+#     cache_dir : (str)
+#         The prebuilt library directory.
+#     name : (str)
+#         The library name.
+#     module_stamp : (str)
+#         The stamp of the module containing the library sources.
+#
+# Returns: str
+#              The path to the library's manifest file.
+#
+# Raises: N/A
+#
+# Desc: Get the manifest path for a library.  Manifests are keyed by the
+#       library name, the Houdini build, the platform and the module stamp.
+#-----------------------------------------------------------------------------
+def _getLibraryManifestPath(cache_dir, name, module_stamp):
+    import os
+    import sys
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+    file_name = "{0}_{1}_{2}_{3}.json".format(
+        name,
+        hou.applicationVersionString(),
+        sys.platform,
+        module_stamp
+    )
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
+    return os.path.join(cache_dir, file_name)
 
-    for (GA_Iterator it(gdp->getPointRange()); !it.atEnd(); ++it)
-    {
-        result.push_back(s_t->getString(attrib, *it, 0));
-    }
 
-    return result;
-}
-""",
+#-----------------------------------------------------------------------------
+# Name: _getModuleStamp
+#
+# Args: N/A
+#
+# Returns: str
+#              A stamp of the size and modification time of this module.
+#
+# Raises: N/A
+#
+# Desc: Get a cheap stamp identifying the version of this module, and so the
+#       library sources it contains, without hashing the sources.
+#-----------------------------------------------------------------------------
+def _getModuleStamp():
+    import os
 
-"""
-void
-setPointStringAttribValues(GU_Detail *gdp,
-                           const char *attrib_name,
-                           const char **values,
-                           int num_values)
-{
-    int                         i=0;
+    # Use the source file rather than any compiled version of it.
+    path = os.path.splitext(__file__)[0] + ".py"
 
-    GA_Attribute                *attrib;
-    GA_RWAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
+    if not os.path.isfile(path):
+        path = __file__
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_POINT, attrib_name);
+    stat = os.stat(path)
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+    return "{0}_{1}".format(stat.st_size, int(stat.st_mtime))
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
 
-    for (GA_Iterator it(gdp->getPointRange()); !it.atEnd(); ++it)
-    {
-        s_t->setString(attrib, *it, values[i], 0);
-        i++;
-    }
-}
-""",
+#-----------------------------------------------------------------------------
+# Name: _getLibrarySourceHash
+#
+# Args:
+#     kwargs : (dict)
+#         The arguments used to create the library.
+#
+# Returns: str
+#              A hex digest of the library sources.
+#
+# Raises: N/A
+#
+# Desc: Compute a hash of all the sources making up a library.
+#-----------------------------------------------------------------------------
+def _getLibrarySourceHash(kwargs):
+    import hashlib
 
-"""
-int
-setSharedPointStringAttrib(GU_Detail *gdp,
-                           const char *attrib_name,
-                           const char *value,
-                           const char *group_name=0)
-{
-    GA_PointGroup               *group = 0;
+    source_hash = hashlib.sha1()
 
-    GA_Attribute                *attrib;
-    GA_RWAttributeRef           attrib_gah;
-    const GA_AIFSharedStringTuple       *s_t;
+    source_hash.update(kwargs.get("includes", ""))
+    source_hash.update(repr(kwargs.get("structs", ())))
 
-    // Find the point group if necessary.
-    if (group_name)
-    {
-        group = gdp->findPointGroup(group_name);
-    }
+    for source in kwargs.get("function_sources", ()):
+        source_hash.update(source)
 
-    // Try to find the string attribute.
-    attrib_gah = gdp->findStringTuple(GA_ATTRIB_POINT, attrib_name);
+    return source_hash.hexdigest()
 
-    // If it doesn't exist, return 1 to indicate we have an invalid attribute.
-    if (attrib_gah.isInvalid())
-    {
-        return 1;
-    }
 
-    // Get the actual attribute.
-    attrib = attrib_gah.getAttribute();
+#-----------------------------------------------------------------------------
+# Name: _getFileHash
+#
+# Args:
+#     path : (str)
+#         The path to a file.
+#
+# Returns: str
+#              A hex digest of the file's contents.
+#
+# Raises:
+#     IOError
+#         This exception is raised if the file cannot be read.
+#
+# Desc: Compute a hash of a file's contents, reading it in blocks.
+#-----------------------------------------------------------------------------
+def _getFileHash(path):
+    import hashlib
 
-    // Get a shared string tuple from the attribute.
-    s_t = attrib->getAIFSharedStringTuple();
+    file_hash = hashlib.sha1()
 
-    if (group)
-    {
-        // Set all the points in the group to the value.
-        s_t->setString(attrib, GA_Range(*group), value, 0);
-    }
-    else
-    {
-        // Set all the points in the detail to the value.
-        s_t->setString(attrib, gdp->getPointRange(), value, 0);
-    }
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(65536), ""):
+            file_hash.update(block)
 
-    // Return 0 to indicate success.
-    return 0;
-}
-""",
+    return file_hash.hexdigest()
 
-"""
-bool
-hasEdge(const GU_Detail *gdp,
-        unsigned prim_num,
-        unsigned pt_num1,
-        unsigned pt_num2)
-{
-    GA_Offset                   primOff, ptOff1, ptOff2;
 
-    const GEO_Face              *face;
+#-----------------------------------------------------------------------------
+# Name: _copyFileAtomically
+#
+# Args:
+#     source_path : (str)
+#         The file to copy.
+#     target_path : (str)
+#         The path to copy the file to.
+#     file_hash : (str)
+#         The expected hex digest of the file's contents.
+#
+# Returns: bool
+#              Returns True if the target file exists after the copy,
+#              otherwise False.
+#
+# Raises: N/A
+#
+# Desc: Copy a file to a temporary file in the target directory and then
+#       rename it into place, so other processes never see a partially
+#       written file.  The copy is discarded if it can't be made or its
+#       contents don't match the hash.
+#-----------------------------------------------------------------------------
+def _copyFileAtomically(source_path, target_path, file_hash):
+    import os
+    import shutil
+    import tempfile
+
+    handle, temp_path = tempfile.mkstemp(
+        prefix=os.path.basename(target_path) + ".",
+        dir=os.path.dirname(target_path)
+    )
 
-    primOff = gdp->primitiveOffset(prim_num);
+    os.close(handle)
 
-    ptOff1 = gdp->pointOffset(pt_num1);
-    ptOff2 = gdp->pointOffset(pt_num2);
+    try:
+        shutil.copy2(source_path, temp_path)
 
-    face = (GEO_Face *)gdp->getPrimitiveList().get(primOff);
+        # The source file is corrupt so don't install it.
+        if _getFileHash(temp_path) != file_hash:
+            os.remove(temp_path)
 
-    // Build an edge between the the two points.
-    GA_Edge edge(ptOff1, ptOff2);
+            return False
 
-    return face->hasEdge(edge);
-}
-""",
+        os.rename(temp_path, target_path)
 
-"""
-void
-insertVertex(GU_Detail *gdp,
-             unsigned prim_num,
-             unsigned pt_num,
-             unsigned idx)
-{
-    GA_Offset                   ptOff, primOff;
+    except (IOError, OSError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
-    GEO_Face                    *face;
+        # Another process may have installed the file first.
+        return os.path.exists(target_path)
 
-    ptOff = gdp->pointOffset(pt_num);
-    primOff = gdp->primitiveOffset(prim_num);
+    return True
 
-    face = (GEO_Face *)gdp->getPrimitiveList().get(primOff);
 
-    face->insertVertex(ptOff, idx);
-}
-""",
+#-----------------------------------------------------------------------------
+# Name: _getLoadedLibraryPath
+#
+# Args:
+#     library : (inlinecpp._Library)
+#         A compiled inlinecpp library.
+#
+# Returns: str|None
+#              The path of the shared object the library loaded, if it has
+#              been loaded, otherwise None.
+#
+# Raises: N/A
+#
+# Desc: Find the path of the shared object an inlinecpp library has loaded
+#       from the ctypes library it holds.
+#-----------------------------------------------------------------------------
+def _getLoadedLibraryPath(library):
+    import ctypes
 
-"""
-void
-deleteVertex(GU_Detail *gdp, unsigned prim_num, unsigned idx)
-{
-    GA_Offset                   primOff;
+    for value in vars(library).itervalues():
+        if isinstance(value, ctypes.CDLL):
+            return value._name
 
-    GEO_Face                    *face;
+    return None
 
-    primOff = gdp->primitiveOffset(prim_num);
 
-    face = (GEO_Face *)gdp->getPrimitiveList().get(primOff);
+#-----------------------------------------------------------------------------
+# Name: _installPrebuiltLibrary
+#
+# Args:
+#     name : (str)
+#         The library name.
+#
+# Returns: bool
+#              Returns True if a prebuilt library was installed, otherwise
+#              False.
+#
+# Raises: N/A
+#
+# Desc: Copy a prebuilt library for this Houdini build into the local
+#       inlinecpp directory so inlinecpp can load it without compiling.
+#       Missing or corrupt cache files are treated as if there is no
+#       prebuilt library.
+#
+#       The manifest is keyed on a stamp of this module so prebuilt libraries
+#       built from older sources are never used, without hashing the sources
+#       on every load.  The source hash is only computed when the cache is
+#       built.
+#-----------------------------------------------------------------------------
+def _installPrebuiltLibrary(name):
+    import json
+    import os
 
-    face->deleteVertex(idx);
-}
-""",
+    cache_dir = os.environ.get(_LIBRARY_CACHE_VARIABLE)
 
-"""
-void
-setPoint(GU_Detail *gdp, unsigned prim_num, unsigned idx, unsigned pt_num)
-{
-    GA_Offset                   ptOff, primOff;
+    # No cache directory so we need to use the normal inlinecpp behavior.
+    if not cache_dir:
+        return False
 
-    GA_Primitive                *prim;
+    module_stamp = _getModuleStamp()
 
-    ptOff = gdp->pointOffset(pt_num);
-    primOff = gdp->primitiveOffset(prim_num);
+    manifest_path = _getLibraryManifestPath(cache_dir, name, module_stamp)
 
-    prim = (GA_Primitive *)gdp->getPrimitiveList().get(primOff);
+    # There is no prebuilt library for this build.
+    if not os.path.isfile(manifest_path):
+        return False
 
-    prim->setPointOffset(idx, ptOff);
-}
-""",
+    # A manifest that can't be read is the same as no manifest.
+    try:
+        with open(manifest_path) as handle:
+            manifest = json.load(handle)
 
-"""
-Position3D
-baryCenter(const GU_Detail *gdp, unsigned prim_num)
-{
-    GA_Offset                   primOff;
+        manifest_stamp = manifest["module_stamp"]
+        files = dict(manifest["files"])
 
-    const GEO_Primitive         *prim;
+    except (IOError, ValueError, KeyError, TypeError):
+        return False
 
-    UT_Vector3                  center;
+    # The prebuilt library was built from a different version of the module.
+    if manifest_stamp != module_stamp:
+        return False
 
-    Position3D                  pos;
+    local_dir = _getLocalLibraryDirectory()
 
-    primOff = gdp->primitiveOffset(prim_num);
+    try:
+        os.makedirs(local_dir)
 
-    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+    # The directory already exists.
+    except OSError:
+        if not os.path.isdir(local_dir):
+            return False
 
-    center = prim->baryCenter();
+    for file_name, file_hash in files.iteritems():
+        local_path = os.path.join(local_dir, file_name)
 
-    pos.x = center.x();
-    pos.y = center.y();
-    pos.z = center.z();
+        # Only copy the library if it hasn't already been installed.
+        if os.path.exists(local_path):
+            continue
 
-    return pos;
-}
-""",
+        cache_path = os.path.join(cache_dir, file_name)
 
-"""
-double
-primitiveArea(const GU_Detail *gdp, unsigned prim_num)
-{
-    GA_Offset                   primOff;
+        # The prebuilt library is missing from the cache.
+        if not os.path.isfile(cache_path):
+            return False
 
-    const GA_Primitive         *prim;
+        if not _copyFileAtomically(cache_path, local_path, file_hash):
+            return False
 
-    primOff = gdp->primitiveOffset(prim_num);
+    return True
 
-    prim = (GA_Primitive *)gdp->getPrimitiveList().get(primOff);
 
-    return prim->calcArea();
-}
-""",
+class _LazyLibrary(object):
+    """This class wraps an inlinecpp library so that it is only created the
+    first time one of its functions is used.
 
-"""
-double
-perimeter(const GU_Detail *gdp, unsigned prim_num)
-{
-    GA_Offset                   primOff;
+    Args:
+        name : (str)
+            The library name.
+        **kwargs :
+            Any arguments to pass to inlinecpp.createLibrary().
 
-    const GA_Primitive         *prim;
+    Each function is bound to the object the first time it is accessed so
+    later calls go straight to the inlinecpp function.
 
-    primOff = gdp->primitiveOffset(prim_num);
+    """
 
-    prim = (GA_Primitive *)gdp->getPrimitiveList().get(primOff);
+    def __init__(self, name, **kwargs):
+        self._name = name
+        self._kwargs = kwargs
+        self._library = None
 
-    return prim->calcPerimeter();
-}
-""",
+    def __getattr__(self, name):
+        # Don't load the library for any private or special attribute lookups.
+        if name.startswith('_'):
+            raise AttributeError(name)
 
-"""
-void
-reversePrimitive(const GU_Detail *gdp, unsigned prim_num)
-{
-    GA_Offset                   primOff;
+        function = getattr(self.load(), name)
 
-    GEO_Primitive               *prim;
+        # Store the function on this object so future lookups don't need to
+        # go through __getattr__.
+        setattr(self, name, function)
 
-    primOff = gdp->primitiveOffset(prim_num);
+        return function
 
-    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+    @property
+    def kwargs(self):
+        """The arguments used to create the library."""
+        return self._kwargs
 
-    return prim->reverse();
-}
-""",
+    @property
+    def name(self):
+        """The library name."""
+        return self._name
 
-"""
-void
-makeUnique(GU_Detail *gdp, unsigned prim_num)
-{
-    GA_Offset                   primOff;
+    def load(self):
+        """Create the inlinecpp library if it doesn't already exist.
 
-    GEO_Primitive               *prim;
+        Returns:
+            inlinecpp._Library
+                The inlinecpp library.
 
-    primOff = gdp->primitiveOffset(prim_num);
+        Raises: N/A
 
-    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+        """
+        if self._library is None:
+            _installPrebuiltLibrary(self._name)
 
-    gdp->uniquePrimitive(prim);
-}
-""",
+            self._library = inlinecpp.createLibrary(
+                self._name,
+                **self._kwargs
+            )
 
-"""
-BoundingBox
-boundingBox(const GU_Detail *gdp, unsigned prim_num)
-{
-    GA_Offset                   primOff;
+        return self._library
 
-    const GEO_Primitive         *prim;
 
-    UT_BoundingBox              bbox;
+#-----------------------------------------------------------------------------
+# Name: _createLibrary
+#
+# Args:
+#     name : (str)
+#         The library name.
+#     **kwargs :
+#         Any arguments to pass to inlinecpp.createLibrary().
+#
+# Returns: _LazyLibrary
+#              The library object.
+#
+# Raises: N/A
+#
+# Desc: Create a library whose inlinecpp library is only built or loaded when
+#       one of its functions is first called.  If the eager variable is set
+#       the library is created immediately.
+#-----------------------------------------------------------------------------
+def _createLibrary(name, **kwargs):
+    import os
 
-    BoundingBox                 bound;
+    library = _LazyLibrary(name, **kwargs)
 
-    primOff = gdp->primitiveOffset(prim_num);
+    # Store the library so it can be rebuilt into the cache.
+    _LIBRARIES[name] = library
 
-    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+    if os.environ.get(_LIBRARY_EAGER_VARIABLE):
+        library.load()
 
-    prim->getBBox(&bbox);
+    return library
 
-    bound.xmin = bbox.xmin();
-    bound.ymin = bbox.ymin();
-    bound.zmin = bbox.zmin();
 
-    bound.xmax = bbox.xmax();
-    bound.ymax = bbox.ymax();
-    bound.zmax = bbox.zmax();
+def buildLibraryCache(cache_dir):
+    """Compile all the libraries and store them in a prebuilt library cache.
 
-    return bound;
-}
-""",
+    Args:
+        cache_dir : (str)
+            The directory to store the prebuilt libraries in.
 
-"""
-BoundingBox
-primGroupBoundingBox(const GU_Detail *gdp, const char *group_name)
-{
+    Returns: N/A
 
-    const GA_PrimitiveGroup     *group;
+    Raises:
+        OperationFailed
+            This exception is raised if the shared object of a library
+            can't be found.
 
-    UT_BoundingBox              bbox;
+    The directory can then be pointed to by the HT_INLINECPP_CACHE
+    environment variable so that new sessions using the same Houdini build
+    load the prebuilt libraries instead of compiling them.
 
-    BoundingBox                 bound;
+    This should be run once for each Houdini build and platform, and after
+    any change to this module.  Prebuilt libraries built from another
+    version of the module are ignored automatically.  The module is
+    identified by its size and modification time, so deployed copies of it
+    must keep their modification time to use the cache.
 
-    // Find the primitive group.
-    group = gdp->findPrimitiveGroup(group_name);
+    """
+    import json
+    import os
+    import re
+    import shutil
 
-    gdp->getBBox(&bbox, group);
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
 
-    bound.xmin = bbox.xmin();
-    bound.ymin = bbox.ymin();
-    bound.zmin = bbox.zmin();
+    module_stamp = _getModuleStamp()
 
-    bound.xmax = bbox.xmax();
-    bound.ymax = bbox.ymax();
-    bound.zmax = bbox.zmax();
+    for name, library in _LIBRARIES.iteritems():
+        # Accessing a function forces inlinecpp to compile the library.
+        first_source = library.kwargs["function_sources"][0]
+        function_name = re.search(r"(\w+)\s*\(", first_source).group(1)
+        getattr(library.load(), function_name)
 
-    return bound;
-}
-""",
+        # Use the shared object that was actually loaded.
+        library_path = _getLoadedLibraryPath(library.load())
 
-"""
-BoundingBox
-pointGroupBoundingBox(const GU_Detail *gdp, const char *group_name)
-{
+        # The way inlinecpp stores the loaded library has changed.
+        if library_path is None:
+            raise hou.OperationFailed(
+                "Could not find the shared object for {0}.".format(name)
+            )
 
-    const GA_PointGroup         *group;
+        file_name = os.path.basename(library_path)
 
-    UT_BoundingBox              bbox;
+        shutil.copy2(library_path, os.path.join(cache_dir, file_name))
 
-    BoundingBox                 bound;
+        # The source hash is only computed here and stored for reference.
+        manifest = {
+            "build": hou.applicationVersionString(),
+            "module_stamp": module_stamp,
+            "source_hash": _getLibrarySourceHash(library.kwargs),
+            "files": {file_name: _getFileHash(library_path)},
+        }
 
-    // Find the point group.
-    group = gdp->findPointGroup(group_name);
+        manifest_path = _getLibraryManifestPath(
+            cache_dir,
+            name,
+            module_stamp
+        )
 
-    gdp->getPointBBox(&bbox, group);
+        with open(manifest_path, 'w') as handle:
+            json.dump(manifest, handle, indent=4)
 
-    bound.xmin = bbox.xmin();
-    bound.ymin = bbox.ymin();
-    bound.zmin = bbox.zmin();
 
-    bound.xmax = bbox.xmax();
-    bound.ymax = bbox.ymax();
-    bound.zmax = bbox.zmax();
+# Methods for sorting points and primitives.
+_sort_methods = _createLibrary(
+    "cpp_sort_methods",
+    acquire_hom_lock=True,
+    catch_crashes=True,
+    includes="""
+#include <GA/GA_SplittableRange.h>
+#include <GU/GU_Detail.h>
+#include <UT/UT_BoundingBox.h>
+#include <UT/UT_ParallelUtil.h>
+
+#include <algorithm>
+#include <cmath>
+#include <map>
+#include <string>
+#include <vector>
+
+// Read a single component of a numeric attribute into a list of values
+// ordered by element number.  Values are written every 'stride' entries so
+// several keys can be interleaved in the same list.
+template <typename T>
+class AttribComponentReader
+{
+public:
+    AttribComponentReader(const GA_Attribute *attrib,
+                          int component,
+                          T *values,
+                          exint stride=1)
+        : myAttrib(attrib),
+          myTuple(attrib->getAIFTuple()),
+          myComponent(component),
+          myValues(values),
+          myStride(stride)
+    {
+    }
 
-    return bound;
-}
-""",
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end;
+        GA_Index                idx;
+        T                       value;
 
-"""
-bool
-addNormalAttribute(GU_Detail *gdp)
-{
-    GA_RWAttributeRef           n_gah;
+        const GA_IndexMap &index_map = myAttrib->getIndexMap();
 
-    n_gah = gdp->addNormalAttribute(GA_ATTRIB_POINT);
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset elemOff=start; elemOff < end; ++elemOff)
+            {
+                idx = index_map.indexFromOffset(elemOff);
 
-    // Return true if the attribute was created.
-    if (n_gah.isValid())
-    {
-        return true;
+                myTuple->get(myAttrib, elemOff, value, myComponent);
+                myValues[idx * myStride] = value;
+            }
+        }
     }
 
-    // False otherwise.
-    return false;
-}
-""",
-
-"""
-bool
-addVelocityAttribute(GU_Detail *gdp)
+private:
+    const GA_Attribute          *myAttrib;
+    const GA_AIFTuple           *myTuple;
+    int                         myComponent;
+    T                           *myValues;
+    exint                       myStride;
+};
+
+// Read a single component of a string attribute into a list of keys ordered
+// by element number.  Each string is replaced by its rank among the sorted
+// strings so the keys can be compared, and negated, like numbers.  Keys are
+// written every 'stride' entries.
+template <typename T>
+static void
+readStringRanks(const GA_Attribute *attrib,
+                int component,
+                T *keys,
+                exint stride=1)
 {
-    GA_RWAttributeRef           v_gah;
+    const char                  *value;
+    exint                       rank;
+    GA_StringIndexType          handle;
 
-    v_gah = gdp->addVelocityAttribute(GA_ATTRIB_POINT);
+    std::map<GA_StringIndexType, exint> handle_ranks;
+    std::map<GA_StringIndexType, exint>::iterator handle_it;
+    std::vector<std::pair<std::string, GA_StringIndexType> > strings;
 
-    // Return true if the attribute was created.
-    if (v_gah.isValid())
+    const GA_AIFSharedStringTuple *s_t = attrib->getAIFSharedStringTuple();
+
+    const GA_IndexMap &index_map = attrib->getIndexMap();
+
+    GA_Range range(index_map);
+
+    // Find the string of each handle in use.  Elements without a value
+    // are treated as an empty string.
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
     {
-        return true;
+        handle = s_t->getHandle(attrib, *it, component);
+
+        if (handle_ranks.find(handle) != handle_ranks.end())
+        {
+            continue;
+        }
+
+        handle_ranks[handle] = 0;
+
+        value = s_t->getString(attrib, *it, component);
+
+        strings.push_back(std::make_pair(value ? value : "", handle));
     }
 
-    // False otherwise.
-    return false;
-}
-""",
+    // Rank the handles by their strings, with equal strings sharing a rank.
+    std::sort(strings.begin(), strings.end());
 
-"""
-bool
-addDiffuseAttribute(GU_Detail *gdp, int mode)
-{
-    GA_RWAttributeRef           diff_gah;
+    rank = 0;
 
-    switch (mode)
+    for (size_t i=0; i < strings.size(); ++i)
     {
-        case 0:
-            diff_gah = gdp->addDiffuseAttribute(GA_ATTRIB_POINT);
-            break;
+        if (i && strings[i].first != strings[i - 1].first)
+        {
+            ++rank;
+        }
 
-        case 1:
-            diff_gah = gdp->addDiffuseAttribute(GA_ATTRIB_PRIMITIVE);
-            break;
+        handle_ranks[strings[i].second] = rank;
+    }
 
-        case 2:
-            diff_gah = gdp->addDiffuseAttribute(GA_ATTRIB_VERTEX);
-            break;
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        handle = s_t->getHandle(attrib, *it, component);
 
-        default:
-            break;
+        handle_it = handle_ranks.find(handle);
+
+        keys[index_map.indexFromOffset(*it) * stride] = handle_it->second;
     }
+}
 
-    // Return true if the attribute was created.
-    if (diff_gah.isValid())
+// Compare element numbers by several keys stored interleaved per element.
+template <typename T>
+class MultiKeyCompare
+{
+public:
+    MultiKeyCompare(const T *keys, int num_keys)
+        : myKeys(keys),
+          myNumKeys(num_keys)
     {
-        return true;
     }
 
-    // False otherwise.
-    return false;
-}
-""",
+    bool operator()(exint a, exint b) const
+    {
+        const T *key_a = myKeys + a * myNumKeys;
+        const T *key_b = myKeys + b * myNumKeys;
 
-"""
-void
-computePointNormals(GU_Detail *gdp)
+        for (int i=0; i < myNumKeys; ++i)
+        {
+            if (key_a[i] < key_b[i])
+            {
+                return true;
+            }
+
+            if (key_b[i] < key_a[i])
+            {
+                return false;
+            }
+        }
+
+        return false;
+    }
+
+private:
+    const T                     *myKeys;
+    int                         myNumKeys;
+};
+
+// Spread the lower 21 bits of a value out so there are two zero bits
+// between each of them.
+static inline int64
+spreadBits(int64 value)
 {
-    gdp->normal();
+    value &= 0x1fffff;
+    value = (value | value << 32) & 0x1f00000000ffffLL;
+    value = (value | value << 16) & 0x1f0000ff0000ffLL;
+    value = (value | value << 8) & 0x100f00f00f00f00fLL;
+    value = (value | value << 4) & 0x10c30c30c30c30c3LL;
+    value = (value | value << 2) & 0x1249249249249249LL;
+
+    return value;
 }
-""",
 
-"""
-void
-convexPolygons(GU_Detail *gdp, unsigned maxpts=3)
+// Compute the position along a Morton (Z-order) curve of a grid cell.
+static inline int64
+mortonKey(const int *cell)
 {
-    gdp->convex(maxpts);
+    return spreadBits(cell[0]) << 2 | spreadBits(cell[1]) << 1
+        | spreadBits(cell[2]);
 }
-""",
 
-"""
-void
-destroyEmptyGroups(GU_Detail *gdp, int mode)
+// Compute the position along a Hilbert curve of a grid cell using John
+// Skilling's transpose method.
+static inline int64
+hilbertKey(const int *cell, int bits)
 {
-    if (mode)
+    uint32                      axes[3], mask, q, t;
+    int64                       key = 0;
+
+    for (int i=0; i < 3; ++i)
     {
-        gdp->destroyEmptyGroups(GA_ATTRIB_PRIMITIVE);
+        axes[i] = cell[i];
     }
-    else
+
+    mask = 1u << (bits - 1);
+
+    // Undo the excess work.
+    for (q=mask; q > 1; q >>= 1)
     {
-        gdp->destroyEmptyGroups(GA_ATTRIB_POINT);
+        for (int i=0; i < 3; ++i)
+        {
+            if (axes[i] & q)
+            {
+                axes[0] ^= q - 1;
+            }
+            else
+            {
+                t = (axes[0] ^ axes[i]) & (q - 1);
+                axes[0] ^= t;
+                axes[i] ^= t;
+            }
+        }
     }
-}
-""",
 
-"""
-void
-destroyUnusedPoints(GU_Detail *gdp, const char *group_name)
-{
-    GA_PointGroup               *group = 0;
+    // Gray encode.
+    axes[1] ^= axes[0];
+    axes[2] ^= axes[1];
 
-    // If we passed in a valid group, try to find it.
-    if (group_name)
+    t = 0;
+
+    for (q=mask; q > 1; q >>= 1)
     {
-        group = gdp->findPointGroup(group_name);
+        if (axes[2] & q)
+        {
+            t ^= q - 1;
+        }
     }
 
-    gdp->destroyUnusedPoints(group);
-}
-""",
-
-"""
-void
-consolidatePoints(GU_Detail *gdp, double distance, const char *group_name)
-{
-    GA_PointGroup               *group = 0;
+    for (int i=0; i < 3; ++i)
+    {
+        axes[i] ^= t;
+    }
 
-    if (group_name)
+    // Interleave the transposed bits into a single index.
+    for (int bit=bits-1; bit >= 0; --bit)
     {
-        group = gdp->findPointGroup(group_name);
+        for (int i=0; i < 3; ++i)
+        {
+            key = key << 1 | ((axes[i] >> bit) & 1);
+        }
     }
 
-    gdp->fastConsolidatePoints(distance, group);
+    return key;
 }
-""",
 
-"""
-void
-uniquePoints(GU_Detail *gdp, const char *group_name, int group_type)
+// Compute the position along a space filling curve of each point or the
+// center of each primitive.
+class SpatialKeyBuilder
 {
-    GA_ElementGroup             *group = 0;
+public:
+    SpatialKeyBuilder(const GU_Detail *gdp,
+                      GA_AttributeOwner owner,
+                      const UT_BoundingBox &bbox,
+                      int curve,
+                      int bits,
+                      int64 *keys)
+        : myGdp(gdp),
+          myOwner(owner),
+          myBBox(bbox),
+          myCurve(curve),
+          myBits(bits),
+          myKeys(keys)
+    {
+    }
 
-    if (group_name)
+    void operator()(const GA_SplittableRange &range) const
     {
-        if (group_type)
+        GA_Offset               start, end;
+        int                     cell[3];
+        UT_Vector3              pos;
+
+        int num_cells = 1 << myBits;
+
+        const GA_IndexMap &index_map = myGdp->getIndexMap(myOwner);
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
         {
-            group = gdp->findPrimitiveGroup(group_name);
+            for (GA_Offset elemOff=start; elemOff < end; ++elemOff)
+            {
+                if (myOwner == GA_ATTRIB_PRIMITIVE)
+                {
+                    pos = myGdp->getGEOPrimitive(elemOff)->baryCenter();
+                }
+                else
+                {
+                    pos = myGdp->getPos3(elemOff);
+                }
+
+                // Find the grid cell containing the position.
+                for (int i=0; i < 3; ++i)
+                {
+                    fpreal size = myBBox.sizeAxis(i);
+
+                    if (size > 0)
+                    {
+                        cell[i] = (int)((pos[i] - myBBox.minvec()[i]) / size
+                                        * num_cells);
+                        cell[i] = SYSclamp(cell[i], 0, num_cells - 1);
+                    }
+                    else
+                    {
+                        cell[i] = 0;
+                    }
+                }
+
+                if (myCurve)
+                {
+                    myKeys[index_map.indexFromOffset(elemOff)] =
+                        hilbertKey(cell, myBits);
+                }
+                else
+                {
+                    myKeys[index_map.indexFromOffset(elemOff)] =
+                        mortonKey(cell);
+                }
+            }
         }
-        else
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    GA_AttributeOwner           myOwner;
+    const UT_BoundingBox        &myBBox;
+    int                         myCurve;
+    int                         myBits;
+    int64                       *myKeys;
+};
+
+// Compare element offsets by the position they should be moved to.
+class OffsetRankCompare : public GA_IndexCompare
+{
+public:
+    OffsetRankCompare(const UT_ExintArray &ranks)
+        : myRanks(ranks)
+    {
+    }
+
+    virtual int compare(const GA_IndexMap &, GA_Offset a, GA_Offset b)
+    {
+        if (myRanks(a) < myRanks(b))
         {
-            group = gdp->findPointGroup(group_name);
+            return -1;
         }
+
+        return myRanks(a) > myRanks(b) ? 1 : 0;
     }
 
-    gdp->uniquePoints(group);
+private:
+    const UT_ExintArray         &myRanks;
+};
+
+// Reorder points or primitives so the element numbered order[i] becomes
+// element number i.
+static void
+reorderElements(GU_Detail *gdp, GA_AttributeOwner owner, const exint *order)
+{
+    GA_IndexMap &index_map = gdp->getIndexMap(owner);
+
+    exint num_elements = index_map.indexSize();
+
+    UT_ExintArray ranks(index_map.offsetSize(), index_map.offsetSize());
+
+    // Store the new number of each element by its offset since offsets do
+    // not change while the index map is sorted.
+    for (exint i=0; i < num_elements; ++i)
+    {
+        ranks(index_map.offsetFromIndex(order[i])) = i;
+    }
+
+    OffsetRankCompare compare(ranks);
+    index_map.sortIndices(compare);
 }
-""",
 
-"""
-void
-toggleMembership(GU_Detail *gdp, const char *group_name,
-                 int group_type, int elem_num)
+// Build the order of elements sorted by interleaved keys.  The sort is
+// stable so elements with equal keys keep their relative order.
+template <typename T>
+static void
+sortOrderByKeys(const T *keys,
+                int num_keys,
+                exint num_elements,
+                std::vector<exint> &order)
 {
-    GA_ElementGroup             *group = 0;
-    GA_Offset                   elem_offset;
+    order.resize(num_elements);
 
-    if (group_type)
+    for (exint i=0; i < num_elements; ++i)
     {
-        group = gdp->findPrimitiveGroup(group_name);
-        elem_offset = gdp->primitiveOffset(elem_num);
+        order[i] = i;
     }
-    else
+
+    std::stable_sort(
+        order.begin(),
+        order.end(),
+        MultiKeyCompare<T>(keys, num_keys)
+    );
+}
+
+// Evaluate an arithmetic expression program in reverse polish notation for
+// each element number.  Non-negative codes push an attribute value, read
+// into a list per attribute, or a constant.  Negative codes are the
+// operators and the element number.
+class AttribExpressionEvaluator
+{
+public:
+    AttribExpressionEvaluator(const fpreal64 *attrib_values,
+                              int num_attribs,
+                              exint num_elements,
+                              const double *constants,
+                              const int *program,
+                              int program_size,
+                              fpreal64 *values)
+        : myAttribValues(attrib_values),
+          myNumAttribs(num_attribs),
+          myNumElements(num_elements),
+          myConstants(constants),
+          myProgram(program),
+          myProgramSize(program_size),
+          myValues(values)
     {
-        group = gdp->findPointGroup(group_name);
-        elem_offset = gdp->pointOffset(elem_num);
     }
 
-    group->toggleOffset(elem_offset);
+    void operator()(const UT_BlockedRange<exint> &range) const
+    {
+        int                     code, top;
+        fpreal64                a, b;
+
+        std::vector<fpreal64>   stack(myProgramSize);
+
+        for (exint idx=range.begin(); idx < range.end(); ++idx)
+        {
+            top = 0;
+
+            for (int i=0; i < myProgramSize; ++i)
+            {
+                code = myProgram[i];
+
+                // Push an attribute value.
+                if (code >= 0 && code < myNumAttribs)
+                {
+                    stack[top++] = myAttribValues[code * myNumElements + idx];
+                }
+                // Push a constant.
+                else if (code >= myNumAttribs)
+                {
+                    stack[top++] = myConstants[code - myNumAttribs];
+                }
+                // Push the element number.
+                else if (code == -8)
+                {
+                    stack[top++] = idx;
+                }
+                else if (code == -1)
+                {
+                    stack[top - 1] = -stack[top - 1];
+                }
+                else
+                {
+                    b = stack[--top];
+                    a = stack[top - 1];
+
+                    if (code == -2)
+                    {
+                        stack[top - 1] = a + b;
+                    }
+                    else if (code == -3)
+                    {
+                        stack[top - 1] = a - b;
+                    }
+                    else if (code == -4)
+                    {
+                        stack[top - 1] = a * b;
+                    }
+                    // Dividing by zero gives zero, like hscript.
+                    else if (code == -5)
+                    {
+                        stack[top - 1] = b ? a / b : 0;
+                    }
+                    else if (code == -6)
+                    {
+                        stack[top - 1] = b ? std::fmod(a, b) : 0;
+                    }
+                    else
+                    {
+                        stack[top - 1] = std::pow(a, b);
+                    }
+                }
+            }
+
+            // NaNs can't be ordered so they are treated as zero.
+            myValues[idx] = SYSisNan(stack[0]) ? 0 : stack[0];
+        }
+    }
+
+private:
+    const fpreal64              *myAttribValues;
+    int                         myNumAttribs;
+    exint                       myNumElements;
+    const double                *myConstants;
+    const int                   *myProgram;
+    int                         myProgramSize;
+    fpreal64                    *myValues;
+};
+
+// Sort elements by a single component of a numeric attribute, reading and
+// comparing the values as type T.
+template <typename T>
+static void
+sortByAttribComponent(GU_Detail *gdp,
+                      GA_AttributeOwner owner,
+                      const GA_Attribute *attrib,
+                      int component)
+{
+    std::vector<exint>          order;
+
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
+
+    exint num_elements = index_map.indexSize();
+
+    std::vector<T>              values(num_elements);
+
+    // Read the values for all the elements in parallel.
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(index_map)),
+        AttribComponentReader<T>(attrib, component, &values[0])
+    );
+
+    sortOrderByKeys(&values[0], 1, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
 }
 """,
-
+    function_sources=[
 """
 void
-setEntries(GU_Detail *gdp, const char *group_name, int group_type)
+sortAlongAxis(GU_Detail *gdp, int mode, int axis)
 {
-    GA_ElementGroup             *group = 0;
-
-    if (group_type)
+    // Sort primitives.
+    if (mode)
     {
-        group = gdp->findPrimitiveGroup(group_name);
+        gdp->sortPrimitiveList(axis);
     }
+    // Sort points.
     else
     {
-        group = gdp->findPointGroup(group_name);
+        gdp->sortPointList(axis);
     }
-
-    group->setEntries();
-
 }
 """,
 
 """
 void
-toggleEntries(GU_Detail *gdp, const char *group_name, int group_type)
+sortByValues(GU_Detail *gdp, int mode, float *values)
 {
-    GA_ElementGroup             *group = 0;
-
-    if (group_type)
+    // Sort primitives.
+    if (mode)
     {
-        group = gdp->findPrimitiveGroup(group_name);
+        gdp->sortPrimitiveList(values);
     }
+    // Sort points.
     else
     {
-        group = gdp->findPointGroup(group_name);
+        gdp->sortPointList(values);
     }
-
-    group->toggleEntries();
 }
 """,
 
 """
-void
-copyGroup(GU_Detail *gdp,
-          int group_type,
-          const char *group_name,
-          const char *new_group_name)
+int
+sortByAttribute(GU_Detail *gdp,
+                int mode,
+                const char *attrib_name,
+                int component)
 {
-    GA_AttributeOwner           owner;
-    const GA_ElementGroup       *group;
-    GA_ElementGroup             *new_group;
+    const GA_AIFTuple           *tuple;
+    const GA_Attribute          *attrib;
 
-    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-    // Find the current group.
-    group = gdp->findElementGroup(owner, group_name);
+    // Find the attribute.
+    attrib = gdp->findAttribute(owner, attrib_name);
 
-    // Create the new group.
-    new_group = gdp->createElementGroup(owner, new_group_name);
+    // Check the attribute exists.
+    if (!attrib)
+    {
+        return 1;
+    }
 
-    // Copy the membership to the new group.
-    new_group->copyMembership(*group);
-}
-""",
+    tuple = attrib->getAIFTuple();
 
-"""
-bool
-containsAny(const GU_Detail *gdp,
-            const char *group_name,
-            const char *other_group_name,
-            int group_type)
-{
-    const GA_ElementGroup       *group;
+    // Check the attribute is numeric.
+    if (!tuple)
+    {
+        return 2;
+    }
 
-    const GA_PrimitiveGroup     *prim_group;
-    const GA_PointGroup         *point_group;
+    // Check the component is valid.
+    if (component < 0 || component >= tuple->getTupleSize(attrib))
+    {
+        return 3;
+    }
 
-    GA_Range                    range;
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-    if (group_type)
+    // Nothing to sort.
+    if (!index_map.indexSize())
     {
-        group = gdp->findPrimitiveGroup(group_name);
-        prim_group = gdp->findPrimitiveGroup(other_group_name);
-        range = gdp->getPrimitiveRange(prim_group);
+        return 0;
+    }
+
+    // Sort integers as 64 bit integers and everything else as doubles so
+    // no precision is lost.
+    if (attrib->getStorageClass() == GA_STORECLASS_INT)
+    {
+        sortByAttribComponent<int64>(gdp, owner, attrib, component);
     }
     else
     {
-        group = gdp->findPointGroup(group_name);
-        point_group = gdp->findPointGroup(other_group_name);
-        range = gdp->getPointRange(point_group);
+        sortByAttribComponent<fpreal64>(gdp, owner, attrib, component);
     }
 
-    return group->containsAny(range);
+    return 0;
 }
 """,
 
 """
-void
-primToPointGroup(GU_Detail *gdp,
-                      const char *group_name,
-                      const char *new_group_name,
-                      bool destroy)
+int
+sortByAttribExpression(GU_Detail *gdp,
+                       int mode,
+                       const char **attrib_names,
+                       const int *components,
+                       int num_attribs,
+                       const double *constants,
+                       const int *program,
+                       int program_size)
 {
-    GA_PrimitiveGroup           *prim_group;
-    GA_PointGroup               *point_group;
+    const GA_AIFTuple           *tuple;
+    const GA_Attribute          *attrib;
 
-    GA_Range                    pr_range, pt_range;
+    std::vector<exint>          order;
 
-    // Get the list of primitives.
-    const GA_PrimitiveList &prim_list = gdp->getPrimitiveList();
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-    // The source group.
-    prim_group = gdp->findPrimitiveGroup(group_name);
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-    // Create a new point group.
-    point_group = gdp->newPointGroup(new_group_name);
+    exint num_elements = index_map.indexSize();
+
+    // Nothing to sort.
+    if (!num_elements)
+    {
+        return 0;
+    }
 
-    // Get the range of primitives in the source group.
-    pr_range = GA_Range(*prim_group);
+    // The values of each attribute are stored one after the other.
+    std::vector<fpreal64>       attrib_values(num_attribs * num_elements);
+    std::vector<fpreal64>       values(num_elements);
 
-    for (GA_Iterator pr_it(pr_range); !pr_it.atEnd(); ++pr_it)
+    for (int i=0; i < num_attribs; ++i)
     {
-        // Get the range of points referenced by the vertices of
-        // the primitive.
-        pt_range = prim_list.get(*pr_it)->getPointRange();
-        // Add each point offset to the group.
-        for (GA_Iterator pt_it(pt_range); !pt_it.atEnd(); ++pt_it)
+        attrib = gdp->findAttribute(owner, attrib_names[i]);
+
+        // Check the attribute exists.
+        if (!attrib)
         {
-            point_group->addOffset(*pt_it);
+            return 1;
         }
-    }
 
-    // Destroy the source group if necessary.
-    if (destroy)
-    {
-        gdp->destroyPrimitiveGroup(prim_group);
+        tuple = attrib->getAIFTuple();
+
+        // Check the attribute is numeric.
+        if (!tuple)
+        {
+            return 2;
+        }
+
+        // Check the component is valid.
+        if (components[i] < 0 || components[i] >= tuple->getTupleSize(attrib))
+        {
+            return 3;
+        }
+
+        UTparallelFor(
+            GA_SplittableRange(GA_Range(index_map)),
+            AttribComponentReader<fpreal64>(
+                attrib,
+                components[i],
+                &attrib_values[i * num_elements]
+            )
+        );
     }
+
+    // Evaluate the expression for all the elements in parallel.
+    UTparallelFor(
+        UT_BlockedRange<exint>(0, num_elements),
+        AttribExpressionEvaluator(
+            attrib_values.empty() ? 0 : &attrib_values[0],
+            num_attribs,
+            num_elements,
+            constants,
+            program,
+            program_size,
+            &values[0]
+        )
+    );
+
+    sortOrderByKeys(&values[0], 1, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
+
+    return 0;
 }
 """,
 
 """
-void
-pointToPrimGroup(GU_Detail *gdp,
-                      const char *group_name,
-                      const char *new_group_name,
-                      bool destroy)
+int
+sortByKeys(GU_Detail *gdp,
+           int mode,
+           const char **attrib_names,
+           const int *components,
+           const double *values,
+           const int *descending,
+           int num_keys)
 {
-    GA_PrimitiveGroup           *prim_group;
-    GA_PointGroup               *point_group;
+    const GA_AIFSharedStringTuple *s_t;
+    const GA_AIFTuple           *tuple;
+    const GA_Attribute          *attrib;
+    fpreal64                    *key;
 
-    GA_Range                    pr_range, pt_range;
+    std::vector<exint>          order;
 
-    GA_OffsetArray              prims;
-    GA_OffsetArray::const_iterator prims_it;
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-    // The source group.
-    point_group = gdp->findPointGroup(group_name);
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-    // Create a new primitive group.
-    prim_group = gdp->newPrimitiveGroup(new_group_name);
+    exint num_elements = index_map.indexSize();
+
+    // Nothing to sort.
+    if (!num_elements || !num_keys)
+    {
+        return 0;
+    }
 
-    // The range of points in the source group.
-    pt_range = GA_Range(*point_group);
+    // The keys for each element are stored next to each other.
+    std::vector<fpreal64>       keys(num_elements * num_keys);
 
-    for (GA_Iterator pt_it(pt_range); !pt_it.atEnd(); ++pt_it)
+    for (int i=0; i < num_keys; ++i)
     {
-        // Get an array of primitives that reference the point.
-        gdp->getPrimitivesReferencingPoint(prims, *pt_it);
+        key = &keys[i];
 
-        // Add each primitive offset to the group.
-        for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
+        // Read the values from an attribute.
+        if (*attrib_names[i])
+        {
+            attrib = gdp->findAttribute(owner, attrib_names[i]);
+
+            // Check the attribute exists.
+            if (!attrib)
+            {
+                return 1;
+            }
+
+            tuple = attrib->getAIFTuple();
+            s_t = attrib->getAIFSharedStringTuple();
+
+            // Strings are sorted by their rank among all the values.
+            if (!tuple && s_t)
+            {
+                // Check the component is valid.
+                if (components[i] < 0
+                    || components[i] >= s_t->getTupleSize(attrib))
+                {
+                    return 3;
+                }
+
+                readStringRanks(attrib, components[i], key, num_keys);
+            }
+            else
+            {
+                // Check the attribute is numeric.
+                if (!tuple)
+                {
+                    return 2;
+                }
+
+                // Check the component is valid.
+                if (components[i] < 0
+                    || components[i] >= tuple->getTupleSize(attrib))
+                {
+                    return 3;
+                }
+
+                UTparallelFor(
+                    GA_SplittableRange(GA_Range(index_map)),
+                    AttribComponentReader<fpreal64>(
+                        attrib,
+                        components[i],
+                        key,
+                        num_keys
+                    )
+                );
+            }
+        }
+        // Use the next set of passed values.
+        else
         {
-            prim_group->addOffset(*prims_it);
+            for (exint idx=0; idx < num_elements; ++idx)
+            {
+                key[idx * num_keys] = values[idx];
+            }
+
+            values += num_elements;
         }
-    }
 
-    // Destroy the source group if necessary.
-    if (destroy)
-    {
-        gdp->destroyPointGroup(point_group);
+        // Negate the values so descending keys can be compared the same way
+        // as ascending ones.
+        if (descending[i])
+        {
+            for (exint idx=0; idx < num_elements; ++idx)
+            {
+                key[idx * num_keys] = -key[idx * num_keys];
+            }
+        }
     }
+
+    sortOrderByKeys(&keys[0], num_keys, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
+
+    return 0;
 }
 """,
 
 """
 void
-clip(GU_Detail *gdp, UT_Vector3D *normal, float dist)
+elementOffsets(const GU_Detail *gdp, int mode, int *offsets)
 {
-    UT_Vector3 dir(*normal);
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-    GQ_Detail                   *gqd = new GQ_Detail(gdp);
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-    gqd->clip(dir, dist, 0);
-    delete gqd;
+    for (GA_Index idx=0; idx < index_map.indexSize(); ++idx)
+    {
+        offsets[idx] = index_map.offsetFromIndex(idx);
+    }
 }
 """,
 
 """
-bool
-isInside(const UT_BoundingBoxD *bbox1, const UT_BoundingBoxD *bbox2)
+void
+sortPermutation(const GU_Detail *gdp,
+                int mode,
+                const int *offsets,
+                int num_offsets,
+                int *permutation)
 {
-    return bbox1->isInside(*bbox2);
-}
-""",
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-"""
-bool
-intersects(UT_BoundingBoxD *bbox1, const UT_BoundingBoxD *bbox2)
-{
-    return bbox1->intersects(*bbox2);
-}
-""",
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-"""
-bool
-computeIntersection(UT_BoundingBoxD *bbox1, const UT_BoundingBoxD *bbox2)
-{
-    return bbox1->computeIntersection(*bbox2);
+    // Find the new number of each element from its offset.
+    for (int i=0; i < num_offsets; ++i)
+    {
+        permutation[i] = index_map.indexFromOffset(offsets[i]);
+    }
 }
 """,
 
 """
-void
-expandBounds(UT_BoundingBoxD *bbox, float dltx, float dlty, float dltz)
+int
+applyPermutation(GU_Detail *gdp,
+                 int mode,
+                 const int *permutation,
+                 int num_values)
 {
-    bbox->expandBounds(dltx, dlty, dltz);
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
+
+    exint num_elements = index_map.indexSize();
+
+    // Check there is a new number for every element.
+    if (num_values != num_elements)
+    {
+        return 1;
+    }
+
+    // The element to place at each new number.
+    std::vector<exint>          order(num_elements, -1);
+
+    for (exint idx=0; idx < num_elements; ++idx)
+    {
+        // Check the new number is valid and has not already been used.
+        if (permutation[idx] < 0 || permutation[idx] >= num_elements
+            || order[permutation[idx]] != -1)
+        {
+            return 2;
+        }
+
+        order[permutation[idx]] = idx;
+    }
+
+    if (num_elements)
+    {
+        reorderElements(gdp, owner, &order[0]);
+    }
+
+    return 0;
 }
 """,
 
 """
 void
-addToMin(UT_BoundingBoxD *bbox, const UT_Vector3D *vec)
+sortByDoubleValues(GU_Detail *gdp, int mode, const double *values)
 {
-    bbox->addToMin(*vec);
+    std::vector<exint>          order;
+
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    exint num_elements = gdp->getIndexMap(owner).indexSize();
+
+    // Nothing to sort.
+    if (!num_elements)
+    {
+        return;
+    }
+
+    sortOrderByKeys(values, 1, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
 }
 """,
 
 """
 void
-addToMax(UT_BoundingBoxD *bbox, const UT_Vector3D *vec)
+sortByInt64Values(GU_Detail *gdp, int mode, const int64 *values)
 {
-    bbox->addToMax(*vec);
-}
-""",
+    std::vector<exint>          order;
 
-"""
-double
-boundingBoxArea(const UT_BoundingBoxD *bbox)
-{
-    return bbox->area();
-}
-""",
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-"""
-double
-boundingBoxVolume(const UT_BoundingBoxD *bbox)
-{
-    return bbox->volume();
+    exint num_elements = gdp->getIndexMap(owner).indexSize();
+
+    // Nothing to sort.
+    if (!num_elements)
+    {
+        return;
+    }
+
+    sortOrderByKeys(values, 1, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
 }
 """,
 
 """
-bool
-isParmDefault(OP_Node *node, const char *parm_name, int index)
+void
+sortByUInt64Values(GU_Detail *gdp, int mode, const uint64 *values)
 {
-    PRM_Parm &parm = node->getParm(parm_name);
+    std::vector<exint>          order;
 
-    // If we have a specific index, check if that parm is at its default.
-    if (index != -1)
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    exint num_elements = gdp->getIndexMap(owner).indexSize();
+
+    // Nothing to sort.
+    if (!num_elements)
     {
-        return parm.isDefault(index);
+        return;
     }
 
-    // If not we check if the entire parm is at the default value.
-    return parm.isDefault();
+    sortOrderByKeys(values, 1, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
 }
 """,
 
 """
-StringArray
-getReferencingParms(OP_Node *node, const char *parm_name)
+void
+sortSpatially(GU_Detail *gdp, int mode, int curve, int bits)
 {
-    std::vector<std::string>    result;
-
-    PRM_Parm                    *parm_tuple;
+    std::vector<exint>          order;
+    UT_BoundingBox              bbox;
 
-    UT_PtrArray<PRM_Parm *>     parm_tuples;
-    UT_IntArray                 component_indices;
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
 
-    UT_String                   path, chan;
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-    // Get an array of parameter objects and their component indices
-    // that reference the parameter.
-    node->getParmsThatReference(parm_name, parm_tuples, component_indices);
+    exint num_elements = index_map.indexSize();
 
-    for (int i=0; i < parm_tuples.entries(); ++i)
+    // Nothing to sort.
+    if (!num_elements)
     {
-        parm_tuple = parm_tuples[i];
-        parm_tuple->getParmOwner()->getFullPath(path);
-        path += "/";
+        return;
+    }
 
-        parm_tuple->getTemplatePtr()->getChannelToken(chan,
-                                                      component_indices[i]);
-        path += chan;
+    // Primitive centers are always inside the bounds of the points.
+    gdp->getPointBBox(&bbox);
 
-        result.push_back(path.toStdString());
-    }
+    std::vector<int64>          keys(num_elements);
 
-    if (result.size() == 0)
-    {
-        result.push_back("");
-    }
+    // Compute the curve position of each element in parallel.
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(index_map)),
+        SpatialKeyBuilder(gdp, owner, bbox, curve, bits, &keys[0])
+    );
 
-    return result;
+    sortOrderByKeys(&keys[0], 1, num_elements, order);
+
+    reorderElements(gdp, owner, &order[0]);
 }
 """,
 
 """
 void
-disconnectAllInputs(OP_Node *node)
+sortListRandomly(GU_Detail *gdp, int mode, float seed)
 {
-    node->disconnectAllInputs();
+    // Sort primitives.
+    if (mode)
+    {
+        gdp->sortPrimitiveList(seed);
+    }
+    // Sort points.
+    else
+    {
+        gdp->sortPointList(seed);
+    }
 }
 """,
 
 """
 void
-disconnectAllOutputs(OP_Node *node)
+shiftList(GU_Detail *gdp, int mode, int offset)
 {
-    node->disconnectAllOutputs();
+    // Sort primitives.
+    if (mode)
+    {
+        gdp->shiftPrimitiveList(offset);
+    }
+    // Sort points.
+    else
+    {
+        gdp->shiftPointList(offset);
+    }
 }
 """,
 
 """
-const char *
-inputLabel(OP_Node *node, int index)
+void
+reverseList(GU_Detail *gdp, int mode)
 {
-    return node->inputLabel(index);
+    // Sort primitives.
+    if (mode)
+    {
+        gdp->reversePrimitiveList();
+    }
+    // Sort points.
+    else
+    {
+        gdp->reversePointList();
+    }
 }
 """,
 
 """
-StringArray
-messageNodes(const OP_Node *node)
+void
+proximityToList(GU_Detail *gdp, int mode, const UT_Vector3D *point)
 {
-    std::vector<std::string>    paths;
-
-    OP_Network                  *network;
-    OP_NodeList                 nodes;
-
-    UT_String                   path;
-
-    // Cast to a network.
-    network = (OP_Network *)node;
+    UT_Vector3                  pos(*point);
 
-    // Get any message nodes.  If there are none, add an emptry string to
-    // the list of paths and return it.
-    if (!network->getMessageSubNodes(nodes))
+    // Sort primitives.
+    if (mode)
     {
-        paths.push_back("");
-        return paths;
+        gdp->proximityToPrimitiveList(pos);
     }
-
-    // Add each message node path to the list.
-    for (int i=0; i<nodes.entries(); ++i)
+    // Sort points.
+    else
     {
-        nodes[i]->getFullPath(path);
-        paths.push_back(path.toStdString());
+        gdp->proximityToPointList(pos);
     }
-
-    // Return the paths.
-    return paths;
 }
 """,
 
 """
-int
-representativeNode(const OP_Node *node)
+void
+sortByVertexOrder(GU_Detail *gdp)
 {
-    OP_Network                  *network;
-
-    network = (OP_Network *)node;
-
-    return network->getRepresentativeNodeId(0, 0);
+    gdp->sortByVertexOrder();
 }
 """,
+]
+)
 
-"""
-bool
-isContainedBy(const OP_Node *node, const OP_Node *parent)
-{
-    return node->getIsContainedBy(parent);
-}
-""",
 
-"""
-bool
-isEditable(const OP_Node *node)
+# Methods for working with attributes.
+_attrib_methods = _createLibrary(
+    "cpp_attrib_methods",
+    acquire_hom_lock=True,
+    catch_crashes=True,
+    includes="""
+#include <GA/GA_AttributeRefMap.h>
+#include <GA/GA_SplittableRange.h>
+#include <GU/GU_Detail.h>
+#include <UT/UT_ParallelUtil.h>
+
+#include <map>
+
+// Build a range of points or primitives.  If a group name is passed only
+// elements in that group are included.  If end is not negative only elements
+// whose numbers are between start and end are included.  Returns false if
+// the group does not exist.
+static bool
+buildElementRange(const GU_Detail *gdp,
+                  GA_AttributeOwner owner,
+                  const char *group_name,
+                  int start,
+                  int end,
+                  GA_Range &range)
 {
-    return node->getIsEditableAssetSubNode();
-}
-""",
+    GA_Offset                   elemOff;
+    GA_OffsetList               offsets;
 
-"""
-bool
-isCompiled(const OP_Node *node)
-{
-    return node->isCompiled();
-}
-""",
+    const GA_ElementGroup       *group = 0;
 
-"""
-StringArray
-getExistingOpReferences(OP_Node *node, bool recurse)
-{
-    std::vector<std::string>    result;
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
 
-    UT_String                   path;
+    // Find the group if necessary.
+    if (group_name && *group_name)
+    {
+        group = gdp->findElementGroup(owner, group_name);
 
-    OP_Node                     *ref_node;
+        if (!group)
+        {
+            return false;
+        }
+    }
 
-    OP_NodeList                 refs;
-    OP_NodeList::const_iterator depend_it;
+    // No index range so use the entire group or detail.
+    if (end < 0)
+    {
+        if (group)
+        {
+            range = GA_Range(*group);
+        }
+        else
+        {
+            range = GA_Range(index_map);
+        }
 
-    node->getExistingOpReferences(refs, recurse);
+        return true;
+    }
 
-    for (depend_it=refs.begin(); !depend_it.atEnd(); ++depend_it)
+    end = SYSmin(end, (int)index_map.indexSize());
+
+    // Only visit the elements in the index range.
+    for (GA_Index idx=SYSmax(start, 0); idx < end; ++idx)
     {
-        ref_node = *depend_it;
-        ref_node->getFullPath(path);
+        elemOff = index_map.offsetFromIndex(idx);
 
-        result.push_back(path.toStdString());
+        if (!group || group->containsOffset(elemOff))
+        {
+            offsets.append(elemOff);
+        }
     }
 
-    if (result.size() == 0)
+    range = GA_Range(index_map, offsets);
+
+    return true;
+}
+
+// Set the values of a float attribute from a list of values ordered by
+// element number.
+class FloatTupleWriter
+{
+public:
+    FloatTupleWriter(GA_Attribute *attrib, const double *values)
+        : myHandle(attrib),
+          myValues(values)
     {
-        result.push_back("");
     }
 
-    return result;
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end;
+        const double            *values;
+
+        const GA_IndexMap &index_map = myHandle->getIndexMap();
+
+        int size = myHandle.getTupleSize();
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset elemOff=start; elemOff < end; ++elemOff)
+            {
+                values = myValues + index_map.indexFromOffset(elemOff) * size;
+
+                for (int i=0; i < size; ++i)
+                {
+                    myHandle.set(elemOff, i, values[i]);
+                }
+            }
+        }
+    }
+
+private:
+    GA_RWHandleF                myHandle;
+    const double                *myValues;
+};
+""",
+    structs=[
+        ("IntArray", "*i"),
+        ("StringArray", "**c"),
+    ],
+    function_sources=[
+"""
+int
+setFloatTupleValues(GU_Detail *gdp,
+                    int mode,
+                    const char *attrib_name,
+                    int size,
+                    const double *values)
+{
+    GA_Attribute                *attrib;
+
+    GA_AttributeOwner owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Find or create the attribute.
+    attrib = gdp->addFloatTuple(owner, attrib_name, size).getAttribute();
+
+    // Check the attribute could be created.
+    if (!attrib || attrib->getTupleSize() != size)
+    {
+        return 1;
+    }
+
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(gdp->getIndexMap(owner))),
+        FloatTupleWriter(attrib, values)
+    );
+
+    attrib->bumpDataId();
+
+    return 0;
 }
 """,
 
 """
-StringArray
-getExistingOpDependents(OP_Node *node, bool recurse)
+void
+setVarmap(GU_Detail *gdp, const char **strings, int num_strings)
 {
-    std::vector<std::string>    result;
+    GA_Attribute                *attrib;
+    GA_RWAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
 
-    UT_String                   path;
+    UT_String                   value;
 
-    OP_Node                     *dep_node;
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_DETAIL, "varmap");
 
-    OP_NodeList                 deps;
-    OP_NodeList::const_iterator depend_it;
+    // If it doesn't exist, add it.
+    if (attrib_gah.isInvalid())
+    {
+        attrib_gah = gdp->createStringAttribute(GA_ATTRIB_DETAIL, "varmap");
+    }
 
-    node->getExistingOpDependents(deps, recurse);
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
 
-    for (depend_it=deps.begin(); !depend_it.atEnd(); ++depend_it)
-    {
-        dep_node = *depend_it;
-        dep_node->getFullPath(path);
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
 
-        result.push_back(path.toStdString());
-    }
+    // Resize the tuple to our needed size.
+    s_t->setTupleSize(attrib, num_strings);
 
-    if (result.size() == 0)
+    // Iterate over all the strings to assign.
+    for (int i=0; i < num_strings; ++i)
     {
-        result.push_back("");
+        // Get the string.
+        value = strings[i];
+        // Add it to the tuple at this point.
+        s_t->setString(attrib, GA_Offset(0), value, i);
     }
-
-    return result;
 }
 """,
 
 """
 void
-insertMultiParmItem(OP_Node *node, const char *parm_name, int idx)
+addVariableName(GU_Detail *gdp, const char *attrib_name, const char *var_name)
 {
-    node->insertMultiParmItem(parm_name, idx);
+    gdp->addVariableName(attrib_name, var_name);
 }
 """,
 
 """
 void
-removeMultiParmItem(OP_Node *node, const char *parm_name, int idx)
+removeVariableName(GU_Detail *gdp, const char *var_name)
 {
-    node->removeMultiParmItem(parm_name, idx);
+    gdp->removeVariableName(var_name);
+}
+""",
+
+"""
+bool
+renameAttribute(GU_Detail *gdp,
+                int attrib_type,
+                const char *from_name,
+                const char *to_name)
+{
+    GA_AttributeOwner           owner;
+
+    // Convert the int value to the attribute owner type.
+    owner = static_cast<GA_AttributeOwner>(attrib_type);
+
+    // Rename the attribute.
+    return gdp->renameAttribute(owner, GA_SCOPE_PUBLIC, from_name, to_name);
+}
+""",
+
+"""
+int
+findPrimitiveByName(const GU_Detail *gdp,
+                    const char *name_to_match,
+                    const char *name_attribute,
+                    int match_number)
+{
+    const GEO_Primitive         *prim;
+
+    // Try to find a primitive.
+    prim = gdp->findPrimitiveByName(name_to_match,
+                                    GEO_PrimTypeCompat::GEOPRIMALL,
+                                    name_attribute,
+                                    match_number);
+
+    // If one was found, return its number.
+    if (prim)
+    {
+        return prim->getNum();
+    }
+
+    // Return -1 to indicate that no prim was found.
+    return -1;
 }
 """,
 
-"""
-StringTuple
-getMultiParmInstances(OP_Node *node, const char *parm_name)
-{
-    int                         items, instances;
-    std::vector<StringArray>    blocks;
+"""
+IntArray
+findAllPrimitivesByName(const GU_Detail *gdp,
+                        const char *name_to_match,
+                        const char *name_attribute)
+{
+    std::vector<int>            prim_nums;
+
+    GEO_ConstPrimitivePtrArray  prims;
+    GEO_ConstPrimitivePtrArray::const_iterator prims_it;
+
+    // Try to find all the primitives given the name.
+    gdp->findAllPrimitivesByName(prims,
+                                 name_to_match,
+                                 GEO_PrimTypeCompat::GEOPRIMALL,
+                                 name_attribute);
+
+    // Add any found prims to the array.
+    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
+    {
+        prim_nums.push_back((*prims_it)->getNum());
+    }
+
+    return prim_nums;
+}
+""",
+
+"""
+void
+copyPointAttributeValues(GU_Detail *dest_gdp,
+                         int dest_pt,
+                         const GU_Detail *src_gdp,
+                         int src_pt,
+                         const char **attribute_names,
+                         int num_attribs)
+{
+    GA_Offset                   srcOff, destOff;
+
+    GA_ROAttributeRef           src_gah;
+    GA_RWAttributeRef           dest_gah;
+
+    const GA_Attribute          *attr;
+
+    UT_String                   attr_name;
+
+    // Build an attribute reference map between the geometry.
+    GA_AttributeRefMap hmap(*dest_gdp, src_gdp);
+
+    // Iterate over all the attribute names.
+    for (int i=0; i < num_attribs; ++i)
+    {
+        // Get the attribute name.
+        attr_name = attribute_names[i];
+
+        // Get the attribute reference from the source geometry.
+        src_gah = src_gdp->findPointAttribute(attr_name);
+        if (src_gah.isValid())
+        {
+            // Get the actual attribute.
+            attr = src_gah.getAttribute();
+
+            // Try to find the same attribute on the destination geometry.
+            dest_gah = dest_gdp->findPointAttrib(*attr);
+
+            // If it doesn't exist, create it.
+            if (dest_gah.isInvalid())
+            {
+                dest_gah = dest_gdp->addPointAttrib(attr);
+            }
+
+            // Add a mapping between the source and dest attributes.
+            hmap.append(dest_gah.getAttribute(), attr);
+        }
+    }
+
+    // Get the point offsets.
+    srcOff = src_gdp->pointOffset(src_pt);
+    destOff = src_gdp->pointOffset(dest_pt);
+
+    // Copy the attribute value.
+    hmap.copyValue(GA_ATTRIB_POINT, destOff, GA_ATTRIB_POINT, srcOff);
+}
+""",
+
+"""
+void
+copyPrimAttributeValues(GU_Detail *dest_gdp,
+                        int dest_pr,
+                        const GU_Detail *src_gdp,
+                        int src_pr,
+                        const char **attribute_names,
+                        int num_attribs)
+{
+    GA_Offset                   srcOff, destOff;
+
+    GA_ROAttributeRef           src_gah;
+    GA_RWAttributeRef           dest_gah;
+
+    const GA_Attribute          *attr;
+
+    UT_String                   attr_name;
+
+    // Build an attribute reference map between the geometry.
+    GA_AttributeRefMap hmap(*dest_gdp, src_gdp);
+
+    // Iterate over all the attribute names.
+    for (int i=0; i < num_attribs; ++i)
+    {
+        // Get the attribute name.
+        attr_name = attribute_names[i];
+
+        // Get the attribute reference from the source geometry.
+        src_gah = src_gdp->findPrimitiveAttribute(attr_name);
+        if (src_gah.isValid())
+        {
+            // Get the actual attribute.
+            attr = src_gah.getAttribute();
+
+            // Try to find the same attribute on the destination geometry.
+            dest_gah = dest_gdp->findPrimAttrib(*attr);
+
+            // If it doesn't exist, create it.
+            if (dest_gah.isInvalid())
+            {
+                dest_gah = dest_gdp->addPrimAttrib(attr);
+            }
+
+            // Add a mapping between the source and dest attributes.
+            hmap.append(dest_gah.getAttribute(), attr);
+        }
+    }
+
+    // Get the primitive offsets.
+    srcOff = src_gdp->primitiveOffset(src_pr);
+    destOff = src_gdp->primitiveOffset(dest_pr);
+
+    // Copy the attribute value.
+    hmap.copyValue(GA_ATTRIB_PRIMITIVE,
+                   destOff,
+                   GA_ATTRIB_PRIMITIVE,
+                   srcOff);
+}
+""",
+
+"""
+StringArray
+primStringAttribValues(const GU_Detail *gdp,
+                       const char *attrib_name,
+                       const char *group_name,
+                       int start,
+                       int end,
+                       int *count)
+{
+    std::vector<std::string>    result;
+
+    GA_Range                    range;
+
+    const GA_Attribute          *attrib;
+    GA_ROAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    const char                  *value;
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_PRIMITIVE, attrib_name);
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    // Get the range of primitives to read.  Set the count to -1 to indicate
+    // the group is invalid.
+    if (!buildElementRange(gdp,
+                           GA_ATTRIB_PRIMITIVE,
+                           group_name,
+                           start,
+                           end,
+                           range))
+    {
+        *count = -1;
+        return result;
+    }
+
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        value = s_t->getString(attrib, *it, 0);
+
+        // Elements without a value map to an empty string.
+        result.push_back(value ? value : "");
+    }
+
+    *count = result.size();
+
+    return result;
+}
+""",
+
+"""
+int
+setPrimStringAttribValues(GU_Detail *gdp,
+                          const char *attrib_name,
+                          const char **values,
+                          int num_values,
+                          const char *group_name,
+                          int start,
+                          int end)
+{
+    GA_Range                    range;
+
+    GA_Attribute                *attrib;
+    GA_RWAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_PRIMITIVE, attrib_name);
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    int i = 0;
+    // Get the range of primitives to set.  Return 3 to indicate the group
+    // is invalid.
+    if (!buildElementRange(gdp,
+                           GA_ATTRIB_PRIMITIVE,
+                           group_name,
+                           start,
+                           end,
+                           range))
+    {
+        return 3;
+    }
+
+    // Return 2 to indicate the number of values doesn't match the range.
+    if (range.getEntries() != num_values)
+    {
+        return 2;
+    }
+
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        s_t->setString(attrib, *it, values[i], 0);
+        i++;
+    }
+
+    // Return 0 to indicate success.
+    return 0;
+}
+""",
+
+"""
+int
+setSharedPrimStringAttrib(GU_Detail *gdp,
+                          const char *attrib_name,
+                          const char *value,
+                          const char *group_name=0)
+{
+    GA_PrimitiveGroup           *group = 0;
+
+    GA_Attribute                *attrib;
+    GA_RWAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    // Find the primitive group if necessary.
+    if (group_name)
+    {
+        group = gdp->findPrimitiveGroup(group_name);
+    }
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_PRIMITIVE, attrib_name);
+
+    // If it doesn't exist, return 1 to indicate we have an invalid attribute.
+    if (attrib_gah.isInvalid())
+    {
+        return 1;
+    }
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    if (group)
+    {
+        // Set all the primitives in the group to the value.
+        s_t->setString(attrib, GA_Range(*group), value, 0);
+    }
+    else
+    {
+        // Set all the primitives in the detail to the value.
+        s_t->setString(attrib, gdp->getPrimitiveRange(), value, 0);
+    }
+
+    // Return 0 to indicate success.
+    return 0;
+}
+""",
+
+"""
+StringArray
+pointStringAttribValues(const GU_Detail *gdp,
+                        const char *attrib_name,
+                        const char *group_name,
+                        int start,
+                        int end,
+                        int *count)
+{
+    std::vector<std::string>    result;
+
+    GA_Range                    range;
+
+    const GA_Attribute          *attrib;
+    GA_ROAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    const char                  *value;
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_POINT, attrib_name);
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    // Get the range of points to read.  Set the count to -1 to indicate the
+    // group is invalid.
+    if (!buildElementRange(gdp,
+                           GA_ATTRIB_POINT,
+                           group_name,
+                           start,
+                           end,
+                           range))
+    {
+        *count = -1;
+        return result;
+    }
+
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        value = s_t->getString(attrib, *it, 0);
+
+        // Elements without a value map to an empty string.
+        result.push_back(value ? value : "");
+    }
+
+    *count = result.size();
+
+    return result;
+}
+""",
+
+"""
+int
+setPointStringAttribValues(GU_Detail *gdp,
+                           const char *attrib_name,
+                           const char **values,
+                           int num_values,
+                           const char *group_name,
+                           int start,
+                           int end)
+{
+    int                         i=0;
+
+    GA_Range                    range;
+
+    GA_Attribute                *attrib;
+    GA_RWAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_POINT, attrib_name);
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    // Get the range of points to set.  Return 3 to indicate the group
+    // is invalid.
+    if (!buildElementRange(gdp,
+                           GA_ATTRIB_POINT,
+                           group_name,
+                           start,
+                           end,
+                           range))
+    {
+        return 3;
+    }
+
+    // Return 2 to indicate the number of values doesn't match the range.
+    if (range.getEntries() != num_values)
+    {
+        return 2;
+    }
+
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        s_t->setString(attrib, *it, values[i], 0);
+        i++;
+    }
+
+    // Return 0 to indicate success.
+    return 0;
+}
+""",
+
+"""
+int
+setSharedPointStringAttrib(GU_Detail *gdp,
+                           const char *attrib_name,
+                           const char *value,
+                           const char *group_name=0)
+{
+    GA_PointGroup               *group = 0;
+
+    GA_Attribute                *attrib;
+    GA_RWAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    // Find the point group if necessary.
+    if (group_name)
+    {
+        group = gdp->findPointGroup(group_name);
+    }
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(GA_ATTRIB_POINT, attrib_name);
+
+    // If it doesn't exist, return 1 to indicate we have an invalid attribute.
+    if (attrib_gah.isInvalid())
+    {
+        return 1;
+    }
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    if (group)
+    {
+        // Set all the points in the group to the value.
+        s_t->setString(attrib, GA_Range(*group), value, 0);
+    }
+    else
+    {
+        // Set all the points in the detail to the value.
+        s_t->setString(attrib, gdp->getPointRange(), value, 0);
+    }
+
+    // Return 0 to indicate success.
+    return 0;
+}
+""",
+
+"""
+StringArray
+stringAttribIndices(const GU_Detail *gdp,
+                    int mode,
+                    const char *attrib_name,
+                    int *indices,
+                    int *count,
+                    const char *group_name,
+                    int start,
+                    int end)
+{
+    int                         i = 0;
+
+    std::vector<std::string>    table;
+
+    GA_AttributeOwner           owner;
+    GA_Range                    range;
+    GA_StringIndexType          handle;
+
+    const GA_Attribute          *attrib;
+    GA_ROAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    const char                  *value;
+
+    // A mapping between string table handles and table indices.
+    std::map<GA_StringIndexType, int>   handle_map;
+    std::map<GA_StringIndexType, int>::const_iterator handle_it;
+
+    owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Get the range of elements to read.  Set the count to -1 to indicate
+    // the group is invalid.
+    if (!buildElementRange(gdp, owner, group_name, start, end, range))
+    {
+        *count = -1;
+        return table;
+    }
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(owner, attrib_name);
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        handle = s_t->getHandle(attrib, *it, 0);
+
+        handle_it = handle_map.find(handle);
+
+        // This is the first time we've seen this string so add it to the
+        // table.  Elements without a value map to an empty string.
+        if (handle_it == handle_map.end())
+        {
+            value = s_t->getString(attrib, *it, 0);
+
+            handle_it = handle_map.insert(
+                std::make_pair(handle, (int)table.size())
+            ).first;
+
+            table.push_back(value ? value : "");
+        }
+
+        indices[i++] = handle_it->second;
+    }
+
+    *count = i;
+
+    // If there are no strings, add an empty string.
+    if (table.size() == 0)
+    {
+        table.push_back("");
+    }
+
+    return table;
+}
+""",
+
+"""
+int
+setStringAttribIndices(GU_Detail *gdp,
+                       int mode,
+                       const char *attrib_name,
+                       const char **strings,
+                       int num_strings,
+                       const int *indices,
+                       int num_indices,
+                       const char *group_name,
+                       int start,
+                       int end)
+{
+    int                         i = 0, idx;
+
+    GA_AttributeOwner           owner;
+    GA_Range                    range;
+
+    GA_Attribute                *attrib;
+    GA_RWAttributeRef           attrib_gah;
+    const GA_AIFSharedStringTuple       *s_t;
+
+    // The string table handle of each string, once it has been added.
+    std::vector<GA_StringIndexType> handles(num_strings,
+                                            GA_INVALID_STRING_INDEX);
+
+    owner = mode ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Get the range of elements to set.  Return 4 to indicate the group is
+    // invalid.
+    if (!buildElementRange(gdp, owner, group_name, start, end, range))
+    {
+        return 4;
+    }
+
+    // Return 3 to indicate the number of indices doesn't match the range.
+    if (range.getEntries() != num_indices)
+    {
+        return 3;
+    }
+
+    // Try to find the string attribute.
+    attrib_gah = gdp->findStringTuple(owner, attrib_name);
+
+    // If it doesn't exist, return 1 to indicate we have an invalid attribute.
+    if (attrib_gah.isInvalid())
+    {
+        return 1;
+    }
+
+    // Get the actual attribute.
+    attrib = attrib_gah.getAttribute();
+
+    // Get a shared string tuple from the attribute.
+    s_t = attrib->getAIFSharedStringTuple();
+
+    // Check all the indices before writing anything so an invalid index
+    // doesn't leave the attribute partially set.
+    for (i=0; i < num_indices; ++i)
+    {
+        // Return 2 to indicate an invalid string index.
+        if (indices[i] < 0 || indices[i] >= num_strings)
+        {
+            return 2;
+        }
+    }
+
+    i = 0;
+
+    for (GA_Iterator it(range); !it.atEnd(); ++it)
+    {
+        idx = indices[i++];
+
+        // The first time a string is used it is added to the string table.
+        // After that the handle can be set directly.
+        if (handles[idx] == GA_INVALID_STRING_INDEX)
+        {
+            s_t->setString(attrib, *it, strings[idx], 0);
+            handles[idx] = s_t->getHandle(attrib, *it, 0);
+        }
+        else
+        {
+            s_t->setHandle(attrib, *it, handles[idx], 0);
+        }
+    }
+
+    // Return 0 to indicate success.
+    return 0;
+}
+""",
+
+"""
+bool
+addNormalAttribute(GU_Detail *gdp)
+{
+    GA_RWAttributeRef           n_gah;
+
+    n_gah = gdp->addNormalAttribute(GA_ATTRIB_POINT);
+
+    // Return true if the attribute was created.
+    if (n_gah.isValid())
+    {
+        return true;
+    }
+
+    // False otherwise.
+    return false;
+}
+""",
+
+"""
+bool
+addVelocityAttribute(GU_Detail *gdp)
+{
+    GA_RWAttributeRef           v_gah;
+
+    v_gah = gdp->addVelocityAttribute(GA_ATTRIB_POINT);
+
+    // Return true if the attribute was created.
+    if (v_gah.isValid())
+    {
+        return true;
+    }
+
+    // False otherwise.
+    return false;
+}
+""",
+
+"""
+bool
+addDiffuseAttribute(GU_Detail *gdp, int mode)
+{
+    GA_RWAttributeRef           diff_gah;
+
+    switch (mode)
+    {
+        case 0:
+            diff_gah = gdp->addDiffuseAttribute(GA_ATTRIB_POINT);
+            break;
+
+        case 1:
+            diff_gah = gdp->addDiffuseAttribute(GA_ATTRIB_PRIMITIVE);
+            break;
+
+        case 2:
+            diff_gah = gdp->addDiffuseAttribute(GA_ATTRIB_VERTEX);
+            break;
+
+        default:
+            break;
+    }
+
+    // Return true if the attribute was created.
+    if (diff_gah.isValid())
+    {
+        return true;
+    }
+
+    // False otherwise.
+    return false;
+}
+""",
+
+"""
+void
+computePointNormals(GU_Detail *gdp)
+{
+    gdp->normal();
+}
+""",
+]
+)
+
+
+# Methods for working with points, primitives and vertices.
+_topology_methods = _createLibrary(
+    "cpp_topology_methods",
+    acquire_hom_lock=True,
+    catch_crashes=True,
+    includes="""
+#include <GA/GA_PolyCounts.h>
+#include <GEO/GEO_Face.h>
+#include <GEO/GEO_PrimPoly.h>
+#include <GQ/GQ_Detail.h>
+#include <GU/GU_Detail.h>
+#include <GU/GU_PrimPoly.h>
+#include <UT/UT_ParallelUtil.h>
+
+#include <algorithm>
+
+// Set the positions of a block of points from a list of x, y and z values.
+template <typename T>
+class PositionWriter
+{
+public:
+    PositionWriter(GU_Detail *gdp, GA_Offset start, const T *positions)
+        : myHandle(gdp->getP()),
+          myStart(start),
+          myPositions(positions)
+    {
+    }
+
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end;
+        const T                 *pos;
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset ptOff=start; ptOff < end; ++ptOff)
+            {
+                pos = myPositions + (ptOff - myStart) * 3;
+                myHandle.set(ptOff, UT_Vector3(pos[0], pos[1], pos[2]));
+            }
+        }
+    }
+
+private:
+    GA_RWHandleV3               myHandle;
+    GA_Offset                   myStart;
+    const T                     *myPositions;
+};
+
+// Compute metrics for each primitive.  Metrics whose list is null are
+// skipped.
+class PrimMetricsBuilder
+{
+public:
+    PrimMetricsBuilder(const GU_Detail *gdp,
+                       double *area,
+                       double *perimeter,
+                       double *barycenter,
+                       double *bbox,
+                       double *normal)
+        : myGdp(gdp),
+          myArea(area),
+          myPerimeter(perimeter),
+          myBarycenter(barycenter),
+          myBBox(bbox),
+          myNormal(normal)
+    {
+    }
+
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end;
+        GA_Index                idx;
+        UT_BoundingBox          bbox;
+        UT_Vector3              vec;
+
+        const GEO_Primitive     *prim;
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset primOff=start; primOff < end; ++primOff)
+            {
+                prim = myGdp->getGEOPrimitive(primOff);
+                idx = myGdp->primitiveIndex(primOff);
+
+                if (myArea)
+                {
+                    myArea[idx] = prim->calcArea();
+                }
+
+                if (myPerimeter)
+                {
+                    myPerimeter[idx] = prim->calcPerimeter();
+                }
+
+                if (myBarycenter)
+                {
+                    vec = prim->baryCenter();
+
+                    for (int i=0; i < 3; ++i)
+                    {
+                        myBarycenter[idx * 3 + i] = vec[i];
+                    }
+                }
+
+                if (myBBox)
+                {
+                    prim->getBBox(&bbox);
+
+                    for (int i=0; i < 3; ++i)
+                    {
+                        myBBox[idx * 6 + i] = bbox.minvec()[i];
+                        myBBox[idx * 6 + 3 + i] = bbox.maxvec()[i];
+                    }
+                }
+
+                if (myNormal)
+                {
+                    vec = prim->computeNormal();
+
+                    for (int i=0; i < 3; ++i)
+                    {
+                        myNormal[idx * 3 + i] = vec[i];
+                    }
+                }
+            }
+        }
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    double                      *myArea;
+    double                      *myPerimeter;
+    double                      *myBarycenter;
+    double                      *myBBox;
+    double                      *myNormal;
+};
+
+// Append a block of points and set their positions.
+template <typename T>
+static int
+createPointBlock(GU_Detail *gdp, const T *positions, int count)
+{
+    GA_Offset                   start;
+
+    // Nothing to create.
+    if (count <= 0)
+    {
+        return gdp->getNumPoints();
+    }
+
+    // Add all the points at once so their offsets are contiguous.
+    start = gdp->appendPointBlock(count);
+
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(gdp->getPointMap(), start, start + count)),
+        PositionWriter<T>(gdp, start, positions)
+    );
+
+    gdp->getP()->bumpDataId();
+
+    // Return the number of the first point.
+    return gdp->pointIndex(start);
+}
+""",
+    structs=[
+        ("IntArray", "*i"),
+        ("VertexMap", (("prims", "*i"), ("indices", "*i"))),
+        ("Position3D", (("x", "d"), ("y", "d"), ("z", "d"))),
+        ("BoundingBox", (
+            ("xmin", "d"),
+            ("ymin", "d"),
+            ("zmin", "d"),
+            ("xmax", "d"),
+            ("ymax", "d"),
+            ("zmax", "d")
+            )
+        ),
+    ],
+    function_sources=[
+"""
+int
+createPoint(GU_Detail *gdp, UT_Vector3D *position)
+{
+    GA_Offset                   ptOff;
+
+    // Add a new point.
+    ptOff = gdp->appendPointOffset();
+
+    // Set the position for the point.
+    gdp->setPos3(ptOff, *position);
+
+    // Return the point number.
+    return gdp->pointIndex(ptOff);
+}
+""",
+
+"""
+IntArray
+createPoints(GU_Detail *gdp, int count)
+{
+    std::vector<int>            point_nums;
+
+    GA_Offset                   ptOff;
+
+    for (int i=0; i < count; ++i)
+    {
+        ptOff = gdp->appendPointOffset();
+        point_nums.push_back(gdp->pointIndex(ptOff));
+    }
+
+    return point_nums;
+}
+""",
+
+"""
+void
+primMetrics(const GU_Detail *gdp,
+            double *area,
+            double *perimeter,
+            double *barycenter,
+            double *bbox,
+            double *normal)
+{
+    UTparallelFor(
+        GA_SplittableRange(gdp->getPrimitiveRange()),
+        PrimMetricsBuilder(gdp, area, perimeter, barycenter, bbox, normal)
+    );
+}
+""",
+
+"""
+int
+createPointsFromPositions(GU_Detail *gdp, const float *positions, int count)
+{
+    return createPointBlock(gdp, positions, count);
+}
+""",
+
+"""
+int
+createPointsFromDoublePositions(GU_Detail *gdp,
+                                const double *positions,
+                                int count)
+{
+    return createPointBlock(gdp, positions, count);
+}
+""",
+
+"""
+int
+createPolygonsFromArrays(GU_Detail *gdp,
+                         const int *point_nums,
+                         int num_point_nums,
+                         const int *vertex_counts,
+                         int num_polys,
+                         int closed)
+{
+    GA_Offset                   primOff;
+    GA_PolyCounts               counts;
+    GU_PrimPoly                 *poly;
+
+    exint                       num_vertices = 0;
+
+    const GA_IndexMap &point_map = gdp->getPointMap();
+
+    exint num_points = point_map.indexSize();
+
+    // Check each polygon has vertices.
+    for (int i=0; i < num_polys; ++i)
+    {
+        if (vertex_counts[i] < 1)
+        {
+            return -1;
+        }
+
+        counts.append(vertex_counts[i]);
+        num_vertices += vertex_counts[i];
+    }
+
+    // Check there is a point for every vertex.
+    if (num_vertices != num_point_nums)
+    {
+        return -2;
+    }
+
+    // Check the points exist.
+    for (int i=0; i < num_point_nums; ++i)
+    {
+        if (point_nums[i] < 0 || point_nums[i] >= num_points)
+        {
+            return -3;
+        }
+    }
+
+    // Nothing to create.
+    if (!num_polys)
+    {
+        return gdp->getNumPrimitives();
+    }
+
+    // If point numbers and offsets are the same all the polygons can be
+    // built as a single block.
+    if (point_map.isTrivialMap())
+    {
+        primOff = GEO_PrimPoly::buildBlock(
+            gdp,
+            GA_Offset(0),
+            num_points,
+            counts,
+            point_nums,
+            closed
+        );
+
+        return gdp->primitiveIndex(primOff);
+    }
+
+    // Build each polygon, converting the point numbers to offsets.
+    for (int i=0; i < num_polys; ++i)
+    {
+        poly = GU_PrimPoly::build(gdp, vertex_counts[i], !closed, false);
+
+        for (int j=0; j < vertex_counts[i]; ++j)
+        {
+            poly->setVertexPoint(j, point_map.offsetFromIndex(*point_nums));
+            ++point_nums;
+        }
+
+        if (!i)
+        {
+            primOff = poly->getMapOffset();
+        }
+    }
+
+    return gdp->primitiveIndex(primOff);
+}
+""",
+
+"""
+IntArray
+pointAdjacentPolygons(GU_Detail *gdp, int prim_num)
+{
+    std::vector<int>            prim_nums;
+
+    GA_Offset                   primOff;
+    GA_OffsetArray              prims;
+    GA_OffsetArray::const_iterator prims_it;
+
+    // Find the offset for this primitive.
+    primOff = gdp->primitiveOffset(prim_num);
+
+    // Get a list of point adjacent polygons.
+    gdp->getPointAdjacentPolygons(prims, primOff);
+
+    // Add the adjacent prim numbers to the list.
+    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
+    {
+        prim_nums.push_back(gdp->primitiveIndex(*prims_it));
+    }
+
+    return prim_nums;
+}
+""",
+
+"""
+IntArray
+edgeAdjacentPolygons(GU_Detail *gdp, int prim_num)
+{
+    std::vector<int>            prim_nums;
+
+    GA_Offset                   primOff;
+    GA_OffsetArray              prims;
+    GA_OffsetArray::const_iterator prims_it;
+
+    // Find the offset for this primitive.
+    primOff = gdp->primitiveOffset(prim_num);
+
+    // Get a list of edge adjacent polygons.
+    gdp->getEdgeAdjacentPolygons(prims, primOff);
+
+    // Add the adjacent prim numbers to the list.
+    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
+    {
+        prim_nums.push_back(gdp->primitiveIndex(*prims_it));
+    }
+
+    return prim_nums;
+}
+""",
+
+"""
+int
+primAdjacencyOffsets(GU_Detail *gdp, int mode, int *offsets, int64 *count)
+{
+    exint                       total = 0;
+
+    GA_Index                    primIdx = 0;
+    GA_OffsetArray              prims;
+
+    offsets[0] = 0;
+
+    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
+    {
+        // Get a list of edge adjacent polygons.
+        if (mode)
+        {
+            gdp->getEdgeAdjacentPolygons(prims, *it);
+        }
+        // Get a list of point adjacent polygons.
+        else
+        {
+            gdp->getPointAdjacentPolygons(prims, *it);
+        }
+
+        total += prims.entries();
+
+        // Return 1 to indicate there are too many neighbors to store.
+        if (total > SYS_INT32_MAX)
+        {
+            return 1;
+        }
+
+        // Store where the next primitive's neighbors will start.
+        offsets[++primIdx] = total;
+    }
+
+    // Store the exact total number of neighbors.
+    *count = total;
+
+    return 0;
+}
+""",
+
+"""
+void
+primAdjacencyNeighbors(GU_Detail *gdp, int mode, int *neighbors)
+{
+    exint                       i = 0;
+
+    GA_OffsetArray              prims;
+    GA_OffsetArray::const_iterator prims_it;
+
+    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
+    {
+        // Get a list of edge adjacent polygons.
+        if (mode)
+        {
+            gdp->getEdgeAdjacentPolygons(prims, *it);
+        }
+        // Get a list of point adjacent polygons.
+        else
+        {
+            gdp->getPointAdjacentPolygons(prims, *it);
+        }
+
+        // Add the adjacent prim numbers to the flat list.
+        for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
+        {
+            neighbors[i++] = gdp->primitiveIndex(*prims_it);
+        }
+    }
+}
+""",
+
+"""
+IntArray
+connectedPrims(const GU_Detail *gdp, int pt_num)
+{
+    std::vector<int>    prim_nums;
+
+    GA_Offset           ptOff;
+    GA_OffsetArray      prims;
+    GA_OffsetArray::const_iterator prims_it;
+
+    // Get the selected point offset.
+    ptOff = gdp->pointOffset(pt_num);
+
+    // Get all the primitives referencing this point.
+    gdp->getPrimitivesReferencingPoint(prims, ptOff);
+
+    // Add all the primitive numbers to the list.
+    for (prims_it = prims.begin(); !prims_it.atEnd(); ++prims_it)
+    {
+        prim_nums.push_back(gdp->primitiveIndex(*prims_it));
+    }
+
+    return prim_nums;
+}
+""",
+
+"""
+IntArray
+connectedPoints(const GU_Detail *gdp, int pt_num)
+{
+    std::vector<int>            pt_nums;
+
+    GA_Offset                   ptOff;
+    GA_OffsetArray              prims;
+
+    GA_Range                    pt_range;
+
+    const GEO_Primitive         *prim;
+
+    // The list of primitives in the geometry.
+    const GA_PrimitiveList &prim_list = gdp->getPrimitiveList();
+
+    ptOff = gdp->pointOffset(pt_num);
+
+    // Get the primitives referencing the point.
+    gdp->getPrimitivesReferencingPoint(prims, ptOff);
+
+    // Build a range for those primitives.
+    GA_Range pr_range(gdp->getPrimitiveMap(), prims);
+
+    for (GA_Iterator pr_it(pr_range.begin()); !pr_it.atEnd(); ++pr_it)
+    {
+        prim = (GEO_Primitive *)prim_list.get(*pr_it);
+
+        // Get the points referenced by the vertices of the primitive.
+        pt_range = prim->getPointRange();
+
+        for (GA_Iterator pt_it(pt_range.begin()); !pt_it.atEnd(); ++pt_it)
+        {
+            // Build an edge between the source point and this point on the
+            // primitive.
+            GA_Edge edge(ptOff, *pt_it);
+            // If there is an edge between those 2 points, add the point
+            // to the list.
+            if (prim->hasEdge(edge))
+            {
+                pt_nums.push_back(gdp->pointIndex(*pt_it));
+            }
+        }
+    }
+
+    return pt_nums;
+}
+""",
+
+"""
+int
+vertexCount(const GU_Detail *gdp)
+{
+    return gdp->getNumVertices();
+}
+""",
+
+"""
+int
+pointGraph(const GU_Detail *gdp, int *sources, int *targets)
+{
+    int                         num_verts;
+    exint                       pt1, pt2;
+
+    const GEO_Face              *face;
+
+    std::vector<exint>          edges;
+    std::vector<exint>::const_iterator edges_it, edges_end;
+
+    // Faces can't have more edges than vertices.
+    edges.reserve(gdp->getNumVertices());
+
+    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
+    {
+        // Only faces have edges.
+        face = dynamic_cast<const GEO_Face *>(gdp->getGEOPrimitive(*it));
+
+        if (!face)
+        {
+            continue;
+        }
+
+        num_verts = face->getVertexCount();
+
+        // Open faces don't have an edge between the last and first vertex.
+        for (int i=0; i < face->getEdgeCount(); ++i)
+        {
+            pt1 = gdp->pointIndex(face->getPointOffset(i));
+            pt2 = gdp->pointIndex(face->getPointOffset((i + 1) % num_verts));
+
+            // Ignore degenerate edges.
+            if (pt1 == pt2)
+            {
+                continue;
+            }
+
+            // Encode the edge with the lower point number first so shared
+            // edges produce the same value.
+            if (pt1 > pt2)
+            {
+                std::swap(pt1, pt2);
+            }
+
+            edges.push_back((pt1 << 32) | pt2);
+        }
+    }
+
+    // Sort the edges so duplicates are next to each other and remove them.
+    UTparallelSort(edges.begin(), edges.end());
+    edges_end = std::unique(edges.begin(), edges.end());
+
+    int i = 0;
+
+    for (edges_it = edges.begin(); edges_it != edges_end; ++edges_it)
+    {
+        sources[i] = (int)(*edges_it >> 32);
+        targets[i] = (int)(*edges_it & 0xFFFFFFFF);
+        i++;
+    }
+
+    // Return the number of unique edges.
+    return i;
+}
+""",
+
+"""
+VertexMap
+referencingVertices(const GU_Detail *gdp, int pt_num)
+{
+    std::vector<int>            prim_indices, vert_indices;
+
+    GA_Index                    primIdx;
+    GA_Offset                   ptOff, primOff, vtxOff;
+    GA_OffsetArray              vertices;
+
+    const GA_Primitive          *prim;
+
+    GA_OffsetArray::const_iterator vert_it;
+
+    ptOff = gdp->pointOffset(pt_num);
+    gdp->getVerticesReferencingPoint(vertices, ptOff);
+
+    const GA_PrimitiveList &prim_list = gdp->getPrimitiveList();
+
+    for (vert_it = vertices.begin(); !vert_it.atEnd(); ++vert_it)
+    {
+        vtxOff = *vert_it;
+
+        primOff = gdp->vertexPrimitive(vtxOff);
+        primIdx = gdp->primitiveIndex(primOff);
+        prim = prim_list.get(primOff);
+
+        for (unsigned i=0; i < prim->getVertexCount(); ++i)
+        {
+            if (prim->getVertexOffset(i) == vtxOff)
+            {
+                prim_indices.push_back(primIdx);
+                vert_indices.push_back(i);
+            }
+        }
+    }
+
+    VertexMap vert_map;
+    vert_map.prims.set(prim_indices);
+    vert_map.indices.set(vert_indices);
+
+    return vert_map;
+}
+""",
+
+"""
+void
+pointToVertexIndex(const GU_Detail *gdp,
+                   int *offsets,
+                   int *prims,
+                   int *indices)
+{
+    int                         num_points, pos;
+
+    GA_Index                    primIdx, ptIdx;
+
+    const GA_Primitive          *prim;
+
+    std::vector<int>            positions;
+
+    const GA_PrimitiveList &prim_list = gdp->getPrimitiveList();
+
+    num_points = gdp->getNumPoints();
+
+    std::fill(offsets, offsets + num_points + 1, 0);
+
+    // Count the number of vertices referencing each point.
+    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
+    {
+        prim = prim_list.get(*it);
+
+        for (unsigned i=0; i < prim->getVertexCount(); ++i)
+        {
+            ptIdx = gdp->pointIndex(prim->getPointOffset(i));
+            offsets[ptIdx + 1]++;
+        }
+    }
+
+    // Convert the counts to the start position of each point's entries.
+    for (int i=0; i < num_points; ++i)
+    {
+        offsets[i + 1] += offsets[i];
+    }
+
+    // The next free position for each point.
+    positions.assign(offsets, offsets + num_points);
+
+    // Store the primitive and vertex index in each point's entries.
+    for (GA_Iterator it(gdp->getPrimitiveRange()); !it.atEnd(); ++it)
+    {
+        primIdx = gdp->primitiveIndex(*it);
+        prim = prim_list.get(*it);
+
+        for (unsigned i=0; i < prim->getVertexCount(); ++i)
+        {
+            ptIdx = gdp->pointIndex(prim->getPointOffset(i));
+            pos = positions[ptIdx]++;
+
+            prims[pos] = primIdx;
+            indices[pos] = i;
+        }
+    }
+}
+""",
+
+"""
+bool
+hasEdge(const GU_Detail *gdp,
+        unsigned prim_num,
+        unsigned pt_num1,
+        unsigned pt_num2)
+{
+    GA_Offset                   primOff, ptOff1, ptOff2;
+
+    const GEO_Face              *face;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    ptOff1 = gdp->pointOffset(pt_num1);
+    ptOff2 = gdp->pointOffset(pt_num2);
+
+    face = (GEO_Face *)gdp->getPrimitiveList().get(primOff);
+
+    // Build an edge between the the two points.
+    GA_Edge edge(ptOff1, ptOff2);
+
+    return face->hasEdge(edge);
+}
+""",
+
+"""
+void
+insertVertex(GU_Detail *gdp,
+             unsigned prim_num,
+             unsigned pt_num,
+             unsigned idx)
+{
+    GA_Offset                   ptOff, primOff;
+
+    GEO_Face                    *face;
+
+    ptOff = gdp->pointOffset(pt_num);
+    primOff = gdp->primitiveOffset(prim_num);
+
+    face = (GEO_Face *)gdp->getPrimitiveList().get(primOff);
+
+    face->insertVertex(ptOff, idx);
+}
+""",
+
+"""
+void
+deleteVertex(GU_Detail *gdp, unsigned prim_num, unsigned idx)
+{
+    GA_Offset                   primOff;
+
+    GEO_Face                    *face;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    face = (GEO_Face *)gdp->getPrimitiveList().get(primOff);
+
+    face->deleteVertex(idx);
+}
+""",
+
+"""
+void
+setPoint(GU_Detail *gdp, unsigned prim_num, unsigned idx, unsigned pt_num)
+{
+    GA_Offset                   ptOff, primOff;
+
+    GA_Primitive                *prim;
+
+    ptOff = gdp->pointOffset(pt_num);
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GA_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    prim->setPointOffset(idx, ptOff);
+}
+""",
+
+"""
+Position3D
+baryCenter(const GU_Detail *gdp, unsigned prim_num)
+{
+    GA_Offset                   primOff;
+
+    const GEO_Primitive         *prim;
+
+    UT_Vector3                  center;
+
+    Position3D                  pos;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    center = prim->baryCenter();
+
+    pos.x = center.x();
+    pos.y = center.y();
+    pos.z = center.z();
+
+    return pos;
+}
+""",
+
+"""
+double
+primitiveArea(const GU_Detail *gdp, unsigned prim_num)
+{
+    GA_Offset                   primOff;
+
+    const GA_Primitive         *prim;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GA_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    return prim->calcArea();
+}
+""",
+
+"""
+double
+perimeter(const GU_Detail *gdp, unsigned prim_num)
+{
+    GA_Offset                   primOff;
+
+    const GA_Primitive         *prim;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GA_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    return prim->calcPerimeter();
+}
+""",
+
+"""
+void
+reversePrimitive(const GU_Detail *gdp, unsigned prim_num)
+{
+    GA_Offset                   primOff;
+
+    GEO_Primitive               *prim;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    return prim->reverse();
+}
+""",
+
+"""
+void
+makeUnique(GU_Detail *gdp, unsigned prim_num)
+{
+    GA_Offset                   primOff;
+
+    GEO_Primitive               *prim;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    gdp->uniquePrimitive(prim);
+}
+""",
+
+"""
+BoundingBox
+boundingBox(const GU_Detail *gdp, unsigned prim_num)
+{
+    GA_Offset                   primOff;
+
+    const GEO_Primitive         *prim;
+
+    UT_BoundingBox              bbox;
+
+    BoundingBox                 bound;
+
+    primOff = gdp->primitiveOffset(prim_num);
+
+    prim = (GEO_Primitive *)gdp->getPrimitiveList().get(primOff);
+
+    prim->getBBox(&bbox);
+
+    bound.xmin = bbox.xmin();
+    bound.ymin = bbox.ymin();
+    bound.zmin = bbox.zmin();
+
+    bound.xmax = bbox.xmax();
+    bound.ymax = bbox.ymax();
+    bound.zmax = bbox.zmax();
+
+    return bound;
+}
+""",
+
+"""
+void
+convexPolygons(GU_Detail *gdp, unsigned maxpts=3)
+{
+    gdp->convex(maxpts);
+}
+""",
+
+"""
+void
+destroyUnusedPoints(GU_Detail *gdp, const char *group_name)
+{
+    GA_PointGroup               *group = 0;
+
+    // If we passed in a valid group, try to find it.
+    if (group_name)
+    {
+        group = gdp->findPointGroup(group_name);
+    }
+
+    gdp->destroyUnusedPoints(group);
+}
+""",
+
+"""
+void
+consolidatePoints(GU_Detail *gdp, double distance, const char *group_name)
+{
+    GA_PointGroup               *group = 0;
+
+    if (group_name)
+    {
+        group = gdp->findPointGroup(group_name);
+    }
+
+    gdp->fastConsolidatePoints(distance, group);
+}
+""",
+
+"""
+void
+uniquePoints(GU_Detail *gdp, const char *group_name, int group_type)
+{
+    GA_ElementGroup             *group = 0;
+
+    if (group_name)
+    {
+        if (group_type)
+        {
+            group = gdp->findPrimitiveGroup(group_name);
+        }
+        else
+        {
+            group = gdp->findPointGroup(group_name);
+        }
+    }
+
+    gdp->uniquePoints(group);
+}
+""",
+
+"""
+void
+clip(GU_Detail *gdp, UT_Vector3D *normal, float dist)
+{
+    UT_Vector3 dir(*normal);
+
+    GQ_Detail                   *gqd = new GQ_Detail(gdp);
+
+    gqd->clip(dir, dist, 0);
+    delete gqd;
+}
+""",
+]
+)
+
+
+# Methods for working with point and primitive groups.
+_group_methods = _createLibrary(
+    "cpp_group_methods",
+    acquire_hom_lock=True,
+    catch_crashes=True,
+    includes="""
+#include <GA/GA_SplittableRange.h>
+#include <GU/GU_Detail.h>
+#include <UT/UT_BitArray.h>
+#include <UT/UT_ParallelUtil.h>
+#include <UT/UT_ThreadSpecificValue.h>
+
+#include <algorithm>
+#include <vector>
+
+typedef UT_ThreadSpecificValue<UT_BitArray> ThreadBitArrays;
+
+// Get the bit array for the current thread, making sure it is large enough
+// for every offset.
+static inline UT_BitArray &
+getThreadBits(ThreadBitArrays &thread_bits, exint size)
+{
+    UT_BitArray &bits = thread_bits.get();
+
+    if (bits.size() != size)
+    {
+        bits.resize(size);
+        bits.setAllBits(false);
+    }
+
+    return bits;
+}
+
+// Combine the bit arrays of all the threads.
+static void
+mergeThreadBits(ThreadBitArrays &thread_bits, exint size, UT_BitArray &bits)
+{
+    bits.resize(size);
+    bits.setAllBits(false);
+
+    for (ThreadBitArrays::iterator it=thread_bits.begin();
+         it != thread_bits.end();
+         ++it)
+    {
+        // Threads that did no work have empty arrays.
+        if (it.get().size() == size)
+        {
+            bits |= it.get();
+        }
+    }
+}
+
+// Build a range of the offsets of all the set bits.
+static GA_Range
+buildBitsRange(const GA_IndexMap &index_map, const UT_BitArray &bits)
+{
+    GA_OffsetList               offsets;
+
+    for (exint i=bits.iterateInit(); i >= 0; i=bits.iterateNext(i))
+    {
+        offsets.append(GA_Offset(i));
+    }
+
+    return GA_Range(index_map, offsets);
+}
+
+// Add the offsets of all the set bits to a group in a single range.  The
+// group's data id is bumped since it may be an existing group.
+static void
+addBitsToGroup(GA_ElementGroup *group, const UT_BitArray &bits)
+{
+    group->addRange(buildBitsRange(group->getIndexMap(), bits));
+
+    group->bumpDataId();
+}
+
+// Mark the points used by primitives, using a bit array for each thread.
+class PrimPointMarker
+{
+public:
+    PrimPointMarker(const GU_Detail *gdp, ThreadBitArrays &thread_bits)
+        : myGdp(gdp),
+          myThreadBits(thread_bits)
+    {
+    }
+
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end;
+
+        const GA_Primitive      *prim;
+
+        UT_BitArray &points = getThreadBits(
+            myThreadBits,
+            myGdp->getNumPointOffsets()
+        );
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset primOff=start; primOff < end; ++primOff)
+            {
+                prim = myGdp->getPrimitive(primOff);
+
+                for (GA_Size i=0; i < prim->getVertexCount(); ++i)
+                {
+                    points.setBitFast(prim->getPointOffset(i), true);
+                }
+            }
+        }
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    ThreadBitArrays             &myThreadBits;
+};
+
+// Mark the primitives that reference points, using a bit array for each
+// thread.
+class PointPrimMarker
+{
+public:
+    PointPrimMarker(const GU_Detail *gdp, ThreadBitArrays &thread_bits)
+        : myGdp(gdp),
+          myThreadBits(thread_bits)
+    {
+    }
+
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end, vtxOff;
+
+        UT_BitArray &prims = getThreadBits(
+            myThreadBits,
+            myGdp->getNumPrimitiveOffsets()
+        );
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset ptOff=start; ptOff < end; ++ptOff)
+            {
+                // Visit each vertex referencing the point.
+                for (vtxOff = myGdp->pointVertex(ptOff);
+                     GAisValid(vtxOff);
+                     vtxOff = myGdp->vertexToNextVertex(vtxOff))
+                {
+                    prims.setBitFast(myGdp->vertexPrimitive(vtxOff), true);
+                }
+            }
+        }
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    ThreadBitArrays             &myThreadBits;
+};
+
+// Evaluate a boolean expression of groups for each element.  The program is
+// in reverse polish notation where non-negative values push the membership
+// of a group and negative values are the operators NOT (-1), AND (-2),
+// OR (-3) and XOR (-4).
+class GroupExpressionEvaluator
+{
+public:
+    GroupExpressionEvaluator(
+        const std::vector<const GA_ElementGroup *> &groups,
+        const int *program,
+        int program_size,
+        UT_BitArray &result)
+        : myGroups(groups),
+          myProgram(program),
+          myProgramSize(program_size),
+          myResult(result)
+    {
+    }
+
+    void operator()(const GA_SplittableRange &range) const
+    {
+        GA_Offset               start, end;
+        int                     code, top;
+
+        std::vector<char>       stack(myProgramSize);
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset elemOff=start; elemOff < end; ++elemOff)
+            {
+                top = 0;
+
+                for (int i=0; i < myProgramSize; ++i)
+                {
+                    code = myProgram[i];
+
+                    // Push the membership of a group.
+                    if (code >= 0)
+                    {
+                        stack[top++] = myGroups[code]->containsOffset(elemOff);
+                    }
+                    else if (code == -1)
+                    {
+                        stack[top - 1] = !stack[top - 1];
+                    }
+                    else
+                    {
+                        --top;
+
+                        if (code == -2)
+                        {
+                            stack[top - 1] = stack[top - 1] && stack[top];
+                        }
+                        else if (code == -3)
+                        {
+                            stack[top - 1] = stack[top - 1] || stack[top];
+                        }
+                        else
+                        {
+                            stack[top - 1] = stack[top - 1] != stack[top];
+                        }
+                    }
+                }
+
+                // Ranges are only split on page boundaries, which are a
+                // multiple of the bit array word size, so no two threads
+                // write to the same word.
+                if (stack[0])
+                {
+                    myResult.setBitFast(elemOff, true);
+                }
+            }
+        }
+    }
+
+private:
+    const std::vector<const GA_ElementGroup *> &myGroups;
+    const int                   *myProgram;
+    int                         myProgramSize;
+    UT_BitArray                 &myResult;
+};
+
+// Pack the membership of a group into bytes indexed by element number.  The
+// first element of each byte is stored in the lowest bit.
+class MembershipPacker
+{
+public:
+    MembershipPacker(const GA_ElementGroup *group, char *bits)
+        : myGroup(group),
+          myBits(bits)
+    {
+    }
+
+    void operator()(const UT_BlockedRange<exint> &range) const
+    {
+        exint                   idx;
+        unsigned char           byte;
+
+        const GA_IndexMap &index_map = myGroup->getIndexMap();
+
+        exint num_elements = index_map.indexSize();
+
+        // Each task handles whole bytes so no two threads write to the same
+        // byte.
+        for (exint i=range.begin(); i < range.end(); ++i)
+        {
+            byte = 0;
+
+            for (int j=0; j < 8; ++j)
+            {
+                idx = i * 8 + j;
+
+                if (idx >= num_elements)
+                {
+                    break;
+                }
+
+                if (myGroup->containsOffset(index_map.offsetFromIndex(idx)))
+                {
+                    byte |= 1 << j;
+                }
+            }
+
+            myBits[i] = byte;
+        }
+    }
+
+private:
+    const GA_ElementGroup       *myGroup;
+    char                        *myBits;
+};
+
+// Mark the offsets of the elements whose bits are set in bytes indexed by
+// element number, using a bit array for each thread.
+class MembershipUnpacker
+{
+public:
+    MembershipUnpacker(const GA_IndexMap &index_map,
+                       const char *bits,
+                       ThreadBitArrays &thread_bits)
+        : myIndexMap(index_map),
+          myBits(bits),
+          myThreadBits(thread_bits)
+    {
+    }
+
+    void operator()(const UT_BlockedRange<exint> &range) const
+    {
+        exint                   idx;
+        unsigned char           byte;
+
+        exint num_elements = myIndexMap.indexSize();
+
+        UT_BitArray &offsets = getThreadBits(
+            myThreadBits,
+            myIndexMap.offsetSize()
+        );
+
+        for (exint i=range.begin(); i < range.end(); ++i)
+        {
+            byte = myBits[i];
+
+            for (int j=0; j < 8 && byte; ++j)
+            {
+                idx = i * 8 + j;
+
+                if (idx < num_elements && byte & (1 << j))
+                {
+                    offsets.setBitFast(myIndexMap.offsetFromIndex(idx), true);
+                }
+            }
+        }
+    }
+
+private:
+    const GA_IndexMap           &myIndexMap;
+    const char                  *myBits;
+    ThreadBitArrays             &myThreadBits;
+};
+
+// Count the elements shared by each pair of groups in parallel, using a
+// matrix of counts for each task.  The diagonal holds the size of each
+// group.
+class GroupOverlapCounter
+{
+public:
+    GroupOverlapCounter(const std::vector<const GA_ElementGroup *> &groups)
+        : myGroups(groups),
+          myCounts(groups.size() * groups.size(), 0)
+    {
+    }
+
+    GroupOverlapCounter(const GroupOverlapCounter &src, UT_Split)
+        : myGroups(src.myGroups),
+          myCounts(src.myCounts.size(), 0)
+    {
+    }
+
+    void operator()(const GA_SplittableRange &range)
+    {
+        GA_Offset               start, end;
+
+        std::vector<int>        members;
+
+        int num_groups = myGroups.size();
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset elemOff=start; elemOff < end; ++elemOff)
+            {
+                members.clear();
+
+                // Find the groups containing the element.
+                for (int i=0; i < num_groups; ++i)
+                {
+                    if (myGroups[i]->containsOffset(elemOff))
+                    {
+                        members.push_back(i);
+                    }
+                }
+
+                for (size_t a=0; a < members.size(); ++a)
+                {
+                    for (size_t b=0; b < members.size(); ++b)
+                    {
+                        myCounts[members[a] * num_groups + members[b]] += 1;
+                    }
+                }
+            }
+        }
+    }
+
+    void join(const GroupOverlapCounter &other)
+    {
+        for (size_t i=0; i < myCounts.size(); ++i)
+        {
+            myCounts[i] += other.myCounts[i];
+        }
+    }
+
+    const std::vector<int64> & getCounts() const
+    {
+        return myCounts;
+    }
+
+private:
+    const std::vector<const GA_ElementGroup *> &myGroups;
+    std::vector<int64>          myCounts;
+};
+
+// Mark the points used by the primitives in a group.  Each point is only
+// marked once no matter how many primitives share it.
+static void
+markPrimGroupPoints(const GU_Detail *gdp,
+                    const GA_PrimitiveGroup *group,
+                    UT_BitArray &points)
+{
+    ThreadBitArrays             thread_bits;
+
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(*group)),
+        PrimPointMarker(gdp, thread_bits)
+    );
+
+    mergeThreadBits(thread_bits, gdp->getNumPointOffsets(), points);
+}
+
+// Mark the primitives that reference the points in a group.  Each primitive
+// is only marked once no matter how many of its points are in the group.
+static void
+markPointGroupPrims(const GU_Detail *gdp,
+                    const GA_PointGroup *group,
+                    UT_BitArray &prims)
+{
+    ThreadBitArrays             thread_bits;
+
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(*group)),
+        PointPrimMarker(gdp, thread_bits)
+    );
+
+    mergeThreadBits(thread_bits, gdp->getNumPrimitiveOffsets(), prims);
+}
+
+// Compute the bounds of a range of points in parallel.
+class PointBoundsReducer
+{
+public:
+    PointBoundsReducer(const GU_Detail *gdp)
+        : myGdp(gdp)
+    {
+        myBBox.initBounds();
+    }
+
+    PointBoundsReducer(const PointBoundsReducer &src, UT_Split)
+        : myGdp(src.myGdp)
+    {
+        myBBox.initBounds();
+    }
+
+    void operator()(const GA_SplittableRange &range)
+    {
+        GA_Offset               start, end;
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset ptOff=start; ptOff < end; ++ptOff)
+            {
+                myBBox.enlargeBounds(myGdp->getPos3(ptOff));
+            }
+        }
+    }
+
+    void join(const PointBoundsReducer &other)
+    {
+        myBBox.enlargeBounds(other.myBBox);
+    }
+
+    const UT_BoundingBox & getBBox() const
+    {
+        return myBBox;
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    UT_BoundingBox              myBBox;
+};
+
+// Compute the bounds of primitives in parallel using each primitive's own
+// bounds.
+class PrimBoundsReducer
+{
+public:
+    PrimBoundsReducer(const GU_Detail *gdp)
+        : myGdp(gdp)
+    {
+        myBBox.initBounds();
+    }
+
+    PrimBoundsReducer(const PrimBoundsReducer &src, UT_Split)
+        : myGdp(src.myGdp)
+    {
+        myBBox.initBounds();
+    }
+
+    void operator()(const GA_SplittableRange &range)
+    {
+        GA_Offset               start, end;
+        UT_BoundingBox          bbox;
+
+        for (GA_Iterator it(range); it.blockAdvance(start, end); )
+        {
+            for (GA_Offset primOff=start; primOff < end; ++primOff)
+            {
+                myGdp->getGEOPrimitive(primOff)->getBBox(&bbox);
+                myBBox.enlargeBounds(bbox);
+            }
+        }
+    }
+
+    void join(const PrimBoundsReducer &other)
+    {
+        myBBox.enlargeBounds(other.myBBox);
+    }
+
+    const UT_BoundingBox & getBBox() const
+    {
+        return myBBox;
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    UT_BoundingBox              myBBox;
+};
+
+// Compute the bounds of a point group, or all the points if there is no
+// group.
+static UT_BoundingBox
+pointGroupBounds(const GU_Detail *gdp, const GA_PointGroup *group)
+{
+    PointBoundsReducer reducer(gdp);
+
+    if (group)
+    {
+        UTparallelReduce(GA_SplittableRange(GA_Range(*group)), reducer);
+    }
+    else
+    {
+        UTparallelReduce(GA_SplittableRange(gdp->getPointRange()), reducer);
+    }
+
+    return reducer.getBBox();
+}
+
+// Compute the bounds of a primitive group, or all the primitives if there
+// is no group.
+static UT_BoundingBox
+primGroupBounds(const GU_Detail *gdp, const GA_PrimitiveGroup *group)
+{
+    UT_BitArray                 points;
+
+    bool only_polys = gdp->countPrimitiveType(GA_PRIMPOLY)
+        == gdp->getNumPrimitives();
+
+    // Polygons are bounded by their points so if there are only polygons
+    // the points used by the group can be marked in parallel and each shared
+    // point only visited once.
+    if (group && only_polys)
+    {
+        markPrimGroupPoints(gdp, group, points);
+
+        PointBoundsReducer reducer(gdp);
+
+        UTparallelReduce(
+            GA_SplittableRange(buildBitsRange(gdp->getPointMap(), points)),
+            reducer
+        );
+
+        return reducer.getBBox();
+    }
+
+    // Other primitives can extend past their points so use their own
+    // bounds.
+    GA_Range range = group ? GA_Range(*group) : gdp->getPrimitiveRange();
+
+    PrimBoundsReducer reducer(gdp);
+
+    UTparallelReduce(GA_SplittableRange(range), reducer);
+
+    return reducer.getBBox();
+}
+
+// Compute the bounds of many groups in parallel.
+class GroupBoundsBuilder
+{
+public:
+    GroupBoundsBuilder(const GU_Detail *gdp,
+                       const std::vector<const GA_ElementGroup *> &groups,
+                       double *bounds)
+        : myGdp(gdp),
+          myGroups(groups),
+          myBounds(bounds)
+    {
+    }
+
+    void operator()(const UT_BlockedRange<exint> &range) const
+    {
+        const GA_ElementGroup   *group;
+        UT_BoundingBox          bbox;
+
+        for (exint i=range.begin(); i < range.end(); ++i)
+        {
+            group = myGroups[i];
+
+            // Only visit the members of each group.
+            if (group->getOwner() == GA_ATTRIB_PRIMITIVE)
+            {
+                bbox = primGroupBounds(
+                    myGdp,
+                    static_cast<const GA_PrimitiveGroup *>(group)
+                );
+            }
+            else
+            {
+                bbox = pointGroupBounds(
+                    myGdp,
+                    static_cast<const GA_PointGroup *>(group)
+                );
+            }
+
+            for (int j=0; j < 3; ++j)
+            {
+                myBounds[i * 6 + j] = bbox.minvec()[j];
+                myBounds[i * 6 + 3 + j] = bbox.maxvec()[j];
+            }
+        }
+    }
+
+private:
+    const GU_Detail             *myGdp;
+    const std::vector<const GA_ElementGroup *> &myGroups;
+    double                      *myBounds;
+};
+""",
+    structs=[
+        ("BoundingBox", (
+            ("xmin", "d"),
+            ("ymin", "d"),
+            ("zmin", "d"),
+            ("xmax", "d"),
+            ("ymax", "d"),
+            ("zmax", "d")
+            )
+        ),
+    ],
+    function_sources=[
+"""
+BoundingBox
+primGroupBoundingBox(const GU_Detail *gdp, const char *group_name)
+{
+
+    const GA_PrimitiveGroup     *group;
+
+    UT_BoundingBox              bbox;
+
+    BoundingBox                 bound;
+
+    // Find the primitive group.
+    group = gdp->findPrimitiveGroup(group_name);
+
+    bbox = primGroupBounds(gdp, group);
+
+    bound.xmin = bbox.xmin();
+    bound.ymin = bbox.ymin();
+    bound.zmin = bbox.zmin();
+
+    bound.xmax = bbox.xmax();
+    bound.ymax = bbox.ymax();
+    bound.zmax = bbox.zmax();
+
+    return bound;
+}
+""",
+
+"""
+BoundingBox
+pointGroupBoundingBox(const GU_Detail *gdp, const char *group_name)
+{
+
+    const GA_PointGroup         *group;
+
+    UT_BoundingBox              bbox;
+
+    BoundingBox                 bound;
+
+    // Find the point group.
+    group = gdp->findPointGroup(group_name);
+
+    bbox = pointGroupBounds(gdp, group);
+
+    bound.xmin = bbox.xmin();
+    bound.ymin = bbox.ymin();
+    bound.zmin = bbox.zmin();
+
+    bound.xmax = bbox.xmax();
+    bound.ymax = bbox.ymax();
+    bound.zmax = bbox.zmax();
+
+    return bound;
+}
+""",
+
+"""
+int
+groupBoundingBoxes(const GU_Detail *gdp,
+                   int group_type,
+                   const char **group_names,
+                   int num_groups,
+                   double *bounds)
+{
+    GA_AttributeOwner           owner;
+    const GA_ElementGroup       *group;
+
+    std::vector<const GA_ElementGroup *> groups;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Find all the groups.
+    for (int i=0; i < num_groups; ++i)
+    {
+        group = gdp->findElementGroup(owner, group_names[i]);
+
+        if (!group)
+        {
+            return 1;
+        }
+
+        groups.push_back(group);
+    }
+
+    // Compute the bounds of each group from its own members.
+    UTparallelFor(
+        UT_BlockedRange<exint>(0, num_groups),
+        GroupBoundsBuilder(gdp, groups, bounds)
+    );
+
+    return 0;
+}
+""",
+
+"""
+void
+groupBoundsDataIds(const GU_Detail *gdp,
+                   int group_type,
+                   const char *group_name,
+                   int64 *ids)
+{
+    const GA_ElementGroup       *group;
+
+    GA_AttributeOwner owner;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    group = gdp->findElementGroup(owner, group_name);
+
+    ids[0] = gdp->getUniqueId();
+
+    // Get the data ids of everything that affects the group's bounds.
+    ids[1] = gdp->getP()->getDataId();
+    ids[2] = group ? group->getDataId() : GA_INVALID_DATAID;
+    ids[3] = gdp->getTopology().getPointRef()->getDataId();
+    ids[4] = gdp->getPrimitiveList().getDataId();
+}
+""",
+
+"""
+void
+destroyEmptyGroups(GU_Detail *gdp, int mode)
+{
+    if (mode)
+    {
+        gdp->destroyEmptyGroups(GA_ATTRIB_PRIMITIVE);
+    }
+    else
+    {
+        gdp->destroyEmptyGroups(GA_ATTRIB_POINT);
+    }
+}
+""",
+
+"""
+void
+toggleMembership(GU_Detail *gdp, const char *group_name,
+                 int group_type, int elem_num)
+{
+    GA_ElementGroup             *group = 0;
+    GA_Offset                   elem_offset;
+
+    if (group_type)
+    {
+        group = gdp->findPrimitiveGroup(group_name);
+        elem_offset = gdp->primitiveOffset(elem_num);
+    }
+    else
+    {
+        group = gdp->findPointGroup(group_name);
+        elem_offset = gdp->pointOffset(elem_num);
+    }
+
+    group->toggleOffset(elem_offset);
+
+    // Mark the membership as changed so cached bounds are invalidated.
+    group->bumpDataId();
+}
+""",
+
+"""
+int
+modifyMembership(GU_Detail *gdp,
+                 const char *group_name,
+                 int group_type,
+                 int operation,
+                 const int *indices,
+                 int num_indices,
+                 const int *ranges,
+                 int num_ranges)
+{
+    GA_AttributeOwner           owner;
+    GA_ElementGroup             *group;
+    GA_Offset                   elemOff;
+    GA_OffsetList               offsets;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Find the group once for all the elements.
+    group = gdp->findElementGroup(owner, group_name);
+
+    if (!group)
+    {
+        return 1;
+    }
+
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
+
+    exint num_elements = index_map.indexSize();
+
+    // Check all the element numbers before changing anything.
+    for (int i=0; i < num_indices; ++i)
+    {
+        if (indices[i] < 0 || indices[i] >= num_elements)
+        {
+            return 2;
+        }
+    }
+
+    // The ranges are pairs of first and last element numbers.
+    for (int i=0; i < num_ranges; ++i)
+    {
+        if (ranges[i * 2] < 0 || ranges[i * 2 + 1] >= num_elements)
+        {
+            return 2;
+        }
+    }
+
+    // Get the offsets of all the elements.
+    for (int i=0; i < num_indices; ++i)
+    {
+        offsets.append(index_map.offsetFromIndex(indices[i]));
+    }
+
+    for (int i=0; i < num_ranges; ++i)
+    {
+        for (GA_Index idx=ranges[i * 2]; idx <= ranges[i * 2 + 1]; ++idx)
+        {
+            offsets.append(index_map.offsetFromIndex(idx));
+        }
+    }
+
+    for (exint i=0; i < offsets.size(); ++i)
+    {
+        elemOff = offsets(i);
+
+        // Add the element.
+        if (operation == 0)
+        {
+            group->addOffset(elemOff);
+        }
+        // Remove the element.
+        else if (operation == 1)
+        {
+            group->removeOffset(elemOff);
+        }
+        // Toggle the element.
+        else
+        {
+            group->toggleOffset(elemOff);
+        }
+    }
+
+    // Mark the membership as changed so cached bounds are invalidated.
+    if (offsets.size())
+    {
+        group->bumpDataId();
+    }
+
+    return 0;
+}
+""",
+
+"""
+int
+evalGroupExpression(GU_Detail *gdp,
+                    int group_type,
+                    const char **group_names,
+                    int num_groups,
+                    const int *program,
+                    int program_size,
+                    const char *result_name)
+{
+    GA_AttributeOwner           owner;
+    const GA_ElementGroup       *group;
+    GA_ElementGroup             *result_group;
+
+    UT_BitArray                 result;
+
+    std::vector<const GA_ElementGroup *> groups;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Find all the groups in the expression.
+    for (int i=0; i < num_groups; ++i)
+    {
+        group = gdp->findElementGroup(owner, group_names[i]);
+
+        if (!group)
+        {
+            return 1;
+        }
+
+        groups.push_back(group);
+    }
+
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
+
+    result.resize(index_map.offsetSize());
+    result.setAllBits(false);
+
+    // Evaluate the expression for all the elements in parallel.
+    UTparallelFor(
+        GA_SplittableRange(GA_Range(index_map)),
+        GroupExpressionEvaluator(groups, program, program_size, result)
+    );
+
+    // Find or create the result group once the expression is evaluated
+    // since it may also be used in the expression.
+    result_group = gdp->findElementGroup(owner, result_name);
+
+    if (result_group)
+    {
+        result_group->clear();
+    }
+    else
+    {
+        result_group = gdp->createElementGroup(owner, result_name);
+    }
+
+    // Adding the bits also bumps the data id to invalidate cached bounds.
+    addBitsToGroup(result_group, result);
+
+    return 0;
+}
+""",
+
+"""
+void
+groupMembershipBits(const GU_Detail *gdp,
+                    const char *group_name,
+                    int group_type,
+                    char *bits)
+{
+    GA_AttributeOwner           owner;
+    const GA_ElementGroup       *group;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    group = gdp->findElementGroup(owner, group_name);
+
+    exint num_bytes = (gdp->getIndexMap(owner).indexSize() + 7) / 8;
+
+    UTparallelFor(
+        UT_BlockedRange<exint>(0, num_bytes),
+        MembershipPacker(group, bits)
+    );
+}
+""",
+
+"""
+int
+createGroupFromBits(GU_Detail *gdp,
+                    const char *group_name,
+                    int group_type,
+                    const char *bits,
+                    int num_bytes)
+{
+    GA_AttributeOwner           owner;
+    GA_ElementGroup             *group;
+
+    ThreadBitArrays             thread_bits;
+    UT_BitArray                 offsets;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    const GA_IndexMap &index_map = gdp->getIndexMap(owner);
+
+    // Check there is a bit for every element.
+    if (num_bytes != (index_map.indexSize() + 7) / 8)
+    {
+        return 1;
+    }
+
+    // Check the group doesn't already exist.
+    if (gdp->findElementGroup(owner, group_name))
+    {
+        return 2;
+    }
+
+    // Convert the element numbers to offsets in parallel.
+    UTparallelFor(
+        UT_BlockedRange<exint>(0, num_bytes),
+        MembershipUnpacker(index_map, bits, thread_bits)
+    );
+
+    mergeThreadBits(thread_bits, index_map.offsetSize(), offsets);
+
+    group = gdp->createElementGroup(owner, group_name);
+
+    addBitsToGroup(group, offsets);
+
+    return 0;
+}
+""",
+
+"""
+void
+setEntries(GU_Detail *gdp, const char *group_name, int group_type)
+{
+    GA_ElementGroup             *group = 0;
+
+    if (group_type)
+    {
+        group = gdp->findPrimitiveGroup(group_name);
+    }
+    else
+    {
+        group = gdp->findPointGroup(group_name);
+    }
+
+    group->setEntries();
+
+    // Mark the membership as changed so cached bounds are invalidated.
+    group->bumpDataId();
+}
+""",
+
+"""
+void
+toggleEntries(GU_Detail *gdp, const char *group_name, int group_type)
+{
+    GA_ElementGroup             *group = 0;
+
+    if (group_type)
+    {
+        group = gdp->findPrimitiveGroup(group_name);
+    }
+    else
+    {
+        group = gdp->findPointGroup(group_name);
+    }
+
+    group->toggleEntries();
+
+    // Mark the membership as changed so cached bounds are invalidated.
+    group->bumpDataId();
+}
+""",
+
+"""
+void
+copyGroup(GU_Detail *gdp,
+          int group_type,
+          const char *group_name,
+          const char *new_group_name)
+{
+    GA_AttributeOwner           owner;
+    const GA_ElementGroup       *group;
+    GA_ElementGroup             *new_group;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Find the current group.
+    group = gdp->findElementGroup(owner, group_name);
+
+    // Create the new group.
+    new_group = gdp->createElementGroup(owner, new_group_name);
+
+    // Copy the membership to the new group.
+    new_group->copyMembership(*group);
+}
+""",
+
+"""
+bool
+containsAny(const GU_Detail *gdp,
+            const char *group_name,
+            const char *other_group_name,
+            int group_type)
+{
+    const GA_ElementGroup       *group;
+
+    const GA_PrimitiveGroup     *prim_group;
+    const GA_PointGroup         *point_group;
+
+    GA_Range                    range;
+
+    if (group_type)
+    {
+        group = gdp->findPrimitiveGroup(group_name);
+        prim_group = gdp->findPrimitiveGroup(other_group_name);
+        range = gdp->getPrimitiveRange(prim_group);
+    }
+    else
+    {
+        group = gdp->findPointGroup(group_name);
+        point_group = gdp->findPointGroup(other_group_name);
+        range = gdp->getPointRange(point_group);
+    }
+
+    return group->containsAny(range);
+}
+""",
+
+"""
+int
+groupOverlapCounts(const GU_Detail *gdp,
+                   int group_type,
+                   const char **group_names,
+                   int num_groups,
+                   int64 *counts)
+{
+    GA_AttributeOwner           owner;
+    const GA_ElementGroup       *group;
+
+    std::vector<const GA_ElementGroup *> groups;
+
+    owner = group_type ? GA_ATTRIB_PRIMITIVE : GA_ATTRIB_POINT;
+
+    // Find all the groups.
+    for (int i=0; i < num_groups; ++i)
+    {
+        group = gdp->findElementGroup(owner, group_names[i]);
+
+        if (!group)
+        {
+            return 1;
+        }
+
+        groups.push_back(group);
+    }
+
+    GroupOverlapCounter counter(groups);
+
+    // Count the overlaps of every pair of groups in a single pass.
+    UTparallelReduce(
+        GA_SplittableRange(GA_Range(gdp->getIndexMap(owner))),
+        counter
+    );
+
+    const std::vector<int64> &result = counter.getCounts();
+
+    std::copy(result.begin(), result.end(), counts);
+
+    return 0;
+}
+""",
+
+"""
+void
+primToPointGroup(GU_Detail *gdp,
+                      const char *group_name,
+                      const char *new_group_name,
+                      bool destroy)
+{
+    GA_PrimitiveGroup           *prim_group;
+    GA_PointGroup               *point_group;
+
+    UT_BitArray                 points;
+
+    // The source group.
+    prim_group = gdp->findPrimitiveGroup(group_name);
+
+    // Create a new point group.
+    point_group = gdp->newPointGroup(new_group_name);
+
+    // Mark the points of the primitives in parallel.
+    markPrimGroupPoints(gdp, prim_group, points);
+
+    // Add all the points to the group at once.
+    addBitsToGroup(point_group, points);
+
+    // Destroy the source group if necessary.
+    if (destroy)
+    {
+        gdp->destroyPrimitiveGroup(prim_group);
+    }
+}
+""",
+
+"""
+void
+pointToPrimGroup(GU_Detail *gdp,
+                      const char *group_name,
+                      const char *new_group_name,
+                      bool destroy)
+{
+    GA_PrimitiveGroup           *prim_group;
+    GA_PointGroup               *point_group;
+
+    UT_BitArray                 prims;
+
+    // The source group.
+    point_group = gdp->findPointGroup(group_name);
+
+    // Create a new primitive group.
+    prim_group = gdp->newPrimitiveGroup(new_group_name);
+
+    // Mark the primitives referencing the points in parallel.
+    markPointGroupPrims(gdp, point_group, prims);
+
+    // Add all the primitives to the group at once.
+    addBitsToGroup(prim_group, prims);
+
+    // Destroy the source group if necessary.
+    if (destroy)
+    {
+        gdp->destroyPointGroup(point_group);
+    }
+}
+""",
+]
+)
+
+
+# Methods for working with nodes, parameters and digital assets.
+_node_methods = _createLibrary(
+    "cpp_node_methods",
+    acquire_hom_lock=True,
+    catch_crashes=True,
+    includes="""
+#include <OP/OP_Director.h>
+#include <OP/OP_Node.h>
+#include <OP/OP_OTLManager.h>
+#include <PRM/PRM_Parm.h>
+""",
+    structs=[
+        ("StringArray", "**c"),
+        ("StringTuple", "*StringArray"),
+    ],
+    function_sources=[
+"""
+void
+setIcon(OP_Operator *op, const char *icon_name)
+{
+    op->setIconName(icon_name);
+}
+""",
+
+"""
+void
+setDefaultIcon(OP_Operator *op)
+{
+    op->setDefaultIconName();
+}
+""",
+
+"""
+bool
+isSubnetType(OP_Operator *op)
+{
+    return op->getIsPrimarySubnetType();
+}
+""",
+
+"""
+bool
+isPython(OP_Operator *op)
+{
+    return op->getScriptIsPython();
+}
+""",
+
+"""
+bool
+isParmDefault(OP_Node *node, const char *parm_name, int index)
+{
+    PRM_Parm &parm = node->getParm(parm_name);
+
+    // If we have a specific index, check if that parm is at its default.
+    if (index != -1)
+    {
+        return parm.isDefault(index);
+    }
+
+    // If not we check if the entire parm is at the default value.
+    return parm.isDefault();
+}
+""",
+
+"""
+StringArray
+getReferencingParms(OP_Node *node, const char *parm_name)
+{
+    std::vector<std::string>    result;
+
+    PRM_Parm                    *parm_tuple;
+
+    UT_PtrArray<PRM_Parm *>     parm_tuples;
+    UT_IntArray                 component_indices;
+
+    UT_String                   path, chan;
+
+    // Get an array of parameter objects and their component indices
+    // that reference the parameter.
+    node->getParmsThatReference(parm_name, parm_tuples, component_indices);
+
+    for (int i=0; i < parm_tuples.entries(); ++i)
+    {
+        parm_tuple = parm_tuples[i];
+        parm_tuple->getParmOwner()->getFullPath(path);
+        path += "/";
+
+        parm_tuple->getTemplatePtr()->getChannelToken(chan,
+                                                      component_indices[i]);
+        path += chan;
+
+        result.push_back(path.toStdString());
+    }
+
+    if (result.size() == 0)
+    {
+        result.push_back("");
+    }
+
+    return result;
+}
+""",
+
+"""
+void
+disconnectAllInputs(OP_Node *node)
+{
+    node->disconnectAllInputs();
+}
+""",
+
+"""
+void
+disconnectAllOutputs(OP_Node *node)
+{
+    node->disconnectAllOutputs();
+}
+""",
+
+"""
+const char *
+inputLabel(OP_Node *node, int index)
+{
+    return node->inputLabel(index);
+}
+""",
+
+"""
+StringArray
+messageNodes(const OP_Node *node)
+{
+    std::vector<std::string>    paths;
+
+    OP_Network                  *network;
+    OP_NodeList                 nodes;
+
+    UT_String                   path;
+
+    // Cast to a network.
+    network = (OP_Network *)node;
+
+    // Get any message nodes.  If there are none, add an emptry string to
+    // the list of paths and return it.
+    if (!network->getMessageSubNodes(nodes))
+    {
+        paths.push_back("");
+        return paths;
+    }
+
+    // Add each message node path to the list.
+    for (int i=0; i<nodes.entries(); ++i)
+    {
+        nodes[i]->getFullPath(path);
+        paths.push_back(path.toStdString());
+    }
+
+    // Return the paths.
+    return paths;
+}
+""",
+
+"""
+int
+representativeNode(const OP_Node *node)
+{
+    OP_Network                  *network;
+
+    network = (OP_Network *)node;
+
+    return network->getRepresentativeNodeId(0, 0);
+}
+""",
+
+"""
+bool
+isContainedBy(const OP_Node *node, const OP_Node *parent)
+{
+    return node->getIsContainedBy(parent);
+}
+""",
+
+"""
+bool
+isEditable(const OP_Node *node)
+{
+    return node->getIsEditableAssetSubNode();
+}
+""",
+
+"""
+bool
+isCompiled(const OP_Node *node)
+{
+    return node->isCompiled();
+}
+""",
+
+"""
+StringArray
+getExistingOpReferences(OP_Node *node, bool recurse)
+{
+    std::vector<std::string>    result;
+
+    UT_String                   path;
+
+    OP_Node                     *ref_node;
+
+    OP_NodeList                 refs;
+    OP_NodeList::const_iterator depend_it;
+
+    node->getExistingOpReferences(refs, recurse);
+
+    for (depend_it=refs.begin(); !depend_it.atEnd(); ++depend_it)
+    {
+        ref_node = *depend_it;
+        ref_node->getFullPath(path);
+
+        result.push_back(path.toStdString());
+    }
+
+    if (result.size() == 0)
+    {
+        result.push_back("");
+    }
+
+    return result;
+}
+""",
+
+"""
+StringArray
+getExistingOpDependents(OP_Node *node, bool recurse)
+{
+    std::vector<std::string>    result;
+
+    UT_String                   path;
+
+    OP_Node                     *dep_node;
+
+    OP_NodeList                 deps;
+    OP_NodeList::const_iterator depend_it;
+
+    node->getExistingOpDependents(deps, recurse);
+
+    for (depend_it=deps.begin(); !depend_it.atEnd(); ++depend_it)
+    {
+        dep_node = *depend_it;
+        dep_node->getFullPath(path);
+
+        result.push_back(path.toStdString());
+    }
+
+    if (result.size() == 0)
+    {
+        result.push_back("");
+    }
+
+    return result;
+}
+""",
+
+"""
+void
+insertMultiParmItem(OP_Node *node, const char *parm_name, int idx)
+{
+    node->insertMultiParmItem(parm_name, idx);
+}
+""",
+
+"""
+void
+removeMultiParmItem(OP_Node *node, const char *parm_name, int idx)
+{
+    node->removeMultiParmItem(parm_name, idx);
+}
+""",
+
+"""
+StringTuple
+getMultiParmInstances(OP_Node *node, const char *parm_name)
+{
+    int                         items, instances;
+    std::vector<StringArray>    blocks;
+
+    PRM_Parm                    *parm;
+    PRM_Parm &multiparm = node->getParm(parm_name);
+
+    // The number of multi parm blocks.
+    items = multiparm.getMultiParmNumItems();
+
+    // The number of parms in each block.
+    instances = multiparm.getMultiParmInstancesPerItem();
+
+    for (int i=0; i < items; ++i)
+    {
+        std::vector<std::string>    result;
+
+        for (int j=0; j < instances; ++j)
+        {
+            parm = multiparm.getMultiParm(i * instances + j);
+            result.push_back(parm->getToken());
+        }
+
+        // If the block is empty, add an empty string.
+        if (result.size() == 0)
+        {
+            result.push_back("");
+        }
+
+        blocks.push_back(result);
+    }
+
+    // If there are no entries, add an emptry block.
+    if (blocks.size() == 0)
+    {
+        std::vector<std::string>    result;
+        result.push_back("");
+        blocks.push_back(result);
+    }
+
+    return blocks;
+}
+""",
+
+"""
+const char *
+getMetaSource(const char *filename)
+{
+    OP_OTLLibrary       *lib;
+
+    int                 idx;
+
+    UT_String           test;
+
+    OP_OTLManager &manager = OPgetDirector()->getOTLManager();
+    idx = manager.findLibrary(filename);
+
+    lib = (idx >= 0) ? manager.getLibrary(idx): NULL;
+
+    if (lib)
+    {
+        return lib->getMetaSource();
+    }
+
+    return "";
+}
+""",
+]
+)
+
+
+# Methods for working with ranges, bounding boxes, vectors and matrices.
+_math_methods = _createLibrary(
+    "cpp_math_methods",
+    acquire_hom_lock=True,
+    catch_crashes=True,
+    includes="""
+#include <UT/UT_BoundingBox.h>
+#include <UT/UT_Matrix3.h>
+#include <UT/UT_String.h>
+#include <UT/UT_Vector3.h>
+#include <UT/UT_WorkArgs.h>
+""",
+    structs=[
+        ("IntArray", "*i"),
+    ],
+    function_sources=[
+"""
+int
+addNumToRange(int num, int sec, void *data)
+{
+    std::vector<int>            *values;
+
+    // Get the passed in vector.
+    values = (std::vector<int> *)data;
+
+    // Add the number to it.
+    values->push_back(num);
+
+    // Return 1 to keep going.
+    return 1;
+}
+""",
+
+"""
+IntArray
+expandRange(const char *pattern)
+{
+    std::vector<int>            values;
+
+    UT_String                   range;
+    UT_WorkArgs                 tokens;
+
+    range = pattern;
+
+    // Tokenize the pattern to split out the groups of ranges.
+    range.tokenize(tokens, ' ');
+
+    for (int i=0; i<tokens.getArgc(); ++i)
+    {
+        // Get the current range.
+        UT_String tmp = tokens[i];
+
+        // Add all the values in the range to the list.
+        tmp.traversePattern(-1, &values, addNumToRange);
+    }
+
+    return values;
+}
+""",
+
+"""
+bool
+isInside(const UT_BoundingBoxD *bbox1, const UT_BoundingBoxD *bbox2)
+{
+    return bbox1->isInside(*bbox2);
+}
+""",
+
+"""
+bool
+intersects(UT_BoundingBoxD *bbox1, const UT_BoundingBoxD *bbox2)
+{
+    return bbox1->intersects(*bbox2);
+}
+""",
+
+"""
+bool
+computeIntersection(UT_BoundingBoxD *bbox1, const UT_BoundingBoxD *bbox2)
+{
+    return bbox1->computeIntersection(*bbox2);
+}
+""",
+
+"""
+void
+expandBounds(UT_BoundingBoxD *bbox, float dltx, float dlty, float dltz)
+{
+    bbox->expandBounds(dltx, dlty, dltz);
+}
+""",
+
+"""
+void
+addToMin(UT_BoundingBoxD *bbox, const UT_Vector3D *vec)
+{
+    bbox->addToMin(*vec);
+}
+""",
+
+"""
+void
+addToMax(UT_BoundingBoxD *bbox, const UT_Vector3D *vec)
+{
+    bbox->addToMax(*vec);
+}
+""",
+
+"""
+double
+boundingBoxArea(const UT_BoundingBoxD *bbox)
+{
+    return bbox->area();
+}
+""",
+
+"""
+double
+boundingBoxVolume(const UT_BoundingBoxD *bbox)
+{
+    return bbox->volume();
+}
+""",
+
+"""
+void
+buildLookat(UT_DMatrix3 *mat,
+            const UT_Vector3D *from,
+            const UT_Vector3D *to,
+            const UT_Vector3D *up)
+{
+    mat->lookat(*from, *to, *up);
+}
+""",
+
+"""
+void
+getDual(const UT_Vector3D *vec, UT_DMatrix3 *mat)
+{
+    vec->getDual(*mat);
+}
+""",
+]
+)
+
+
+@addToModule(hou)
+def expandRange(pattern):
+    """Expand a string range into a tuple of values.
+
+    Args:
+        pattern : (str)
+            A string containing values to expand.
+
+    Returns:
+        tuple
+            A tuple of integers representing any ranges.
+
+    Raises: N/A
+
+    This function will do string range expansion.  Examples include
+    '0-15', '0 4 10-100', '1-100:2', etc.  See Houdini's documentation
+    about geometry groups for more information. Wildcards are not supported.
+
+    """
+    return tuple(_math_methods.expandRange(pattern))
+
+
+@addToClass(hou.Geometry)
+def isReadOnly(self):
+    """Check if the geometry is read only.
+
+    Returns:
+        bool
+            Returns True if the geometry is read only, otherwise False.
+
+    Raises: N/A
+
+    """
+    # Get a GU Detail Handle for the geometry.
+    handle = self._guDetailHandle()
+    # Check if the handle is read only.
+    result = handle.isReadOnly()
+    # Destroy the handle.
+    handle.destroy()
+
+    return result
+
+
+@addToClass(hou.Geometry)
+def sortAlongAxis(self, geometry_type, axis, return_permutation=False):
+    """Sort points or primitives based on increasing positions along an axis.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        axis : (int)
+            The axis to sort along: (X=0, Y=1, Z=2).
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        ValueError
+            This exception is raised if 'axis' is not 0, 1 or 2.
+        OperationFailed
+            This exception is raised if 'geometry_type' is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    """
+    # Verify the axis.
+    if axis not in range(3):
+        raise ValueError("Invalid axis: {0}".format(axis))
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    # Sort the elements along an axis.
+    _sort_methods.sortAlongAxis(self, mode, axis)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortByValues(self, geometry_type, values, return_permutation=False):
+    """Sort points or primitives based on a list of corresponding values.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        values : (list|tuple|buffer)
+            A sequence of numbers to sort by.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        OperationFailed
+            This exception is raised if 'geometry_type' is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    The list of values must be the same length as the number of geometry
+    elements to be sourced.
+
+    Values are sorted natively using their own precision.  Integer buffers
+    and lists of integers are sorted as 64 bit integers, with unsigned 64 bit
+    buffers and lists of integers too large for a signed 64 bit integer
+    sorted as unsigned 64 bit integers.  Other values are sorted as doubles
+    unless they are a 32 bit float buffer.  ctypes, array.array and numpy
+    arrays of 32 bit floats, doubles and 64 bit integers are used without
+    being copied.
+
+    """
+    import ctypes
+    import struct
+
+    if geometry_type == hou.geometryType.Points:
+        # Check we have enough points.
+        if len(values) != len(self.iterPoints()):
+            raise hou.OperationFailed(
+                "Length of values must equal the number of points."
+            )
+
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        # Check we have enough primitives.
+        if len(values) != len(self.iterPrims()):
+            raise hou.OperationFailed(
+                "Length of values must equal the number of prims."
+            )
+
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    typecode = _getBufferTypecode(values)
+
+    # Buffers of integers, or a sequence of only integers.
+    if typecode is not None:
+        kind = _TYPECODE_KINDS[typecode]
+
+        # Smaller unsigned integers fit in a signed 64 bit integer.
+        if kind == "uint" and struct.calcsize(typecode) < 8:
+            kind = "int"
+
+    elif all(isinstance(value, (int, long)) for value in values):
+        kind = "int"
+
+        # Integers too large for a signed 64 bit integer.
+        if values and max(values) > _INT64_MAX:
+            kind = "uint" if min(values) >= 0 else "float"
+
+    else:
+        kind = "float"
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    if kind == "int":
+        arr = _getCArray(values, ctypes.c_int64)
+        _sort_methods.sortByInt64Values(self, mode, arr)
+
+    # Unsigned 64 bit values would wrap as signed integers.
+    elif kind == "uint":
+        arr = _getCArray(values, ctypes.c_uint64)
+        _sort_methods.sortByUInt64Values(self, mode, arr)
+
+    # Sort 32 bit float buffers without converting them.
+    elif typecode is not None and struct.calcsize(typecode) == 4:
+        arr = _getCArray(values, ctypes.c_float)
+        _sort_methods.sortByValues(self, mode, arr)
+
+    else:
+        arr = _getCArray(values, ctypes.c_double)
+        _sort_methods.sortByDoubleValues(self, mode, arr)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortByKeys(self, geometry_type, keys, descending=None,
+               return_permutation=False):
+    """Sort points or primitives by multiple keys.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        keys : (list|tuple)
+            The keys to sort by, in order of priority.  Each key can be an
+            attribute name, optionally with a component like 'P.y' or
+            'P[1]', a hou.Attrib or a sequence of values for each element.
+            Numeric and string attributes can be used.
+        descending=None : (list|tuple)
+            An optional list of bools for each key.  Keys whose value is True
+            are sorted from largest to smallest.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives), or if
+            any of the keys are invalid.
+        ValueError
+            This exception is raised if the number of descending flags does
+            not match the number of keys.
+
+    Elements are ordered by the first key, with any ties ordered by the next
+    key and so on.  The sort is stable, so elements whose keys are all equal
+    keep their current order.  String attributes are sorted alphabetically,
+    or in reverse when descending.  All the keys are sorted natively and the
+    elements are only reordered once.
+
+    """
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    attrib_names, components, values, flags = _getSortKeyArgs(
+        self,
+        geometry_type,
+        keys,
+        descending
+    )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    result = _sort_methods.sortByKeys(
+        self,
+        mode,
+        attrib_names,
+        components,
+        values,
+        flags,
+        len(keys)
+    )
+
+    if result == 1:
+        raise hou.OperationFailed("Invalid attribute.")
+
+    elif result == 2:
+        raise hou.OperationFailed("Attribute must be numeric or a string.")
+
+    elif result == 3:
+        raise hou.OperationFailed("Invalid attribute component.")
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortSpatially(self, geometry_type, curve="morton", resolution=10,
+                  return_permutation=False):
+    """Sort points or primitives along a space filling curve.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        curve="morton" : (str)
+            The curve to sort along: "morton" or "hilbert".
+        resolution=10 : (int)
+            The number of bits used for each axis, between 1 and 21.  The
+            curve passes through 2**resolution cells along each axis.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        ValueError
+            This exception is raised if 'curve' or 'resolution' is invalid.
+        OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    Points are sorted by their positions and primitives by their centers.
+    Elements that are close together in space end up with numbers that are
+    close together, which improves memory locality for later operations.
+    Hilbert curves give better locality than Morton curves but take slightly
+    longer to compute.  Elements in the same cell keep their current order.
+
+    """
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    curves = ("morton", "hilbert")
+
+    if curve not in curves:
+        raise ValueError("Invalid curve: {0}".format(curve))
+
+    if resolution not in range(1, 22):
+        raise ValueError("Invalid resolution: {0}".format(resolution))
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    _sort_methods.sortSpatially(self, mode, curves.index(curve), resolution)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortRandomly(self, geometry_type, seed=0.0, return_permutation=False):
+    """Sort points or primitives randomly.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        seed=0.0 : (float)
+            The amount to shift each elements number.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        TypeError
+            This exception is raised if 'seed' is not a number.
+        OperationFailed
+            This exception is raised if 'geometry_type' is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    """
+    if not isinstance(seed, (float, int)):
+        raise TypeError(
+            "Got '{0}', expected 'float'.".format(type(seed).__name__)
+        )
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    # Randomize the element order.
+    _sort_methods.sortListRandomly(self, mode, seed)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def shiftElements(self, geometry_type, offset=0, return_permutation=False):
+    """Shift all point or primitives indices forward by an offset.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        offset=0 : (int)
+            The amount to shift each elements number.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        TypeError
+            This exception is raised if 'offset' is not an integer.
+        OperationFailed
+            This exception is raised if 'geometry_type' is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    Each point or primitive number gets the offset added to it to get its new
+    number.  If this exceeds the number of points or primitives, it wraps
+    around.
+
+    """
+    if not isinstance(offset, int):
+        raise TypeError(
+            "Got '{0}', expected 'int'.".format(type(offset).__name__)
+        )
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        elem_offsets = _getElementOffsets(self, mode)
+
+    # Shift the element order.
+    _sort_methods.shiftList(self, mode, offset)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, elem_offsets)
+
+
+@addToClass(hou.Geometry)
+def reverseSort(self, geometry_type, return_permutation=False):
+    """Reverse the ordering of the points or primitives.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    The highest numbered becomes the lowest numbered, and vice versa.
+
+    """
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    # Reverse the element order.
+    _sort_methods.reverseList(self, mode)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortByProximityToPosition(self, geometry_type, pos,
+                              return_permutation=False):
+    """Sort elements by their proximity to a point.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        pos : (hou.Vector3)
+            A location in space.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    The distance to the point in space is used as a priority. The points or
+    primitives are then sorted so that the 0th entity is the one closest to
+    that point.
+    """
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    # Sort the elements.
+    _sort_methods.proximityToList(self, mode, pos)
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortByVertexOrder(self, return_permutation=False):
+    """Sorts points to match the order of the vertices on the primitives.
+
+    Args:
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises: N/A
+
+    If you have a curve whose point numbers do not increase along the curve,
+    this will reorder the point numbers so they match the curve direction.
+
+    """
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, 0)
+
+    _sort_methods.sortByVertexOrder(self)
+
+    if return_permutation:
+        return _getSortPermutation(self, 0, offsets)
+
+
+@addToClass(hou.Geometry)
+def sortByAttribute(self, attrib, component=0, return_permutation=False):
+    """Sort points or primitives by the value of a numeric attribute.
+
+    Args:
+        attrib : (hou.Attrib)
+            The point or primitive attribute to sort by.
+        component=0 : (int)
+            The attribute component to sort by.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        OperationFailed
+            This exception is raised if the attribute is not a point or
+            primitive attribute, is not numeric, or the component is invalid.
+
+    The attribute values are read and sorted natively, without evaluating
+    anything in Python.  Integer attributes are sorted as 64 bit integers and
+    float attributes as doubles.  The sort is stable and the point or
+    primitive with the least value will be numbered 0 after the sort.
+
+    """
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    attrib_type = attrib.type()
+
+    if attrib_type == hou.attribType.Point:
+        mode = 0
+
+    elif attrib_type == hou.attribType.Prim:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Attribute must be a point or primitive attribute."
+        )
+
+    # Record the current order of the elements.
+    if return_permutation:
+        offsets = _getElementOffsets(self, mode)
+
+    result = _sort_methods.sortByAttribute(
+        self,
+        mode,
+        attrib.name(),
+        component
+    )
+
+    if result == 1:
+        raise hou.OperationFailed("Invalid attribute.")
+
+    elif result == 2:
+        raise hou.OperationFailed("Attribute must be numeric.")
+
+    elif result == 3:
+        raise hou.OperationFailed(
+            "Invalid component: {0}".format(component)
+        )
+
+    if return_permutation:
+        return _getSortPermutation(self, mode, offsets)
+
+
+@addToClass(hou.Geometry)
+def applyPermutation(self, geometry_type, permutation):
+    """Reorder points or primitives using a permutation.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to reorder.
+        permutation : (list|tuple|buffer)
+            The new number of each element, indexed by its current number.
+
+    Returns: N/A
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives), or if
+            the permutation is not valid for the elements.
+
+    The permutation uses the same layout as those returned by the sort
+    functions, so a sort can be repeated on other geometry with the same
+    number of elements without computing any keys.  Int buffers like ctypes,
+    array.array or numpy arrays are used without being copied.
+
+    """
+    import ctypes
+
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+
+    elif geometry_type == hou.geometryType.Primitives:
+        mode = 1
+
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    arr = _getCArray(permutation, ctypes.c_int)
+
+    result = _sort_methods.applyPermutation(self, mode, arr, len(arr))
+
+    if result == 1:
+        raise hou.OperationFailed(
+            "Length of permutation must equal the number of elements."
+        )
+
+    elif result == 2:
+        raise hou.OperationFailed(
+            "Permutation must contain each element number once."
+        )
+
+
+@addToClass(hou.Geometry)
+def sortByExpression(self, geometry_type, expression,
+                     return_permutation=False):
+    """Sort points or primitives based on an expression for each element.
+
+    Args:
+        geometry_type : (hou.geometryType)
+            The type of geometry elements to sort.
+        expression : (str)
+            An expression to evaluate for each point or primitive.
+        return_permutation=False : (bool)
+            Whether to return the new number of each element.
+
+    Returns:
+        c_int_Array|None
+            If 'return_permutation' is True, an array containing the new
+            number of each element, indexed by its number before the sort.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives).
+
+    The specified expression is evaluated for each point or primitive. This
+    determines the priority of that primitive, and the entities are reordered
+    according to that priority. The point or primitive with the least evaluated
+    expression value will be numbered 0 after the sort.
+
+    Expressions that are a single local variable which maps to an attribute,
+    such as '$TY' or '$CR', are sorted natively by the attribute's values.
+    Sorting by '$PT' or '$PR' keeps the current order and sorting by '-$PT'
+    or '-$PR' reverses it.
+
+    Arithmetic expressions of numbers, numeric attribute variables and the
+    element number, such as '-$TY', '$TX+$TZ' or '$CR*2', are evaluated
+    natively for all the elements in parallel.  They can use '+', '-', '*',
+    '/', '%', '^' and parentheses.  Any other expression, such as one
+    calling a function, is evaluated per element using hscript.
+
+    """
+    import ctypes
+    import re
+
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    if geometry_type not in (hou.geometryType.Points,
+                             hou.geometryType.Primitives):
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
+
+    if geometry_type == hou.geometryType.Points:
+        mode = 0
+        number_variable = "PT"
+
+    else:
+        mode = 1
+        number_variable = "PR"
+
+    # Check if the expression is just the element number, optionally negated.
+    match = re.match(
+        r"^\s*(-?)\s*\$\{{?{0}\}}?\s*$".format(number_variable),
+        expression
+    )
+
+    if match is not None:
+        # Sorting by the negated number reverses the elements.
+        if match.group(1):
+            return reverseSort(self, geometry_type, return_permutation)
+
+        # Sorting by the number keeps the current order.
+        if return_permutation:
+            return _getSortPermutation(
+                self,
+                mode,
+                _getElementOffsets(self, mode)
+            )
+
+        return None
+
+    # Check if the expression just reads an attribute value.  If it does we
+    # can avoid evaluating it for every element.
+    result = _getExpressionAttrib(self, geometry_type, expression)
+
+    if result is not None:
+        attrib, component = result
+
+        return sortByAttribute(self, attrib, component, return_permutation)
+
+    # Check if the expression is arithmetic on attribute values that can be
+    # evaluated natively.
+    result = _parseAttribExpression(self, geometry_type, expression)
+
+    if result is not None:
+        attribs, constants, program = result
+
+        # Record the current order of the elements.
+        if return_permutation:
+            offsets = _getElementOffsets(self, mode)
+
+        result = _sort_methods.sortByAttribExpression(
+            self,
+            mode,
+            _buildCStringArray([name for name, _ in attribs]),
+            _getCArray([component for _, component in attribs], ctypes.c_int),
+            len(attribs),
+            _getCArray(constants, ctypes.c_double),
+            _getCArray(program, ctypes.c_int),
+            len(program)
+        )
+
+        if result == 1:
+            raise hou.OperationFailed("Invalid attribute.")
+
+        elif result == 2:
+            raise hou.OperationFailed("Attribute must be numeric.")
+
+        elif result == 3:
+            raise hou.OperationFailed("Invalid attribute component.")
+
+        if return_permutation:
+            return _getSortPermutation(self, mode, offsets)
+
+        return None
+
+    values = []
+
+    # Get the current cooking SOP node.  We need to do this as the geometry is
+    # frozen and  has no reference to the SOP node it belongs to.
+    sop_node = hou.pwd()
+
+    if geometry_type == hou.geometryType.Points:
+        # Iterate over each point.
+        for point in self.points():
+            # Get this point to be the current point.  This allows '$PT' to
+            # work properly in the expression.
+            sop_node.setCurPoint(point)
+            # Add the evaluated expression value to the list.
+            values.append(hou.hscriptExpression(expression))
+
+    elif geometry_type == hou.geometryType.Primitives:
+        # Iterate over each primitive.
+        for prim in self.prims():
+            # Get this point to be the current point.  This allows '$PR' to
+            # work properly in the expression.
+            sop_node.setCurPrim(prim)
+            # Add the evaluated expression value to the list.
+            values.append(hou.hscriptExpression(expression))
+
+    return sortByValues(self, geometry_type, values, return_permutation)
+
+
+@addToClass(hou.Geometry)
+def createPoint(self, position=None):
+    """Create a new point, optionally located at a position.
+
+    Args:
+        position=None : (hou.Vector3)
+            The position to create the point at.  A value of None will
+            create the point at the origin.
+
+    Returns:
+        hou.Point
+            The newly created point.
+
+    Raises: N/A
+
+    """
+    # If no position is specified, use the origin.
+    if position is None:
+        position = hou.Vector3()
+
+    result = _topology_methods.createPoint(self, position)
+
+    return self.iterPoints()[result]
+
+
+@addToClass(hou.Geometry)
+def createPoints(self, count):
+    """Create a specific number of new points.
+
+    Args:
+        count : (int)
+            The number of new points to create.
+
+    Returns:
+        tuple
+            A tuple of the hou.Point objects created.
+
+    Raises:
+        hou.OperationFailed
+            Raise this exception if count is not greater than 0.
+
+    """
+    if count <= 0:
+        raise hou.OperationFailed("Invalid number of points.")
+
+    result = _topology_methods.createPoints(self, count)
+
+    return _getPointsFromList(self, result)
+
+
+@addToClass(hou.Geometry)
+def createPointsFromPositions(self, positions, return_points=False):
+    """Create new points located at a list of positions.
+
+    Args:
+        positions : (list|tuple|buffer)
+            The positions of the new points.  This can be a flat sequence
+            of x, y and z values, a sequence of positions like hou.Vector3
+            objects or numpy rows, or an Nx3 numpy array.
+        return_points=False : (bool)
+            Whether to return hou.Point objects instead of point numbers.
+
+    Returns:
+        xrange|tuple
+            The numbers of the new points, or a tuple of the hou.Point
+            objects created if 'return_points' is True.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        ValueError
+            This exception is raised if the number of values is not a
+            multiple of 3.
+
+    The points are added as a single block and their positions are set
+    natively in parallel.  Float and double buffers are used without being
+    copied.  Since the new points are numbered consecutively, returning the
+    range of numbers avoids creating a hou.Point for every point.
+
+    """
+    import ctypes
+    import struct
+
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    # Flatten multidimensional numpy arrays.
+    if getattr(positions, "ndim", 1) > 1:
+        positions = positions.reshape(-1)
+
+    typecode = _getBufferTypecode(positions)
+
+    # Convert the values to floats so sequences of numpy scalars or rows can
+    # be packed, flattening sequences of positions.
+    if typecode is None and len(positions):
+        try:
+            float(positions[0])
+
+        except TypeError:
+            positions = [
+                float(value) for position in positions for value in position
+            ]
+
+        else:
+            positions = [float(value) for value in positions]
+
+    if len(positions) % 3:
+        raise ValueError("Number of values must be a multiple of 3.")
+
+    count = len(positions) / 3
+
+    # Use 32 bit float buffers without converting them.
+    if typecode is not None and _TYPECODE_KINDS[typecode] == "float" and \
+            struct.calcsize(typecode) == 4:
+        arr = _getCArray(positions, ctypes.c_float)
+        start = _topology_methods.createPointsFromPositions(self, arr, count)
+
+    else:
+        arr = _getCArray(positions, ctypes.c_double)
+        start = _topology_methods.createPointsFromDoublePositions(
+            self,
+            arr,
+            count
+        )
+
+    if return_points:
+        # The new points are numbered consecutively so glob them all at once.
+        if not count:
+            return ()
+
+        return self.globPoints("{0}-{1}".format(start, start + count - 1))
+
+    return xrange(start, start + count)
+
+
+@addToClass(hou.Geometry)
+def createPolygonsFromArrays(self, point_indices, vertex_counts, closed=True,
+                             return_prims=False):
+    """Create new polygons from a list of point numbers and vertex counts.
+
+    Args:
+        point_indices : (list|tuple|buffer)
+            The point number of each vertex of every polygon, one polygon
+            after another.
+        vertex_counts : (list|tuple|buffer)
+            The number of vertices in each polygon.
+        closed=True : (bool)
+            Whether the polygons are closed.
+        return_prims=False : (bool)
+            Whether to return hou.Polygon objects instead of prim numbers.
+
+    Returns:
+        xrange|tuple
+            The numbers of the new polygons, or a tuple of the hou.Polygon
+            objects created if 'return_prims' is True.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        hou.OperationFailed
+            This exception is raised if a vertex count is not positive, the
+            vertex counts do not add up to the number of point numbers or a
+            point does not exist.
+
+    All the polygons are created natively in a single call, as one block of
+    primitives when possible.  Int buffers like ctypes, array.array or numpy
+    arrays are used without being copied, and multidimensional numpy arrays
+    of point numbers, like an Nx3 array of triangles, are flattened.
+
+    """
+    import ctypes
+
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    # Flatten multidimensional numpy arrays.
+    if getattr(point_indices, "ndim", 1) > 1:
+        point_indices = point_indices.reshape(-1)
+
+    point_arr = _getCArray(point_indices, ctypes.c_int)
+    count_arr = _getCArray(vertex_counts, ctypes.c_int)
+
+    result = _topology_methods.createPolygonsFromArrays(
+        self,
+        point_arr,
+        len(point_arr),
+        count_arr,
+        len(count_arr),
+        closed
+    )
+
+    if result == -1:
+        raise hou.OperationFailed("Vertex counts must be greater than 0.")
+
+    elif result == -2:
+        raise hou.OperationFailed(
+            "Vertex counts must add up to the number of point indices."
+        )
+
+    elif result == -3:
+        raise hou.OperationFailed("Invalid point index.")
+
+    num_polys = len(count_arr)
+
+    if return_prims:
+        # The new polygons are numbered consecutively so glob them all at
+        # once.
+        if not num_polys:
+            return ()
+
+        return self.globPrims(
+            "{0}-{1}".format(result, result + num_polys - 1)
+        )
+
+    return xrange(result, result + num_polys)
+
+
+@addToClass(hou.Geometry)
+def primMetrics(self, metrics, write_attribs=False):
+    """Compute metrics for all the primitives.
+
+    Args:
+        metrics : (list|tuple)
+            The names of the metrics to compute: "area", "perimeter",
+            "barycenter", "bbox" and "normal".
+        write_attribs=False : (bool)
+            Whether to store the metrics as primitive attributes instead of
+            returning them.
+
+    Returns:
+        dict|None
+            A dictionary of ctypes double arrays for each metric, ordered by
+            prim number, if 'write_attribs' is False.
+
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if 'write_attribs' is True and the
+            geometry is not writeable.
+        ValueError
+            This exception is raised if a metric name is invalid.
+        hou.OperationFailed
+            This exception is raised if an attribute could not be written.
+
+    The area and perimeter arrays have one value for each primitive, the
+    barycenter and normal arrays have 3 values for each primitive and the
+    bbox arrays have 6 values for each primitive, in the order xmin, ymin,
+    zmin, xmax, ymax, zmax.  The arrays can be viewed with numpy.frombuffer()
+    without copying.
+
+    All the metrics are computed in parallel in a single native call.  If
+    'write_attribs' is True, each metric is written to a float primitive
+    attribute of the same name.
+
+    """
+    import ctypes
+
+    # The number of values for each primitive.
+    sizes = {
+        "area": 1,
+        "perimeter": 1,
+        "barycenter": 3,
+        "bbox": 6,
+        "normal": 3,
+    }
+
+    for metric in metrics:
+        if metric not in sizes:
+            raise ValueError("Invalid metric: {0}".format(metric))
+
+    # Make sure the geometry is not read only.
+    if write_attribs and self.isReadOnly():
+        raise hou.GeometryPermissionError()
+
+    num_prims = len(self.iterPrims())
+
+    values = {}
+
+    for metric in metrics:
+        values[metric] = (ctypes.c_double * (num_prims * sizes[metric]))()
+
+    # Metrics that are not needed are passed as null pointers.
+    _topology_methods.primMetrics(
+        self,
+        values.get("area"),
+        values.get("perimeter"),
+        values.get("barycenter"),
+        values.get("bbox"),
+        values.get("normal")
+    )
+
+    if not write_attribs:
+        return values
+
+    for metric, arr in values.iteritems():
+        result = _attrib_methods.setFloatTupleValues(
+            self,
+            1,
+            metric,
+            sizes[metric],
+            arr
+        )
+
+        if result == 1:
+            raise hou.OperationFailed(
+                "Could not write attribute: {0}".format(metric)
+            )
+
+
+@addToClass(hou.Geometry)
+def varmap(self):
+    """Get the varmap as a dictionary.
+
+    Returns:
+        dict|None
+            A dictionary representing the varmap attribute, if it exists.  If
+            the attribute does not exist, returns None.
+
+    Raises: N/A
+
+    This function returns a dictionary representing the varmap attribute whose
+    keys are the attribute names and values are the variable names.
+
+    """
+    # Try to find the detail attribute.
+    varmap_attrib = self.findGlobalAttrib("varmap")
+
+    # If it does not exists, return None.
+    if varmap_attrib is None:
+        return None
+
+    # Get the value(s).
+    values = self.attribValue(varmap_attrib)
+
+    # If the value is a single string, convert it to a tuple.
+    if isinstance(values, str):
+        values = (values, )
+
+    # The varmap dictionary.
+    varmap_dict = {}
+
+    for entry in values:
+        # Split the value based on the mapping indicator.
+        attrib_name, var = entry.split(" -> ")
+
+        # Add the information to the dictionary.
+        varmap_dict[attrib_name] = var
+
+    return varmap_dict
+
+
+@addToClass(hou.Geometry)
+def setVarmap(self, varmap_dict):
+    """Set the varmap based on the dictionary.
+
+    Args:
+        varmap_dict : (dict)
+            A dictionary of attribute and variable names to set
+            the varmap as.
+
+    Returns: N/A
+
+    Raises: N/A
+
+    This function will create variable mappings between the keys and values of
+    the dictionary.  If the attribute does not exist it will be created.
+
+    """
+    # Create varmap string mappings from the key/value pairs.
+    strings = ["{0} -> {1}".format(attrib_name, var)
+               for attrib_name, var in varmap_dict.iteritems()]
+
+    # Construct a ctypes string array to pass the strings.
+    arr = _buildCStringArray(strings)
+
+    # Update the varmap.
+    _attrib_methods.setVarmap(self, arr, len(strings))
+
+
+@addToClass(hou.Geometry)
+def addVariableName(self, attrib, var_name):
+    """Add a variable mapping to the attribute in the varmap.
+
+    Args:
+        attrib : (hou.Attrib)
+            The attribute to create a variable mapping for.
+        var_name : (string)
+            The variable name to map to the attribute.
+
+    Returns: N/A
+
+    Raises: N/A
+
+    """
+    _attrib_methods.addVariableName(self, attrib.name(), var_name)
+
+
+@addToClass(hou.Geometry)
+def removeVariableName(self, var_name):
+    """Remove a variable mapping from the varmap.
+
+    Args:
+        var_name : (string)
+            The variable name to remove the mapping for.
+
+    Returns: N/A
+
+    Raises: N/A
+
+    """
+    _attrib_methods.removeVariableName(self, var_name)
+
+
+@addToClass(hou.Attrib, name="rename")
+def renameAttribute(self, new_name):
+    """Rename this attribute.
+
+    Args:
+        new_name : (string)
+            The new attribute name.
+
+    Returns:
+        hou.Attrib|None
+            Returns the newly renamed attribute if successful, otherwise
+            None.
+
+    Raises:
+        hou.OperationFailed:
+            Raises this exception if you try to destroy 'P'.
+
+    """
+    geometry = self.geometry()
+
+    attrib_type = self.type()
+
+    # Get the attribute type as an integer corresponding to the
+    # GA_AttributeOwner enum.
+    if attrib_type == hou.attribType.Vertex:
+        owner = 0
+    elif attrib_type == hou.attribType.Point:
+        owner = 1
+    elif attrib_type == hou.attribType.Prim:
+        owner = 2
+    else:
+        owner = 3
+
+    # Raise an exception when trying to modify 'P'.
+    if attrib_type == hou.attribType.Point and self.name() == "P":
+        raise hou.OperationFailed("Renaming 'P' is not permitted.")
+
+    # Try to rename the attribute.
+    success = _attrib_methods.renameAttribute(
+        geometry,
+        owner,
+        self.name(),
+        new_name
+    )
+
+    # That attribute was renamed.
+    if success:
+        # Return the new attribute.
+        if attrib_type == hou.attribType.Vertex:
+            return geometry.findVertexAttrib(new_name)
+        elif attrib_type == hou.attribType.Point:
+            return geometry.findPointAttrib(new_name)
+        elif attrib_type == hou.attribType.Prim:
+            return geometry.findPrimAttrib(new_name)
+        else:
+            return geometry.findGlobalAttrib(new_name)
+
+    return None
+
+
+@addToClass(hou.Geometry)
+def findPrimByName(self, name_to_match, name_attribute="name", match_number=0):
+    """Find a primitive with a matching name attribute value.
+
+    Args:
+        name_to_match : (string)
+            The name attribute value to match.
+        name_attribute="name" : (string)
+            The attribute name to use.
+        match_number=0 : (int)
+            The match_numberth matching primitive to return.
+
+    Returns:
+        hou.Primitive|None
+            A matching primitive, if found.  If no primitive is found, returns
+            None.  None is also returned if match_number is greater than the
+            number of matches found.
+
+    Raises: N/A
+
+    """
+    # Try to find a primitive matching the name.
+    result = _attrib_methods.findPrimitiveByName(
+        self,
+        name_to_match,
+        name_attribute,
+        match_number
+    )
+
+    # If the result is -1, no prims were found so return None.
+    if result == -1:
+        return None
+
+    #  Return the primitive.
+    return self.iterPrims()[result]
+
+
+@addToClass(hou.Geometry)
+def findAllPrimsByName(self, name_to_match, name_attribute="name"):
+    """Find all primitives with a matching name attribute value.
+
+    Args:
+        name_to_match : (string)
+            The name attribute value to match.
+        name_attribute="name" : (string)
+            The attribute name to use.
+
+    Returns:
+        tuple
+            A tuple of hou.Prim objects whose attribute values match.
+
+    Raises: N/A
+
+    """
+    # Try to find matching primitives.
+    result = _attrib_methods.findAllPrimitivesByName(
+        self,
+        name_to_match,
+        name_attribute
+    )
+
+    # Return a tuple of the matching primitives if any were found.
+    if result:
+        return _getPrimsFromList(self, result)
+
+    # If none were found, return an empty tuple.
+    return ()
 
-    PRM_Parm                    *parm;
-    PRM_Parm &multiparm = node->getParm(parm_name);
 
-    // The number of multi parm blocks.
-    items = multiparm.getMultiParmNumItems();
+@addToClass(hou.Point, name="copyAttributeValues")
+def copyPointAttributeValues(self, source_point, attributes):
+    """Copy attribute values from the source point to this point.
 
-    // The number of parms in each block.
-    instances = multiparm.getMultiParmInstancesPerItem();
+    Args:
+        source_point : (hou.Point)
+            The point to copy the attribute values from.
+        attributes : (list)
+            A list of hou.Attrib objects representing point attributes on the
+            source geometry.
 
-    for (int i=0; i < items; ++i)
-    {
-        std::vector<std::string>    result;
+    Returns: N/A
 
-        for (int j=0; j < instances; ++j)
-        {
-            parm = multiparm.getMultiParm(i * instances + j);
-            result.push_back(parm->getToken());
-        }
+    Raises: N/A
 
-        // If the block is empty, add an empty string.
-        if (result.size() == 0)
-        {
-            result.push_back("");
-        }
+    If the attributes do not exist on the destination point they will be
+    created.
 
-        blocks.push_back(result);
-    }
+    """
+    # Get the source point's geometry.
+    source_geometry = source_point.geometry()
 
-    // If there are no entries, add an emptry block.
-    if (blocks.size() == 0)
-    {
-        std::vector<std::string>    result;
-        result.push_back("");
-        blocks.push_back(result);
-    }
+    # Get the attribute names, ensuring we only use point attributes on the
+    # source point's geometry.
+    attrib_names = [
+        attrib.name() for attrib in attributes
+        if attrib.type() == hou.attribType.Point and
+        attrib.geometry().sopNode() == source_geometry.sopNode()
+    ]
 
-    return blocks;
-}
-""",
+    # Construct a ctypes string array to pass the strings.
+    arr = _buildCStringArray(attrib_names)
 
-"""
-void
-buildLookat(UT_DMatrix3 *mat,
-            const UT_Vector3D *from,
-            const UT_Vector3D *to,
-            const UT_Vector3D *up)
-{
-    mat->lookat(*from, *to, *up);
-}
-""",
+    # Copy the values.
+    _attrib_methods.copyPointAttributeValues(
+        self.geometry(),
+        self.number(),
+        source_geometry,
+        source_point.number(),
+        arr,
+        len(attrib_names)
+    )
 
-"""
-void
-getDual(const UT_Vector3D *vec, UT_DMatrix3 *mat)
-{
-    vec->getDual(*mat);
-}
-""",
 
-"""const char *
-getMetaSource(const char *filename)
-{
-    OP_OTLLibrary       *lib;
+@addToClass(hou.Prim, name="copyAttributeValues")
+def copyPrimAttributeValues(self, source_prim, attributes):
+    """Copy attribute values from the source primitive to this primitive.
 
-    int                 idx;
+    Args:
+        source_prim : (hou.Prim)
+            The primitive to copy the attribute values from.
+        attributes : (list)
+            A list of hou.Attrib objects representing primitive attributes
+            on the source geometry.
 
-    UT_String           test;
+    Returns: N/A
 
-    OP_OTLManager &manager = OPgetDirector()->getOTLManager();
-    idx = manager.findLibrary(filename);
+    Raises: N/A
 
-    lib = (idx >= 0) ? manager.getLibrary(idx): NULL;
+    If the attributes do not exist on the destination primitive they will be
+    created.
 
-    if (lib)
-    {
-        return lib->getMetaSource();
-    }
+    """
+    # Get the source primitive's geometry.
+    source_geometry = source_prim.geometry()
 
-    return "";
-}
-""",]
-)
+    # Get the attribute names, ensuring we only use primitive attributes on the
+    # source primitive's geometry.
+    attrib_names = [
+        attrib.name() for attrib in attributes
+        if attrib.type() == hou.attribType.Prim and
+        attrib.geometry().sopNode() == source_geometry.sopNode()
+    ]
 
-@addToModule(hou)
-def expandRange(pattern):
-    """Expand a string range into a tuple of values.
+    # Construct a ctypes string array to pass the strings.
+    arr = _buildCStringArray(attrib_names)
+
+    # Copy the values.
+    _attrib_methods.copyPrimAttributeValues(
+        self.geometry(),
+        self.number(),
+        source_geometry,
+        source_prim.number(),
+        arr,
+        len(attrib_names)
+    )
 
-    Args:
-        pattern : (str)
-            A string containing values to expand.
+
+@addToClass(hou.Prim)
+def pointAdjacentPolygons(self):
+    """Get all prims that are adjacent to this prim through a point.
 
     Returns:
         tuple
-            A tuple of integers representing any ranges.
+            A tuple of hou.Prim objects.
 
     Raises: N/A
 
-    This function will do string range expansion.  Examples include
-    '0-15', '0 4 10-100', '1-100:2', etc.  See Houdini's documentation
-    about geometry groups for more information. Wildcards are not supported.
-
     """
-    return tuple(_cpp_methods.expandRange(pattern))
+    # Get the geometry this primitive belongs to.
+    geometry = self.geometry()
 
+    # Get a list of prim numbers that are point adjacent this prim.
+    result = _topology_methods.pointAdjacentPolygons(geometry, self.number())
 
-@addToClass(hou.Geometry)
-def isReadOnly(self):
-    """Check if the geometry is read only.
+    return _getPrimsFromList(geometry, result)
+
+
+@addToClass(hou.Prim)
+def edgeAdjacentPolygons(self):
+    """Get all prims that are adjacent to this prim through an edge.
 
     Returns:
-        bool
-            Returns True if the geometry is read only, otherwise False.
+        tuple
+            A tuple of hou.Prim objects.
 
     Raises: N/A
 
     """
-    # Get a GU Detail Handle for the geometry.
-    handle = self._guDetailHandle()
-    # Check if the handle is read only.
-    result = handle.isReadOnly()
-    # Destroy the handle.
-    handle.destroy()
+    # Get the geometry this primitive belongs to.
+    geometry = self.geometry()
 
-    return result
+    # Get a list of prim numbers that are edge adjacent this prim.
+    result = _topology_methods.edgeAdjacentPolygons(geometry, self.number())
+
+    return _getPrimsFromList(geometry, result)
 
 
 @addToClass(hou.Geometry)
-def sortAlongAxis(self, geometry_type, axis):
-    """Sort points or primitives based on increasing positions along an axis.
+def primAdjacency(self, kind="edge"):
+    """Get the adjacent primitives of every primitive in the geometry.
 
     Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
-        axis : (int)
-            The axis to sort along: (X=0, Y=1, Z=2).
+        kind="edge" : (str)
+            The type of adjacency: "edge" or "point".
 
-    Returns: N/A
+    Returns:
+        tuple
+            A tuple of (offsets, neighbors) ctypes int arrays.
 
     Raises:
-        ValueError
-            This exception is raised if 'axis' is not 0, 1 or 2.
         OperationFailed
-            This exception is raised if 'geometry_type' is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+            This exception is raised if there are too many adjacent
+            primitives to store in 32 bit offsets.
+        ValueError
+            This exception is raised if 'kind' is not "edge" or "point".
 
-    """
-    # Verify the axis.
-    if axis not in range(3):
-        raise ValueError("Invalid axis: {0}".format(axis))
+    The adjacency is returned in compressed sparse row form.  The adjacent
+    primitive numbers of primitive i are neighbors[offsets[i]:offsets[i+1]].
 
-    # Sort the points along an axis.
-    if geometry_type == hou.geometryType.Points:
-        _cpp_methods.sortAlongAxis(self, 0, axis)
+    Both arrays support the buffer protocol so they can be used with
+    numpy.frombuffer(offsets, dtype=numpy.int32) without creating any
+    per-element Python objects.
 
-    # Sort the primitives along an axis.
-    elif geometry_type == hou.geometryType.Primitives:
-        _cpp_methods.sortAlongAxis(self, 1, axis)
+    """
+    import ctypes
 
+    if kind == "edge":
+        mode = 1
+    elif kind == "point":
+        mode = 0
     else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+        raise ValueError("Invalid adjacency kind: {0}".format(kind))
 
+    # The offsets contain an extra entry for the end of the last primitive.
+    offsets = _createCIntArray(len(self.iterPrims()) + 1)
 
-@addToClass(hou.Geometry)
-def sortByValues(self, geometry_type, values):
-    """Sort points or primitives based on a list of corresponding values.
+    # The exact total number of neighbors.
+    count = (ctypes.c_int64 * 1)()
 
-    Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
-        values : (list)
-            A list of numbers to sort by.
+    # Fill the offsets and count the neighbors so the neighbors can be
+    # stored in a list of exactly the right size.
+    result = _topology_methods.primAdjacencyOffsets(
+        self,
+        mode,
+        offsets,
+        count
+    )
 
-    Returns: N/A
+    if result == 1:
+        raise hou.OperationFailed("Too many adjacent primitives.")
 
-    Raises:
-        OperationFailed
-            This exception is raised if 'geometry_type' is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+    neighbors = _createCIntArray(count[0])
 
-    The list of values must be the same length as the number of geometry
-    elements to be sourced.
+    if count[0]:
+        _topology_methods.primAdjacencyNeighbors(self, mode, neighbors)
+
+    return offsets, neighbors
+
+
+@addToClass(hou.Point)
+def connectedPrims(self):
+    """Get all primitives that reference this point.
+
+    Returns:
+        tuple
+            A tuple of hou.Prim objects that reference the point.
+
+    Raises: N/A
 
     """
-    if geometry_type == hou.geometryType.Points:
-        # Check we have enough points.
-        if len(values) != len(self.iterPoints()):
-            raise hou.OperationFailed(
-                "Length of values must equal the number of points."
-            )
+    # Get the geometry the point belongs to.
+    geometry = self.geometry()
 
-        # Construct a ctypes float array to pass the values.
-        arr = _buildCFloatArray(values)
+    # Get a list of primitive numbers that reference the point.
+    result = _topology_methods.connectedPrims(geometry, self.number())
 
-        _cpp_methods.sortByValues(self, 0, arr)
+    return _getPrimsFromList(geometry, result)
 
-    elif geometry_type == hou.geometryType.Primitives:
-        # Check we have enough primitives.
-        if len(values) != len(self.iterPrims()):
-            raise hou.OperationFailed(
-                "Length of values must equal the number of prims."
-            )
 
-        # Construct a ctypes float array to pass the values.
-        arr = _buildCFloatArray(values)
+@addToClass(hou.Point)
+def connectedPoints(self):
+    """Get all points that share an edge with this point.
+
+    Returns:
+        tuple
+            A tuple of hou.Point objects that share an edge with
+            the point.
+
+    Raises: N/A
 
-        _cpp_methods.sortByValues(self, 1, arr)
+    """
+    # Get the geometry the point belongs to.
+    geometry = self.geometry()
 
-    else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+    # Get a list of point numbers that are connected to the point.
+    result = _topology_methods.connectedPoints(geometry, self.number())
 
+    # Glob for the points and return them.
+    return _getPointsFromList(geometry, result)
 
-@addToClass(hou.Geometry)
-def sortRandomly(self, geometry_type, seed=0.0):
-    """Sort points or primitives randomly.
 
-    Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
-        seed=0.0 : (float)
-            The amount to shift each elements number.
+@addToClass(hou.Geometry)
+def pointGraph(self):
+    """Get every unique edge between points in the geometry.
 
-    Returns: N/A
+    Returns:
+        tuple
+            A tuple of (sources, targets) ctypes int arrays.
 
-    Raises:
-        TypeError
-            This exception is raised if 'seed' is not a number.
-        OperationFailed
-            This exception is raised if 'geometry_type' is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+    Raises: N/A
 
-    """
-    if not isinstance(seed, (float, int)):
-        raise TypeError(
-            "Got '{0}', expected 'float'.".format(type(seed).__name__)
-        )
+    Each edge is stored once, regardless of how many faces share it, as the
+    point numbers sources[i] and targets[i], where sources[i] is always the
+    lower point number.  The edges are ordered by source then target.
 
-    # Randomize the point order.
-    if geometry_type == hou.geometryType.Points:
-        _cpp_methods.sortListRandomly(self, 0, seed)
+    Both arrays are contiguous 32 bit integer buffers so they can be used
+    with numpy.frombuffer(sources, dtype=numpy.int32) without creating any
+    per-element Python objects.
 
-    # Randomize the primitive order.
-    elif geometry_type == hou.geometryType.Primitives:
-        _cpp_methods.sortListRandomly(self, 1, seed)
+    """
+    # The number of vertices is an upper bound on the number of edges.
+    max_edges = _topology_methods.vertexCount(self)
 
-    else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+    sources = _createCIntArray(max_edges)
+    targets = _createCIntArray(max_edges)
 
+    count = _topology_methods.pointGraph(self, sources, targets)
 
-@addToClass(hou.Geometry)
-def shiftElements(self, geometry_type, offset=0):
-    """Shift all point or primitives indices forward by an offset.
+    return _truncateCArray(sources, count), _truncateCArray(targets, count)
 
-    Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
-        offset=0 : (int)
-            The amount to shift each elements number.
 
-    Returns: N/A
+@addToClass(hou.Point)
+def referencingVertices(self):
+    """Get all the vertices referencing this point.
 
-    Raises:
-        TypeError
-            This exception is raised if 'offset' is not an integer.
-        OperationFailed
-            This exception is raised if 'geometry_type' is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+    Returns:
+        tuple
+            A tuple of hou.Vertex objects that reference the point.
 
-    Each point or primitive number gets the offset added to it to get its new
-    number.  If this exceeds the number of points or primitives, it wraps
-    around.
+    Raises: N/A
 
     """
-    if not isinstance(offset, int):
-        raise TypeError(
-            "Got '{0}', expected 'int'.".format(type(offset).__name__)
-        )
-
-    # Shift the point order.
-    if geometry_type == hou.geometryType.Points:
-        _cpp_methods.shiftList(self, 0, offset)
+    # Get the geometry the point belongs to.
+    geometry = self.geometry()
 
-    # Shift the primitive order.
-    elif geometry_type == hou.geometryType.Primitives:
-        _cpp_methods.shiftList(self, 1, offset)
+    # Get an object containing primitive and vertex index information.
+    result = _topology_methods.referencingVertices(geometry, self.number())
 
-    else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+    # Build the vertices directly from the primitive numbers and indices.
+    return _getVerticesFromList(geometry, result.prims, result.indices)
 
 
 @addToClass(hou.Geometry)
-def reverseSort(self, geometry_type):
-    """Reverse the ordering of the points or primitives.
+def pointToVertexIndex(self):
+    """Get the vertices referencing every point in the geometry.
 
-    Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
+    Returns:
+        tuple
+            A tuple of (offsets, prims, indices) ctypes int arrays.
 
-    Returns: N/A
+    Raises: N/A
 
-    Raises:
-        OperationFailed
-            This exception is raised if geometry_type is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+    The index is returned in compressed sparse row form.  The vertices
+    referencing point i are the vertices at the local vertex indices
+    indices[offsets[i]:offsets[i+1]] of the primitives
+    prims[offsets[i]:offsets[i+1]].
 
-    The highest numbered becomes the lowest numbered, and vice versa.
+    The index is built in linear time in a single call, after which any per
+    point vertex query is a constant time lookup.  All arrays support the
+    buffer protocol so they can be used with numpy.frombuffer() without
+    copying.
 
     """
-    # Reverse the point order.
-    if geometry_type == hou.geometryType.Points:
-        _cpp_methods.reverseList(self, 0)
+    num_vertices = _topology_methods.vertexCount(self)
 
-    # Reverse the primitive order.
-    elif geometry_type == hou.geometryType.Primitives:
-        _cpp_methods.reverseList(self, 1)
+    # The offsets contain an extra entry for the end of the last point.
+    offsets = _createCIntArray(len(self.iterPoints()) + 1)
 
-    else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+    prims = _createCIntArray(num_vertices)
+    indices = _createCIntArray(num_vertices)
+
+    _topology_methods.pointToVertexIndex(self, offsets, prims, indices)
+
+    return offsets, prims, indices
 
 
 @addToClass(hou.Geometry)
-def sortByProximityToPosition(self, geometry_type, pos):
-    """Sort elements by their proximity to a point.
+def pointStringAttribValues(self, name, group=None, index_range=None):
+    """Return a tuple of strings containing one attribute's values for all the
+    points.
 
     Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
-        pos : (hou.Vector3)
-            A location in space.
+        name : (string)
+            The name of the point attribute.
+        group=None : (hou.PointGroup)
+            An optional point group to restrict the points to.
+        index_range=None : (tuple)
+            An optional (start, end) range of point numbers to restrict the
+            points to.  The end number is not included.
 
-    Returns: N/A
+    Returns:
+        tuple
+            A tuple of strings representing the attribute values for
+            each point.
 
     Raises:
-        OperationFailed
-            This exception is raised if geometry_type is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string attribute or the group does not
+            exist.
+        TypeError
+            Raise this exception if the group is not a hou.PointGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
 
-    The distance to the point in space is used as a priority. The points or
-    primitives are then sorted so that the 0th entity is the one closest to
-    that point.
-    """
-    # Sort the points.
-    if geometry_type == hou.geometryType.Points:
-        _cpp_methods.proximityToList(self, 0, pos)
+    If a group or index range is passed, only the values of the points in
+    them are returned, in point number order.  The time taken is proportional
+    to the number of points read.
 
-    # Sort the primitives.
-    elif geometry_type == hou.geometryType.Primitives:
-        _cpp_methods.proximityToList(self, 1, pos)
+    """
+    attrib = self.findPointAttrib(name)
 
-    else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
 
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
 
-@addToClass(hou.Geometry)
-def sortByVertexOrder(self):
-    """Sorts points to match the order of the vertices on the primitives.
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PointGroup
+    )
 
-    Returns: N/A
+    # The number of values read, or -1 if the group is invalid.
+    count = _createCIntArray(1)
 
-    Raises: N/A
+    values = _attrib_methods.pointStringAttribValues(
+        self,
+        name,
+        group_name,
+        start,
+        end,
+        count
+    )
 
-    If you have a curve whose point numbers do not increase along the curve,
-    this will reorder the point numbers so they match the curve direction.
+    if count[0] == -1:
+        raise hou.OperationFailed("Invalid group.")
 
-    """
-    _cpp_methods.sortByVertexOrder(self)
+    return values
 
 
 @addToClass(hou.Geometry)
-def sortByExpression(self, geometry_type, expression):
-    """Sort points or primitives based on an expression for each element.
+def setPointStringAttribValues(self, name, values, group=None,
+                               index_range=None):
+    """Set the string attribute values for all points.
 
     Args:
-        geometry_type : (hou.geometryType)
-            The type of geometry elements to sort.
-        expression : (str)
-            An expression to evaluate for each point or primitive.
-
-    Returns: N/A
+        name : (string)
+            The name of the point attribute.
+        values : (tuple)
+            A tuple of strings representing the attribute values for each
+            point.
+        group=None : (hou.PointGroup)
+            An optional point group to restrict the points to.
+        index_range=None : (tuple)
+            An optional (start, end) range of point numbers to restrict the
+            points to.  The end number is not included.
 
     Raises:
-        hou.GeometryPermissionError
-            This exception is raised if the geometry is not writeable.
-        OperationFailed
-            This exception is raised if geometry_type is not one of
-            (hou.geometryType.Points or hou.geometryType.Primitives).
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string, the array of values is not the
+            correct size or the group does not exist.
+        TypeError
+            Raise this exception if the group is not a hou.PointGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
 
-    The specified expression is evaluated for each point or primitive. This
-    determines the priority of that primitive, and the entities are reordered
-    according to that priority. The point or primitive with the least evaluated
-    expression value will be numbered 0 after the sort.
+    If a group or index range is passed, there must be one value for each
+    point in them, in point number order.  Only those points are
+    set, so the time taken is proportional to the number of points set.
 
     """
-    # Make sure the geometry is not read only.
-    if self.isReadOnly():
-        raise hou.GeometryPermissionError()
+    attrib = self.findPointAttrib(name)
 
-    values = []
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
 
-    # Get the current cooking SOP node.  We need to do this as the geometry is
-    # frozen and  has no reference to the SOP node it belongs to.
-    sop_node = hou.pwd()
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
 
-    if geometry_type == hou.geometryType.Points:
-        # Iterate over each point.
-        for point in self.points():
-            # Get this point to be the current point.  This allows '$PT' to
-            # work properly in the expression.
-            sop_node.setCurPoint(point)
-            # Add the evaluated expression value to the list.
-            values.append(hou.hscriptExpression(expression))
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PointGroup
+    )
 
-    elif geometry_type == hou.geometryType.Primitives:
-        # Iterate over each primitive.
-        for prim in self.prims():
-            # Get this point to be the current point.  This allows '$PR' to
-            # work properly in the expression.
-            sop_node.setCurPrim(prim)
-            # Add the evaluated expression value to the list.
-            values.append(hou.hscriptExpression(expression))
+    # Construct a ctypes string array to pass the strings.
+    arr = _buildCStringArray(values)
 
-    else:
-        raise hou.OperationFailed(
-            "Geometry type must be points or primitives."
-        )
+    result = _attrib_methods.setPointStringAttribValues(
+        self,
+        name,
+        arr,
+        len(values),
+        group_name,
+        start,
+        end
+    )
+
+    # Check the result for errors.
+    if result == 2:
+        raise hou.OperationFailed("Incorrect attribute value sequence size.")
 
-    sortByValues(self, geometry_type, values)
+    elif result == 3:
+        raise hou.OperationFailed("Invalid group.")
 
 
 @addToClass(hou.Geometry)
-def createPoint(self, position=None):
-    """Create a new point, optionally located at a position.
+def setSharedPointStringAttrib(self, attribute, value, group=None):
+    """Set a string attribute value for points.
 
     Args:
-        position=None : (hou.Vector3)
-            The position to create the point at.  A value of None will
-            create the point at the origin.
+        attribute : (hou.Attrib)
+            The string attribute to set.
+        value : (string)
+            The attribute value to set.
+        group=None (hou.PointGroup)
+            An optional point group to specify which points to set.
 
-    Returns:
-        hou.Point
-            The newly created point.
+    Returns: N/A
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute is invalid.
+
+    If group is None, all points will have receive the value.  If a group is
+    passed, only the points in the group will be set.
 
     """
-    # If no position is specified, use the origin.
-    if position is None:
-        position = hou.Vector3()
+    # If the group is valid, use that group's name.
+    if group:
+        group_name = group.name()
+    # If not, pass an empty string to signify no group.
+    else:
+        group_name = ""
 
-    result = _cpp_methods.createPoint(self, position)
+    result = _attrib_methods.setSharedPointStringAttrib(
+        self,
+        attribute.name(),
+        value,
+        group_name
+    )
 
-    return self.iterPoints()[result]
+    # Check the result for errors.
+    if result == 1:
+        raise hou.OperationFailed("Invalid attribute.")
 
 
 @addToClass(hou.Geometry)
-def createPoints(self, count):
-    """Create a specific number of new points.
+def primStringAttribValues(self, name, group=None, index_range=None):
+    """Return a tuple of strings containing one attribute's values for all the
+    primitives.
 
     Args:
-        count : (int)
-            The number of new points to create.
+        name : (string)
+            The name of the primitive attribute.
+        group=None : (hou.PrimGroup)
+            An optional primitive group to restrict the primitives to.
+        index_range=None : (tuple)
+            An optional (start, end) range of primitive numbers to restrict the
+            primitives to.  The end number is not included.
 
     Returns:
         tuple
-            A tuple of the hou.Point objects created.
+            A tuple of strings representing the attribute values for each
+            primitive.
 
     Raises:
         hou.OperationFailed
-            Raise this exception if count is not greater than 0.
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string or the group does not exist.
+        TypeError
+            Raise this exception if the group is not a hou.PrimGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
+
+    If a group or index range is passed, only the values of the primitives in
+    them are returned, in primitive number order.  The time taken is
+    proportional to the number of primitives read.
 
     """
-    if count <= 0:
-        raise hou.OperationFailed("Invalid number of points.")
+    attrib = self.findPrimAttrib(name)
 
-    result = _cpp_methods.createPoints(self, count)
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
 
-    return _getPointsFromList(self, result)
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
+
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PrimGroup
+    )
+
+    # The number of values read, or -1 if the group is invalid.
+    count = _createCIntArray(1)
+
+    values = _attrib_methods.primStringAttribValues(
+        self,
+        name,
+        group_name,
+        start,
+        end,
+        count
+    )
+
+    if count[0] == -1:
+        raise hou.OperationFailed("Invalid group.")
+
+    return values
 
 
 @addToClass(hou.Geometry)
-def varmap(self):
-    """Get the varmap as a dictionary.
+def setPrimStringAttribValues(self, name, values, group=None,
+                              index_range=None):
+    """Set the string attribute values for all primitives.
 
-    Returns:
-        dict|None
-            A dictionary representing the varmap attribute, if it exists.  If
-            the attribute does not exist, returns None.
+    Args:
+        name : (string)
+            The name of the primitive attribute.
+        values : (tuple)
+            A tuple of strings representing the attribute values for each
+            primitive.
+        group=None : (hou.PrimGroup)
+            An optional primitive group to restrict the primitives to.
+        index_range=None : (tuple)
+            An optional (start, end) range of primitive numbers to restrict the
+            primitives to.  The end number is not included.
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string, the array of values is not the
+            correct size or the group does not exist.
+        TypeError
+            Raise this exception if the group is not a hou.PrimGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
 
-    This function returns a dictionary representing the varmap attribute whose
-    keys are the attribute names and values are the variable names.
+    If a group or index range is passed, there must be one value for each
+    primitive in them, in primitive number order.  Only those primitives are
+    set, so the time taken is proportional to the number of primitives set.
 
     """
-    # Try to find the detail attribute.
-    varmap_attrib = self.findGlobalAttrib("varmap")
+    attrib = self.findPrimAttrib(name)
 
-    # If it does not exists, return None.
-    if varmap_attrib is None:
-        return None
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
 
-    # Get the value(s).
-    values = self.attribValue(varmap_attrib)
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
 
-    # If the value is a single string, convert it to a tuple.
-    if isinstance(values, str):
-        values = (values, )
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PrimGroup
+    )
 
-    # The varmap dictionary.
-    varmap_dict = {}
+    # Construct a ctypes string array to pass the strings.
+    arr = _buildCStringArray(values)
 
-    for entry in values:
-        # Split the value based on the mapping indicator.
-        attrib_name, var = entry.split(" -> ")
+    result = _attrib_methods.setPrimStringAttribValues(
+        self,
+        name,
+        arr,
+        len(values),
+        group_name,
+        start,
+        end
+    )
 
-        # Add the information to the dictionary.
-        varmap_dict[attrib_name] = var
+    # Check the result for errors.
+    if result == 2:
+        raise hou.OperationFailed("Incorrect attribute value sequence size.")
 
-    return varmap_dict
+    elif result == 3:
+        raise hou.OperationFailed("Invalid group.")
 
 
 @addToClass(hou.Geometry)
-def setVarmap(self, varmap_dict):
-    """Set the varmap based on the dictionary.
+def setSharedPrimStringAttrib(self, attribute, value, group=None):
+    """Set a string attribute value for primitives.
 
     Args:
-        varmap_dict : (dict)
-            A dictionary of attribute and variable names to set
-            the varmap as.
+        attribute : (hou.Attrib)
+            The string attribute to set.
+        value : (string)
+            The attribute value to set.
+        group=None : (hou.PrimGroup)
+            An optional primitive group to specify which primitives
+            to set.
 
     Returns: N/A
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute is invalid.
 
-    This function will create variable mappings between the keys and values of
-    the dictionary.  If the attribute does not exist it will be created.
+    If group is None, all primitives will have receive the value.  If a group
+    is passed, only the primitives in the group will be set.
 
     """
-    # Create varmap string mappings from the key/value pairs.
-    strings = ["{0} -> {1}".format(attrib_name, var)
-               for attrib_name, var in varmap_dict.iteritems()]
+    # If the group is valid, use that group's name.
+    if group:
+        group_name = group.name()
+    # If not, pass an empty string to signify no group.
+    else:
+        group_name = ""
 
-    # Construct a ctypes string array to pass the strings.
-    arr = _buildCStringArray(strings)
+    result = _attrib_methods.setSharedPrimStringAttrib(
+        self,
+        attribute.name(),
+        value,
+        group_name
+    )
 
-    # Update the varmap.
-    _cpp_methods.setVarmap(self, arr, len(strings))
+    # Check the result for errors.
+    if result == 1:
+        raise hou.OperationFailed("Invalid attribute.")
 
 
 @addToClass(hou.Geometry)
-def addVariableName(self, attrib, var_name):
-    """Add a variable mapping to the attribute in the varmap.
+def pointStringAttribIndices(self, name, group=None, index_range=None):
+    """Return the unique values of a string attribute and the index of each
+    point's value.
 
     Args:
-        attrib : (hou.Attrib)
-            The attribute to create a variable mapping for.
-        var_name : (string)
-            The variable name to map to the attribute.
+        name : (string)
+            The name of the point attribute.
+        group=None : (hou.PointGroup)
+            An optional point group to restrict the points to.
+        index_range=None : (tuple)
+            An optional (start, end) range of point numbers to restrict the
+            points to.  The end number is not included.
 
-    Returns: N/A
+    Returns:
+        tuple
+            A tuple of (strings, indices).  'strings' is a tuple of the unique
+            string values and 'indices' is a ctypes int array containing the
+            index into 'strings' of each point's value.
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string attribute or the group does not
+            exist.
+        TypeError
+            Raise this exception if the group is not a hou.PointGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
+
+    If a group or index range is passed, only the points in them are read, in
+    point number order.
+
+    This avoids creating a Python string for every point.  The indices
+    support the buffer protocol so they can be used with numpy.frombuffer()
+    without copying.
 
     """
-    _cpp_methods.addVariableName(self, attrib.name(), var_name)
+    attrib = self.findPointAttrib(name)
 
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
 
-@addToClass(hou.Geometry)
-def removeVariableName(self, var_name):
-    """Remove a variable mapping from the varmap.
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
 
-    Args:
-        var_name : (string)
-            The variable name to remove the mapping for.
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PointGroup
+    )
 
-    Returns: N/A
+    # Allocate enough indices for the most points that can be read so the
+    # range only needs to be built once.
+    max_count = len(self.iterPoints())
 
-    Raises: N/A
+    if end != -1:
+        max_count = min(max_count, end - start)
 
-    """
-    _cpp_methods.removeVariableName(self, var_name)
+    indices = _createCIntArray(max_count)
 
+    # The number of points read, or -1 if the group is invalid.
+    count = _createCIntArray(1)
 
-@addToClass(hou.Attrib, name="rename")
-def renameAttribute(self, new_name):
-    """Rename this attribute.
+    strings = _attrib_methods.stringAttribIndices(
+        self,
+        0,
+        name,
+        indices,
+        count,
+        group_name,
+        start,
+        end
+    )
 
-    Args:
-        new_name : (string)
-            The new attribute name.
+    if count[0] == -1:
+        raise hou.OperationFailed("Invalid group.")
 
-    Returns:
-        hou.Attrib|None
-            Returns the newly renamed attribute if successful, otherwise
-            None.
+    return tuple(strings), _truncateCArray(indices, count[0])
 
-    Raises:
-        hou.OperationFailed:
-            Raises this exception if you try to destroy 'P'.
 
-    """
-    geometry = self.geometry()
+@addToClass(hou.Geometry)
+def primStringAttribIndices(self, name, group=None, index_range=None):
+    """Return the unique values of a string attribute and the index of each
+    primitive's value.
 
-    attrib_type = self.type()
+    Args:
+        name : (string)
+            The name of the primitive attribute.
+        group=None : (hou.PrimGroup)
+            An optional primitive group to restrict the primitives to.
+        index_range=None : (tuple)
+            An optional (start, end) range of primitive numbers to restrict the
+            primitives to.  The end number is not included.
 
-    # Get the attribute type as an integer corresponding to the
-    # GA_AttributeOwner enum.
-    if attrib_type == hou.attribType.Vertex:
-        owner = 0
-    elif attrib_type == hou.attribType.Point:
-        owner = 1
-    elif attrib_type == hou.attribType.Prim:
-        owner = 2
-    else:
-        owner = 3
+    Returns:
+        tuple
+            A tuple of (strings, indices).  'strings' is a tuple of the unique
+            string values and 'indices' is a ctypes int array containing the
+            index into 'strings' of each primitive's value.
 
-    # Raise an exception when trying to modify 'P'.
-    if attrib_type == hou.attribType.Point and self.name() == "P":
-        raise hou.OperationFailed("Renaming 'P' is not permitted.")
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string attribute or the group does not
+            exist.
+        TypeError
+            Raise this exception if the group is not a hou.PrimGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
 
-    # Try to rename the attribute.
-    success = _cpp_methods.renameAttribute(
-        geometry,
-        owner,
-        self.name(),
-        new_name
-    )
+    If a group or index range is passed, only the primitives in them are read,
+    in primitive number order.
 
-    # That attribute was renamed.
-    if success:
-        # Return the new attribute.
-        if attrib_type == hou.attribType.Vertex:
-            return geometry.findVertexAttrib(new_name)
-        elif attrib_type == hou.attribType.Point:
-            return geometry.findPointAttrib(new_name)
-        elif attrib_type == hou.attribType.Prim:
-            return geometry.findPrimAttrib(new_name)
-        else:
-            return geometry.findGlobalAttrib(new_name)
+    This avoids creating a Python string for every primitive.  The indices
+    support the buffer protocol so they can be used with numpy.frombuffer()
+    without copying.
 
-    return None
+    """
+    attrib = self.findPrimAttrib(name)
+
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
 
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
 
-@addToClass(hou.Geometry)
-def findPrimByName(self, name_to_match, name_attribute="name", match_number=0):
-    """Find a primitive with a matching name attribute value.
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PrimGroup
+    )
 
-    Args:
-        name_to_match : (string)
-            The name attribute value to match.
-        name_attribute="name" : (string)
-            The attribute name to use.
-        match_number=0 : (int)
-            The match_numberth matching primitive to return.
+    # Allocate enough indices for the most primitives that can be read so the
+    # range only needs to be built once.
+    max_count = len(self.iterPrims())
 
-    Returns:
-        hou.Primitive|None
-            A matching primitive, if found.  If no primitive is found, returns
-            None.  None is also returned if match_number is greater than the
-            number of matches found.
+    if end != -1:
+        max_count = min(max_count, end - start)
 
-    Raises: N/A
+    indices = _createCIntArray(max_count)
 
-    """
-    # Try to find a primitive matching the name.
-    result = _cpp_methods.findPrimitiveByName(
+    # The number of primitives read, or -1 if the group is invalid.
+    count = _createCIntArray(1)
+
+    strings = _attrib_methods.stringAttribIndices(
         self,
-        name_to_match,
-        name_attribute,
-        match_number
+        1,
+        name,
+        indices,
+        count,
+        group_name,
+        start,
+        end
     )
 
-    # If the result is -1, no prims were found so return None.
-    if result == -1:
-        return None
+    if count[0] == -1:
+        raise hou.OperationFailed("Invalid group.")
 
-    #  Return the primitive.
-    return self.iterPrims()[result]
+    return tuple(strings), _truncateCArray(indices, count[0])
 
 
 @addToClass(hou.Geometry)
-def findAllPrimsByName(self, name_to_match, name_attribute="name"):
-    """Find all primitives with a matching name attribute value.
+def setPointStringAttribIndices(self, name, strings, indices, group=None,
+                                index_range=None):
+    """Set the string attribute values for all points from a table of strings.
 
     Args:
-        name_to_match : (string)
-            The name attribute value to match.
-        name_attribute="name" : (string)
-            The attribute name to use.
+        name : (string)
+            The name of the point attribute.
+        strings : (tuple)
+            A tuple of the unique strings to set.
+        indices : (list|tuple|buffer)
+            The index into 'strings' of each point's value.
+        group=None : (hou.PointGroup)
+            An optional point group to restrict the points to.
+        index_range=None : (tuple)
+            An optional (start, end) range of point numbers to restrict the
+            points to.  The end number is not included.
 
-    Returns:
-        tuple
-            A tuple of hou.Prim objects whose attribute values match.
+    Returns: N/A
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string, the number of indices is not the
+            correct size, an index is out of range or the group does not
+            exist.
+        TypeError
+            Raise this exception if the group is not a hou.PointGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
+
+    If a group or index range is passed, there must be one index for each
+    point in them, in point number order.
+
+    Each string is only added to the attribute's string table once, after
+    which every point using it is set by its string handle.  The indices may
+    be a buffer of 32 bit integers, such as the indices returned by
+    pointStringAttribIndices() or a numpy int32 array, in which case they
+    are not copied.
 
     """
-    # Try to find matching primitives.
-    result = _cpp_methods.findAllPrimitivesByName(
+    import ctypes
+
+    attrib = self.findPointAttrib(name)
+
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
+
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
+
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PointGroup
+    )
+
+    # Construct a ctypes string array to pass the strings.
+    arr = _buildCStringArray(strings)
+
+    result = _attrib_methods.setStringAttribIndices(
         self,
-        name_to_match,
-        name_attribute
+        0,
+        name,
+        arr,
+        len(strings),
+        _getCArray(indices, ctypes.c_int),
+        len(indices),
+        group_name,
+        start,
+        end
     )
 
-    # Return a tuple of the matching primitives if any were found.
-    if result:
-        return _getPrimsFromList(self, result)
+    # Check the result for errors.
+    if result == 2:
+        raise hou.OperationFailed("Invalid string index.")
 
-    # If none were found, return an empty tuple.
-    return ()
+    elif result == 3:
+        raise hou.OperationFailed("Incorrect attribute value sequence size.")
 
+    elif result == 4:
+        raise hou.OperationFailed("Invalid group.")
 
-@addToClass(hou.Point, name="copyAttributeValues")
-def copyPointAttributeValues(self, source_point, attributes):
-    """Copy attribute values from the source point to this point.
+
+@addToClass(hou.Geometry)
+def setPrimStringAttribIndices(self, name, strings, indices, group=None,
+                               index_range=None):
+    """Set the string attribute values for all primitives from a table of
+    strings.
 
     Args:
-        source_point : (hou.Point)
-            The point to copy the attribute values from.
-        attributes : (list)
-            A list of hou.Attrib objects representing point attributes on the
-            source geometry.
+        name : (string)
+            The name of the primitive attribute.
+        strings : (tuple)
+            A tuple of the unique strings to set.
+        indices : (list|tuple|buffer)
+            The index into 'strings' of each primitive's value.
+        group=None : (hou.PrimGroup)
+            An optional primitive group to restrict the primitives to.
+        index_range=None : (tuple)
+            An optional (start, end) range of primitive numbers to restrict the
+            primitives to.  The end number is not included.
 
     Returns: N/A
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            Raise this exception if the attribute name is invalid, the
+            attribute is not a string, the number of indices is not the
+            correct size, an index is out of range or the group does not
+            exist.
+        TypeError
+            Raise this exception if the group is not a hou.PrimGroup.
+        ValueError
+            Raise this exception if the index range is invalid.
 
-    If the attributes do not exist on the destination point they will be
-    created.
+    If a group or index range is passed, there must be one index for each
+    primitive in them, in primitive number order.
+
+    Each string is only added to the attribute's string table once, after
+    which every primitive using it is set by its string handle.  The indices
+    may be a buffer of 32 bit integers, such as the indices returned by
+    primStringAttribIndices() or a numpy int32 array, in which case they are
+    not copied.
 
     """
-    # Get the source point's geometry.
-    source_geometry = source_point.geometry()
+    import ctypes
 
-    # Get the attribute names, ensuring we only use point attributes on the
-    # source point's geometry.
-    attrib_names = [
-        attrib.name() for attrib in attributes
-        if attrib.type() == hou.attribType.Point and
-        attrib.geometry().sopNode() == source_geometry.sopNode()
-    ]
+    attrib = self.findPrimAttrib(name)
+
+    if attrib is None:
+        raise hou.OperationFailed("Invalid attribute name.")
+
+    if attrib.dataType() != hou.attribData.String:
+        raise hou.OperationFailed("Attribute must be a string.")
+
+    group_name, start, end = _getElementRangeArgs(
+        group,
+        index_range,
+        hou.PrimGroup
+    )
 
     # Construct a ctypes string array to pass the strings.
-    arr = _buildCStringArray(attrib_names)
+    arr = _buildCStringArray(strings)
 
-    # Copy the values.
-    _cpp_methods.copyPointAttributeValues(
-        self.geometry(),
-        self.number(),
-        source_geometry,
-        source_point.number(),
+    result = _attrib_methods.setStringAttribIndices(
+        self,
+        1,
+        name,
         arr,
-        len(attrib_names)
+        len(strings),
+        _getCArray(indices, ctypes.c_int),
+        len(indices),
+        group_name,
+        start,
+        end
     )
 
+    # Check the result for errors.
+    if result == 2:
+        raise hou.OperationFailed("Invalid string index.")
 
-@addToClass(hou.Prim, name="copyAttributeValues")
-def copyPrimAttributeValues(self, source_prim, attributes):
-    """Copy attribute values from the source primitive to this primitive.
-
-    Args:
-        source_prim : (hou.Prim)
-            The primitive to copy the attribute values from.
-        attributes : (list)
-            A list of hou.Attrib objects representing primitive attributes
-            on the source geometry.
+    elif result == 3:
+        raise hou.OperationFailed("Incorrect attribute value sequence size.")
 
-    Returns: N/A
+    elif result == 4:
+        raise hou.OperationFailed("Invalid group.")
 
-    Raises: N/A
 
-    If the attributes do not exist on the destination primitive they will be
-    created.
+@addToClass(hou.Face)
+def hasEdge(self, point1, point2):
+    """Test if this face has an edge between two points.
 
-    """
-    # Get the source primitive's geometry.
-    source_geometry = source_prim.geometry()
+    Args:
+        point1 : (hou.Point)
+            An edge point.
+        point2 : (hou.Point)
+            An edge point.
 
-    # Get the attribute names, ensuring we only use primitive attributes on the
-    # source primitive's geometry.
-    attrib_names = [
-        attrib.name() for attrib in attributes
-        if attrib.type() == hou.attribType.Prim and
-        attrib.geometry().sopNode() == source_geometry.sopNode()
-    ]
+    Returns:
+        bool
+            Returns True if an edge exists, otherwise False.
 
-    # Construct a ctypes string array to pass the strings.
-    arr = _buildCStringArray(attrib_names)
+    Raises: N/A
 
-    # Copy the values.
-    _cpp_methods.copyPrimAttributeValues(
+    """
+    # Test for the edge.
+    return _topology_methods.hasEdge(
         self.geometry(),
         self.number(),
-        source_geometry,
-        source_prim.number(),
-        arr,
-        len(attrib_names)
+        point1.number(),
+        point2.number()
     )
 
 
-@addToClass(hou.Prim)
-def pointAdjacentPolygons(self):
-    """Get all prims that are adjacent to this prim through a point.
+@addToClass(hou.Face)
+def insertVertex(self, point, index):
+    """Insert a vertex on the point into this face at a specific index.
 
-    Returns:
-        tuple
-            A tuple of hou.Prim objects.
+    Args:
+        point : (hou.Point)
+            The point the vertex will be attached to.
+        index : (int)
+            The index of the vertex to insert.
+
+    Returns: N/A
 
     Raises: N/A
 
     """
-    # Get the geometry this primitive belongs to.
-    geometry = self.geometry()
-
-    # Get a list of prim numbers that are point adjacent this prim.
-    result = _cpp_methods.pointAdjacentPolygons(geometry, self.number())
+    # Insert the vertex.
+    _topology_methods.insertVertex(
+        self.geometry(),
+        self.number(),
+        point.number(),
+        index
+    )
 
-    return _getPrimsFromList(geometry, result)
 
+@addToClass(hou.Face)
+def deleteVertex(self, index):
+    """Delete the vertex at the specified index.
 
-@addToClass(hou.Prim)
-def edgeAdjacentPolygons(self):
-    """Get all prims that are adjacent to this prim through an edge.
+    Args:
+        index : (int)
+            The index of the vertex to delete.
 
-    Returns:
-        tuple
-            A tuple of hou.Prim objects.
+    Returns: N/A
 
     Raises: N/A
 
     """
-    # Get the geometry this primitive belongs to.
-    geometry = self.geometry()
-
-    # Get a list of prim numbers that are edge adjacent this prim.
-    result = _cpp_methods.edgeAdjacentPolygons(geometry, self.number())
+    # Delete teh vertex.
+    _topology_methods.deleteVertex(self.geometry(), self.number(), index)
 
-    return _getPrimsFromList(geometry, result)
 
+@addToClass(hou.Face)
+def setPoint(self, index, point):
+    """Set the vertex, at the specified index, to be attached to the point.
 
-@addToClass(hou.Point)
-def connectedPrims(self):
-    """Get all primitives that reference this point.
+    Args:
+        index : (int)
+            The index of the vertex to modify.
+        point : (hou.Point)
+            The point to attach the vertex to.
 
-    Returns:
-        tuple
-            A tuple of hou.Prim objects that reference the point.
+    Returns: N/A
 
     Raises: N/A
 
     """
-    # Get the geometry the point belongs to.
-    geometry = self.geometry()
-
-    # Get a list of primitive numbers that reference the point.
-    result = _cpp_methods.connectedPrims(geometry, self.number())
-
-    return _getPrimsFromList(geometry, result)
+    # Delete teh vertex.
+    _topology_methods.setPoint(
+        self.geometry(),
+        self.number(),
+        index,
+        point.number()
+    )
 
 
-@addToClass(hou.Point)
-def connectedPoints(self):
-    """Get all points that share an edge with this point.
+@addToClass(hou.Prim)
+def baryCenter(self):
+    """Get the barycenter of this primitive.
 
     Returns:
-        tuple
-            A tuple of hou.Point objects that share an edge with
-            the point.
+        hou.Vector3
+            The barycenter of the primitive.
 
     Raises: N/A
 
-    """
-    # Get the geometry the point belongs to.
-    geometry = self.geometry()
-
-    # Get a list of point numbers that are connected to the point.
-    result = _cpp_methods.connectedPoints(geometry, self.number())
+    """
+    # Get the Position3D object representing the barycenter.
+    pos = _topology_methods.baryCenter(self.geometry(), self.number())
 
-    # Glob for the points and return them.
-    return _getPointsFromList(self, result)
+    # Construct a vector and return it.
+    return hou.Vector3(pos.x, pos.y, pos.z)
 
 
-@addToClass(hou.Point)
-def referencingVertices(self):
-    """Get all the vertices referencing this point.
+@addToClass(hou.Prim, name="area")
+def primitiveArea(self):
+    """Get the area of this primitive.
 
     Returns:
-        tuple
-            A tuple of hou.Vertex objects that reference the point.
+        float
+            The area of the primitive.
 
     Raises: N/A
 
     """
-    # Get the geometry the point belongs to.
-    geometry = self.geometry()
-
-    # Get an object containing primitive and vertex index information.
-    result = _cpp_methods.referencingVertices(geometry, self.number())
+    # Calculate and return the area.
+    return _topology_methods.primitiveArea(self.geometry(), self.number())
 
-    # Construct a list of vertex strings.  Each element has the format:
-    # {prim_num}v{vertex_index}.
-    vertex_strings = ["{0}v{1}".format(prim, idx)
-                      for prim, idx in zip(result.prims, result.indices)]
 
-    # Glob for the vertices and return them.
-    return geometry.globVertices(' '.join(vertex_strings))
+@addToClass(hou.Prim)
+def perimeter(self):
+    """Get the perimeter of this primitive.
 
+    Returns:
+        float
+            The perimeter of the primitive.
 
-@addToClass(hou.Geometry)
-def pointStringAttribValues(self, name):
-    """Return a tuple of strings containing one attribute's values for all the
-    points.
+    Raises: N/A
 
-    Args:
-        name : (string)
-            The name of the point attribute.
+    """
+    # Calculate and return the perimeter.
+    return _topology_methods.perimeter(self.geometry(), self.number())
 
-    Returns:
-        tuple
-            A tuple of strings representing the attribute values for
-            each point.
 
-    Raises:
-        hou.OperationFailed
-            Raise this exception if the attribute name is invalid or the
-            attribute is not a string attribute.
+@addToClass(hou.Prim, name="reverse")
+def reversePrim(self):
+    """Reverse the vertex order of this primitive.
 
-    """
-    attrib = self.findPointAttrib(name)
+    Returns: N/A
 
-    if attrib is None:
-        raise hou.OperationFailed("Invalid attribute name.")
+    Raises: N/A
 
-    if attrib.dataType() != hou.attribData.String:
-        raise hou.OperationFailed("Attribute must be a string.")
+    """
+    return _topology_methods.reversePrimitive(self.geometry(), self.number())
 
-    return _cpp_methods.pointStringAttribValues(self, name)
 
+@addToClass(hou.Prim)
+def makeUnique(self):
+    """Unique all the points that are in this primitive.
 
-@addToClass(hou.Geometry)
-def setPointStringAttribValues(self, name, values):
-    """Set the string attribute values for all points.
+    Returns: N/A
 
-    Args:
-        name : (string)
-            The name of the point attribute.
-        values : (tuple)
-            A tuple of strings representing the attribute values for each
-            point.
+    Raises: N/A
 
-    Raises:
-        hou.OperationFailed
-            Raise this exception if the attribute name is invalid, the
-            attribute is not a string, or the array of values is not the
-            correct size.
+    This function will unique all the points even if they are referenced by
+    other primitives.
 
     """
-    attrib = self.findPointAttrib(name)
+    return _topology_methods.makeUnique(self.geometry(), self.number())
 
-    if attrib is None:
-        raise hou.OperationFailed("Invalid attribute name.")
 
-    if attrib.dataType() != hou.attribData.String:
-        raise hou.OperationFailed("Attribute must be a string.")
+@addToClass(hou.Prim, name="boundingBox")
+def primBoundingBox(self):
+    """Get the bounding box of this primitive.
 
-    if len(values) != len(self.iterPoints()):
-        raise hou.OperationFailed("Incorrect attribute value sequence size.")
+    Returns:
+        hou.BoundingBox
+            The bounding box of the primitive.
 
-    # Construct a ctypes string array to pass the strings.
-    arr = _buildCStringArray(values)
+    Raises: N/A
 
-    return _cpp_methods.setPointStringAttribValues(
-        self,
-        name,
-        arr,
-        len(values)
-    )
+    """
+    # Calculate the bounds for the primitive.
+    bounds = _topology_methods.boundingBox(self.geometry(), self.number())
 
+    # Convert the bounds to a hou.BoundingBox and return it.
+    return _buildBoundingBox(bounds)
 
-@addToClass(hou.Geometry)
-def setSharedPointStringAttrib(self, attribute, value, group=None):
-    """Set a string attribute value for points.
 
-    Args:
-        attribute : (hou.Attrib)
-            The string attribute to set.
-        value : (string)
-            The attribute value to set.
-        group=None (hou.PointGroup)
-            An optional point group to specify which points to set.
+@addToClass(hou.Geometry, name="addPointNormals")
+def addPointNormalAttribute(self):
+    """Add point normals to the geometry.
 
-    Returns: N/A
+    Returns:
+        hou.Attrib
+            Returns the newly created point attribute.
 
     Raises:
         hou.OperationFailed
-            Raise this exception if the attribute is invalid.
-
-    If group is None, all points will have receive the value.  If a group is
-    passed, only the points in the group will be set.
+            Raise this exception if the attribute was not created.
 
     """
-    # If the group is valid, use that group's name.
-    if group:
-        group_name = group.name()
-    # If not, pass an empty string to signify no group.
-    else:
-        group_name = ""
-
-    result = _cpp_methods.setSharedPointStringAttrib(
-        self,
-        attribute.name(),
-        value,
-        group_name
-    )
+    result = _attrib_methods.addNormalAttribute(self)
 
-    # Check the result for errors.
-    if result == 1:
-        raise hou.OperationFailed("Invalid attribute.")
+    if result:
+        return self.findPointAttrib("N")
 
+    raise hou.OperationFailed("Could not add normal attribute.")
 
-@addToClass(hou.Geometry)
-def primStringAttribValues(self, name):
-    """Return a tuple of strings containing one attribute's values for all the
-    primitives.
 
-    Args:
-        name : (string)
-            The name of the primitive attribute.
+@addToClass(hou.Geometry, name="addPointVelocity")
+def addPointVelocityAttribute(self):
+    """Add point velocity to the geometry.
 
     Returns:
-        tuple
-            A tuple of strings representing the attribute values for each
-            primitive.
+        hou.Attrib
+            Returns the newly created point attribute.
 
     Raises:
         hou.OperationFailed
-            Raise this exception if the attribute name is invalid or the
-            attribute is not a string.
+            Raise this exception if the attribute was not created.
 
     """
-    attrib = self.findPrimAttrib(name)
+    result = _attrib_methods.addVelocityAttribute(self)
 
-    if attrib is None:
-        raise hou.OperationFailed("Invalid attribute name.")
-
-    if attrib.dataType() != hou.attribData.String:
-        raise hou.OperationFailed("Attribute must be a string.")
+    if result:
+        return self.findPointAttrib("v")
 
-    return _cpp_methods.primStringAttribValues(self, name)
+    raise hou.OperationFailed("Could not add velocity attribute.")
 
 
 @addToClass(hou.Geometry)
-def setPrimStringAttribValues(self, name, values):
-    """Set the string attribute values for all primitives.
+def addColorAttribute(self, attrib_type):
+    """Add a color (Cd) attribute to the geometry.
 
     Args:
-        name : (string)
-            The name of the primitive attribute.
-        values : (tuple)
-            A tuple of strings representing the attribute values for each
-            primitive.
+        attrib_type : (hou.attribType)
+            A hou.attribType value to specify if the attribute should be a
+            point, primitive or vertex attribute.
+
+    Returns:
+        hou.Attrib
+            Returns the newly created point attribute.
 
     Raises:
+        hou.TypeError
+            Raise this exception if attribute_type is not a valid type.
         hou.OperationFailed
-            Raise this exception if the attribute name is invalid, the
-            attribute is not a string, or the array of values is not the
-            correct size.
+            Raise this exception if the attribute was not created.
+
+    Point, primitive and vertex colors are supported.
 
     """
-    attrib = self.findPrimAttrib(name)
+    # Try to add a point Cd attribute.
+    if attrib_type == hou.attribType.Point:
+        result = _attrib_methods.addDiffuseAttribute(self, 0)
 
-    if attrib is None:
-        raise hou.OperationFailed("Invalid attribute name.")
+        if result:
+            return self.findPointAttrib("Cd")
 
-    if attrib.dataType() != hou.attribData.String:
-        raise hou.OperationFailed("Attribute must be a string.")
+    # Try to add a primitive Cd attribute.
+    elif attrib_type == hou.attribType.Prim:
+        result = _attrib_methods.addDiffuseAttribute(self, 1)
 
-    if len(values) != len(self.iterPrims()):
-        raise hou.OperationFailed("Incorrect attribute value sequence size.")
+        if result:
+            return self.findPrimAttrib("Cd")
 
-    # Construct a ctypes string array to pass the strings.
-    arr = _buildCStringArray(values)
+    # Try to add a vertex Cd attribute.
+    elif attrib_type == hou.attribType.Vertex:
+        result = _attrib_methods.addDiffuseAttribute(self, 2)
 
-    return _cpp_methods.setPrimStringAttribValues(
-        self,
-        name,
-        arr,
-        len(values)
-    )
+        if result:
+            return self.findVertexAttrib("Cd")
+
+    # The type didn't match any of the valid ones so we should thrown an
+    # exception.
+    else:
+        raise hou.TypeError("Invalid attribute type.")
 
+    # We didn't create an attribute, so throw an exception.
+    raise hou.OperationFailed("Could not add Cd attribute.")
 
-@addToClass(hou.Geometry)
-def setSharedPrimStringAttrib(self, attribute, value, group=None):
-    """Set a string attribute value for primitives.
 
-    Args:
-        attribute : (hou.Attrib)
-            The string attribute to set.
-        value : (string)
-            The attribute value to set.
-        group=None : (hou.PrimGroup)
-            An optional primitive group to specify which primitives
-            to set.
+@addToClass(hou.Geometry)
+def computePointNormals(self):
+    """Computes the point normals for the geometry.
 
     Returns: N/A
 
-    Raises:
-        hou.OperationFailed
-            Raise this exception if the attribute is invalid.
+    Raises: N/A
 
-    If group is None, all primitives will have receive the value.  If a group
-    is passed, only the primitives in the group will be set.
+    This is equivalent to using a Point sop, selecting 'Add Normal' and
+    leaving the default values.  It will add the 'N' attribute if it does not
+    exist.
 
     """
-    # If the group is valid, use that group's name.
-    if group:
-        group_name = group.name()
-    # If not, pass an empty string to signify no group.
-    else:
-        group_name = ""
-
-    result = _cpp_methods.setSharedPrimStringAttrib(
-        self,
-        attribute.name(),
-        value,
-        group_name
-    )
-
-    # Check the result for errors.
-    if result == 1:
-        raise hou.OperationFailed("Invalid attribute.")
+    _attrib_methods.computePointNormals(self)
 
 
-@addToClass(hou.Face)
-def hasEdge(self, point1, point2):
-    """Test if this face has an edge between two points.
+@addToClass(hou.Geometry)
+def convex(self, max_points=3):
+    """Convex the geometry into polygons with a certain number of points.
 
     Args:
-        point1 : (hou.Point)
-            An edge point.
-        point2 : (hou.Point)
-            An edge point.
+        max_points : (int)
+            The maximum number of points for each polygon.
 
-    Returns:
-        bool
-            Returns True if an edge exists, otherwise False.
+    Returns: N/A
 
     Raises: N/A
 
+    This operation is similar to using the Divide SOP and setting the 'Maximum
+    Edges'.
+
     """
-    # Test for the edge.
-    return _cpp_methods.hasEdge(
-        self.geometry(),
-        self.number(),
-        point1.number(),
-        point2.number()
-    )
+    _topology_methods.convexPolygons(self, max_points)
 
 
-@addToClass(hou.Face)
-def insertVertex(self, point, index):
-    """Insert a vertex on the point into this face at a specific index.
+@addToClass(hou.Geometry)
+def clip(self, normal, dist):
+    """Clip this geometry along a plane.
 
     Args:
-        point : (hou.Point)
-            The point the vertex will be attached to.
-        index : (int)
-            The index of the vertex to insert.
+        normal : (hou.Vector3)
+            The normal of the plane to clip with.
+        dist : (float)
+            The distance along the normal to clip at.
+
+    Returns: N/A
+
+    """
+    _topology_methods.clip(self, normal.normalized(), dist)
+
+
+@addToClass(hou.Geometry)
+def destroyEmptyPointGroups(self):
+    """Remove any empty point groups.
 
     Returns: N/A
 
     Raises: N/A
 
     """
-    # Insert the vertex.
-    _cpp_methods.insertVertex(
-        self.geometry(),
-        self.number(),
-        point.number(),
-        index
-    )
-
+    _group_methods.destroyEmptyGroups(self, 0)
 
-@addToClass(hou.Face)
-def deleteVertex(self, index):
-    """Delete the vertex at the specified index.
 
-    Args:
-        index : (int)
-            The index of the vertex to delete.
+@addToClass(hou.Geometry)
+def destroyEmptyPrimGroups(self):
+    """Remove any empty primitive groups.
 
     Returns: N/A
 
     Raises: N/A
 
     """
-    # Delete teh vertex.
-    _cpp_methods.deleteVertex(self.geometry(), self.number(), index)
+    _group_methods.destroyEmptyGroups(self, 1)
 
 
-@addToClass(hou.Face)
-def setPoint(self, index, point):
-    """Set the vertex, at the specified index, to be attached to the point.
+@addToClass(hou.Geometry)
+def destroyUnusedPoints(self, group=None):
+    """Remove any unused points.
 
     Args:
-        index : (int)
-            The index of the vertex to modify.
-        point : (hou.Point)
-            The point to attach the vertex to.
+        group=None : (hou.PointGroup)
+            An optional point group to restrict the removal.
 
     Returns: N/A
 
     Raises: N/A
 
+    If group is not None, only unused points within the group are removed.
+
     """
-    # Delete teh vertex.
-    _cpp_methods.setPoint(
-        self.geometry(),
-        self.number(),
-        index,
-        point.number()
-    )
+    if group is not None:
+        _topology_methods.destroyUnusedPoints(self, group.name())
+    else:
+        _topology_methods.destroyUnusedPoints(self, 0)
 
 
-@addToClass(hou.Prim)
-def baryCenter(self):
-    """Get the barycenter of this primitive.
+@addToClass(hou.Geometry)
+def consolidatePoints(self, distance=0.001, group=None):
+    """Consolidate points within a specified distance.
 
-    Returns:
-        hou.Vector3
-            The barycenter of the primitive.
+    Args:
+        distance=0.001 : (float)
+            The max distance to consolidate by.
+        group=None : (hou.PointGroup)
+            An optional point group to restrict the consolidation.
+
+    Returns: N/A
 
     Raises: N/A
 
+    If group is not None, only points in that group are consolidated.
+
     """
-    # Get the Position3D object representing the barycenter.
-    pos = _cpp_methods.baryCenter(self.geometry(), self.number())
+    if group is not None:
+        _topology_methods.consolidatePoints(self, distance, group.name())
+    else:
+        _topology_methods.consolidatePoints(self, distance, 0)
 
-    # Construct a vector and return it.
-    return hou.Vector3(pos.x, pos.y, pos.z)
 
+@addToClass(hou.Geometry)
+def uniquePoints(self, group=None):
+    """Unique all points in the geometry.
 
-@addToClass(hou.Prim, name="area")
-def primitiveArea(self):
-    """Get the area of this primitive.
+    Args:
+        group=None : (hou.PointGroup|hou.PrimGroup)
+            An optional group to restrict the uniqueing to.
 
-    Returns:
-        float
-            The area of the primitive.
+    Returns: N/A
 
     Raises: N/A
 
+    If a point group is specified, only points in that group are uniqued.  If
+    a primitive group is specified, only those primitives will have their
+    points uniqued.
+
     """
-    # Calculate and return the area.
-    return _cpp_methods.primitiveArea(self.geometry(), self.number())
+    if group is not None:
+        # Check the group type.
+        if isinstance(group, hou.PrimGroup):
+            group_type = 1
+        # hou.PointGroup
+        else:
+            group_type = 0
 
+        _topology_methods.uniquePoints(self, group.name(), group_type)
 
-@addToClass(hou.Prim)
-def perimeter(self):
-    """Get the perimeter of this primitive.
+    else:
+        _topology_methods.uniquePoints(self, 0, 0)
+
+
+@addToClass(hou.PointGroup, hou.PrimGroup, name="boundingBox")
+def groupBoundingBox(self, use_cache=False):
+    """Get the bounding box of this group.
+
+    Args:
+        use_cache=False : (bool)
+            Whether to use a cached bounding box if the geometry has not
+            changed since it was computed.
 
     Returns:
-        float
-            The perimeter of the primitive.
+        hou.BoundingBox
+            The bounding box of this group.
 
     Raises: N/A
 
+    Cached bounding boxes are stored by geometry and group and are only used
+    while the data ids of the point positions, the group and the topology
+    are unchanged.  If any of them change the bounds are recomputed.  Only
+    the most recently used bounding boxes are kept.
+
     """
-    # Calculate and return the perimeter.
-    return _cpp_methods.perimeter(self.geometry(), self.number())
+    import ctypes
 
+    if use_cache:
+        group_type = int(isinstance(self, hou.PrimGroup))
 
-@addToClass(hou.Prim, name="reverse")
-def reversePrim(self):
-    """Reverse the vertex order of this primitive.
+        ids = (ctypes.c_int64 * 5)()
 
-    Returns: N/A
+        _group_methods.groupBoundsDataIds(
+            self.geometry(),
+            group_type,
+            self.name(),
+            ids
+        )
 
-    Raises: N/A
+        key = (ids[0], group_type, self.name())
+        data_ids = tuple(ids[1:])
 
-    """
-    return _cpp_methods.reversePrimitive(self.geometry(), self.number())
+        entry = _GROUP_BOUNDS_CACHE.pop(key, None)
 
+        # The cached bounds are still valid so mark them as the most recently
+        # used and return a copy.
+        if entry is not None and entry[0] == data_ids:
+            _GROUP_BOUNDS_CACHE[key] = entry
 
-@addToClass(hou.Prim)
-def makeUnique(self):
-    """Unique all the points that are in this primitive.
+            return hou.BoundingBox(*entry[1])
 
-    Returns: N/A
+        bbox = groupBoundingBox(self)
 
-    Raises: N/A
+        # Data ids of -1 are not tracked so the bounds can't be cached.
+        if -1 not in data_ids:
+            _GROUP_BOUNDS_CACHE[key] = (
+                data_ids,
+                tuple(bbox.minvec()) + tuple(bbox.maxvec())
+            )
 
-    This function will unique all the points even if they are referenced by
-    other primitives.
+            # Remove the least recently used bounds.
+            while len(_GROUP_BOUNDS_CACHE) > _GROUP_BOUNDS_CACHE_SIZE:
+                _GROUP_BOUNDS_CACHE.popitem(last=False)
 
-    """
-    return _cpp_methods.makeUnique(self.geometry(), self.number())
+        return bbox
 
+    # Calculate the bounds for the group.
+    if isinstance(self, hou.PrimGroup):
+        bounds = _group_methods.primGroupBoundingBox(
+            self.geometry(),
+            self.name()
+        )
+    # Point group.
+    else:
+        bounds = _group_methods.pointGroupBoundingBox(
+            self.geometry(),
+            self.name()
+        )
 
-@addToClass(hou.Prim, name="boundingBox")
-def primBoundingBox(self):
-    """Get the bounding box of this primitive.
+    # Convert the bounds to a hou.BoundingBox and return it.
+    return _buildBoundingBox(bounds)
 
-    Returns:
-        hou.BoundingBox
-            The bounding box of the primitive.
+
+@addToModule(hou)
+def clearGroupBoundingBoxCache():
+    """Remove all the cached group bounding boxes.
+
+    Returns: N/A
 
     Raises: N/A
 
     """
-    # Calculate the bounds for the primitive.
-    bounds = _cpp_methods.boundingBox(self.geometry(), self.number())
+    _GROUP_BOUNDS_CACHE.clear()
 
-    # Convert the bounds to a hou.BoundingBox and return it.
-    return _buildBoundingBox(bounds)
 
+@addToClass(hou.Geometry)
+def evalGroupExpression(self, expression, result_name,
+                        geometry_type=hou.geometryType.Points):
+    """Create a group by combining other groups with a boolean expression.
 
-@addToClass(hou.Geometry, name="addPointNormals")
-def addPointNormalAttribute(self):
-    """Add point normals to the geometry.
+    Args:
+        expression : (str)
+            An expression of group names combined with '~' (not), '&'
+            (and), '^' (xor) and '|' (or), like '(a | b) & ~c ^ d'.
+        result_name : (str)
+            The name of the group to store the result in.
+        geometry_type=hou.geometryType.Points : (hou.geometryType)
+            The type of groups in the expression.
 
     Returns:
-        hou.Attrib
-            Returns the newly created point attribute.
+        hou.PointGroup|hou.PrimGroup
+            The result group.
 
     Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        ValueError
+            This exception is raised if the expression is invalid.
         hou.OperationFailed
-            Raise this exception if the attribute was not created.
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives), or a
+            group in the expression does not exist.
+
+    Operators have the same precedence as in C so '~' is applied first, then
+    '&', '^' and finally '|'.  The expression is evaluated natively for all
+    elements in a single parallel pass.  If the result group exists its
+    contents are replaced, and it may also be used in the expression.
 
     """
-    result = _cpp_methods.addNormalAttribute(self)
+    import ctypes
 
-    if result:
-        return self.findPointAttrib("N")
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
 
-    raise hou.OperationFailed("Could not add normal attribute.")
+    if geometry_type == hou.geometryType.Points:
+        group_type = 0
 
+    elif geometry_type == hou.geometryType.Primitives:
+        group_type = 1
 
-@addToClass(hou.Geometry, name="addPointVelocity")
-def addPointVelocityAttribute(self):
-    """Add point velocity to the geometry.
+    else:
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
 
-    Returns:
-        hou.Attrib
-            Returns the newly created point attribute.
+    names, program = _parseGroupExpression(expression)
 
-    Raises:
-        hou.OperationFailed
-            Raise this exception if the attribute was not created.
+    result = _group_methods.evalGroupExpression(
+        self,
+        group_type,
+        _buildCStringArray(names),
+        len(names),
+        _getCArray(program, ctypes.c_int),
+        len(program),
+        result_name
+    )
 
-    """
-    result = _cpp_methods.addVelocityAttribute(self)
+    if result == 1:
+        raise hou.OperationFailed(
+            "Group in expression does not exist: {0}".format(expression)
+        )
 
-    if result:
-        return self.findPointAttrib("v")
+    if group_type:
+        return self.findPrimGroup(result_name)
 
-    raise hou.OperationFailed("Could not add velocity attribute.")
+    return self.findPointGroup(result_name)
 
 
 @addToClass(hou.Geometry)
-def addColorAttribute(self, attrib_type):
-    """Add a color (Cd) attribute to the geometry.
+def createGroupFromBits(self, name, geometry_type, bits):
+    """Create a new group from packed membership bits.
 
     Args:
-        attrib_type : (hou.attribType)
-            A hou.attribType value to specify if the attribute should be a
-            point, primitive or vertex attribute.
+        name : (str)
+            The name of the new group.
+        geometry_type : (hou.geometryType)
+            The type of group to create.
+        bits : (str|bytearray|buffer)
+            The membership of each element packed into bytes, as returned
+            by membershipBits().
 
     Returns:
-        hou.Attrib
-            Returns the newly created point attribute.
-
-    Raises:
-        hou.TypeError
-            Raise this exception if attribute_type is not a valid type.
-        hou.OperationFailed
-            Raise this exception if the attribute was not created.
-
-    Point, primitive and vertex colors are supported.
-
-    """
-    # Try to add a point Cd attribute.
-    if attrib_type == hou.attribType.Point:
-        result = _cpp_methods.addDiffuseAttribute(self, 0)
+        hou.PointGroup|hou.PrimGroup
+            The new group.
 
-        if result:
-            return self.findPointAttrib("Cd")
+    Raises:
+        hou.GeometryPermissionError
+            This exception is raised if the geometry is not writeable.
+        hou.OperationFailed
+            This exception is raised if geometry_type is not one of
+            (hou.geometryType.Points or hou.geometryType.Primitives), the
+            number of bytes does not match the number of elements or a group
+            with the name already exists.
 
-    # Try to add a primitive Cd attribute.
-    elif attrib_type == hou.attribType.Prim:
-        result = _cpp_methods.addDiffuseAttribute(self, 1)
+    """
+    import ctypes
 
-        if result:
-            return self.findPrimAttrib("Cd")
+    # Make sure the geometry is not read only.
+    if self.isReadOnly():
+        raise hou.GeometryPermissionError()
 
-    # Try to add a vertex Cd attribute.
-    elif attrib_type == hou.attribType.Vertex:
-        result = _cpp_methods.addDiffuseAttribute(self, 2)
+    if geometry_type == hou.geometryType.Points:
+        group_type = 0
 
-        if result:
-            return self.findVertexAttrib("Cd")
+    elif geometry_type == hou.geometryType.Primitives:
+        group_type = 1
 
-    # The type didn't match any of the valid ones so we should thrown an
-    # exception.
     else:
-        raise hou.TypeError("Invalid attribute type.")
-
-    # We didn't create an attribute, so throw an exception.
-    raise hou.OperationFailed("Could not add Cd attribute.")
+        raise hou.OperationFailed(
+            "Geometry type must be points or primitives."
+        )
 
+    arr = (ctypes.c_char * len(bits)).from_buffer_copy(bits)
 
-@addToClass(hou.Geometry)
-def computePointNormals(self):
-    """Computes the point normals for the geometry.
+    result = _group_methods.createGroupFromBits(
+        self,
+        name,
+        group_type,
+        arr,
+        len(arr)
+    )
 
-    Returns: N/A
+    if result == 1:
+        raise hou.OperationFailed(
+            "Number of bytes does not match the number of elements."
+        )
 
-    Raises: N/A
+    elif result == 2:
+        raise hou.OperationFailed("A group with that name already exists.")
 
-    This is equivalent to using a Point sop, selecting 'Add Normal' and
-    leaving the default values.  It will add the 'N' attribute if it does not
-    exist.
+    if group_type:
+        return self.findPrimGroup(name)
 
-    """
-    _cpp_methods.computePointNormals(self)
+    return self.findPointGroup(name)
 
 
 @addToClass(hou.Geometry)
-def convex(self, max_points=3):
-    """Convex the geometry into polygons with a certain number of points.
+def groupOverlapMatrix(self, groups):
+    """Get the number of elements shared by each pair of groups.
 
     Args:
-        max_points : (int)
-            The maximum number of points for each polygon.
+        groups : (list|tuple)
+            A list of hou.PointGroup or hou.PrimGroup objects.
 
-    Returns: N/A
+    Returns:
+        ctypes.Array
+            A flattened matrix of the overlap counts.
 
-    Raises: N/A
+    Raises:
+        hou.OperationFailed
+            This exception is raised if the groups are not all point groups
+            or all primitive groups.
 
-    This operation is similar to using the Divide SOP and setting the 'Maximum
-    Edges'.
+    The number of elements in both groups i and j is stored at
+    i * len(groups) + j, and the diagonal holds the size of each group.  All
+    the counts are computed natively in a single parallel pass over the
+    elements.  The array can be viewed as an NxN matrix with
+    numpy.frombuffer(...).reshape(N, N) without copying.
 
     """
-    _cpp_methods.convexPolygons(self, max_points)
+    return _getGroupOverlapCounts(self, groups)
 
 
 @addToClass(hou.Geometry)
-def clip(self, normal, dist):
-    """Clip this geometry along a plane.
+def groupBoundingBoxes(self, groups):
+    """Get the bounding boxes of many groups.
 
     Args:
-        normal : (hou.Vector3)
-            The normal of the plane to clip with.
-        dist : (float)
-            The distance along the normal to clip at.
+        groups : (list|tuple)
+            A list of hou.PointGroup and hou.PrimGroup objects.
 
-    Returns: N/A
+    Returns:
+        tuple
+            A tuple of hou.BoundingBox objects for each group.
+
+    Raises:
+        TypeError
+            This exception is raised if any of the groups are not a
+            hou.PointGroup or hou.PrimGroup.
+        OperationFailed
+            This exception is raised if any of the groups do not exist.
+
+    The bounds of the groups are computed in parallel, with each group only
+    visiting its own members.  This is much faster than calling boundingBox()
+    on each group when there are many groups.
 
     """
-    _cpp_methods.clip(self, normal.normalized(), dist)
+    import ctypes
 
+    for group in groups:
+        if not isinstance(group, (hou.PointGroup, hou.PrimGroup)):
+            raise TypeError(
+                "Got '{0}', expected 'hou.PointGroup' or "
+                "'hou.PrimGroup'.".format(type(group).__name__)
+            )
 
-@addToClass(hou.Geometry)
-def destroyEmptyPointGroups(self):
-    """Remove any empty point groups.
+    bboxes = [None] * len(groups)
 
-    Returns: N/A
+    # Compute the point group bounds (0) and then the primitive group bounds
+    # (1).
+    for group_type, group_class in enumerate((hou.PointGroup, hou.PrimGroup)):
+        indices = [
+            idx for idx, group in enumerate(groups)
+            if isinstance(group, group_class)
+        ]
 
-    Raises: N/A
+        if not indices:
+            continue
 
-    """
-    _cpp_methods.destroyEmptyGroups(self, 0)
+        names = _buildCStringArray([groups[idx].name() for idx in indices])
 
+        bounds = (ctypes.c_double * (len(indices) * 6))()
 
-@addToClass(hou.Geometry)
-def destroyEmptyPrimGroups(self):
-    """Remove any empty primitive groups.
+        result = _group_methods.groupBoundingBoxes(
+            self,
+            group_type,
+            names,
+            len(indices),
+            bounds
+        )
 
-    Returns: N/A
+        if result == 1:
+            raise hou.OperationFailed("Invalid group.")
 
-    Raises: N/A
+        for i, idx in enumerate(indices):
+            bboxes[idx] = hou.BoundingBox(*bounds[i * 6:(i + 1) * 6])
 
-    """
-    _cpp_methods.destroyEmptyGroups(self, 1)
+    return tuple(bboxes)
 
 
-@addToClass(hou.Geometry)
-def destroyUnusedPoints(self, group=None):
-    """Remove any unused points.
+@addToClass(hou.PointGroup, name="toggle")
+def togglePoint(self, point):
+    """Toggle group membership for a point.
 
     Args:
-        group=None : (hou.PointGroup)
-            An optional point group to restrict the removal.
+        point : (hou.Point)
+            The point whose membership to toggle.
 
     Returns: N/A
 
     Raises: N/A
 
-    If group is not None, only unused points within the group are removed.
+    If the point is a part of the group, it will be removed.  If it isn't, it
+    will be added.
 
     """
-    if group is not None:
-        _cpp_methods.destroyUnusedPoints(self, group.name())
-    else:
-        _cpp_methods.destroyUnusedPoints(self, 0)
+    geometry = self.geometry()
 
+    _group_methods.toggleMembership(geometry, self.name(), 0, point.number())
 
-@addToClass(hou.Geometry)
-def consolidatePoints(self, distance=0.001, group=None):
-    """Consolidate points within a specified distance.
+
+@addToClass(hou.PrimGroup, name="toggle")
+def togglePrim(self, prim):
+    """Toggle group membership for a primitive.
 
     Args:
-        distance=0.001 : (float)
-            The max distance to consolidate by.
-        group=None : (hou.PointGroup)
-            An optional point group to restrict the consolidation.
+        prim : (hou.Prim)
+            The primitive whose membership to toggle.
 
     Returns: N/A
 
     Raises: N/A
 
-    If group is not None, only points in that group are consolidated.
+    If the primitive is a part of the group, it will be removed.  If it isnt,
+    it will be added.
 
     """
-    if group is not None:
-        _cpp_methods.consolidatePoints(self, distance, group.name())
-    else:
-        _cpp_methods.consolidatePoints(self, distance, 0)
+    geometry = self.geometry()
 
+    _group_methods.toggleMembership(geometry, self.name(), 1, prim.number())
 
-@addToClass(hou.Geometry)
-def uniquePoints(self, group=None):
-    """Unique all points in the geometry.
 
-    Args:
-        group=None : (hou.PointGroup|hou.PrimGroup)
-            An optional group to restrict the uniqueing to.
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def membershipBits(self):
+    """Get the membership of every element packed into bytes.
 
-    Returns: N/A
+    Returns:
+        str
+            A string of bytes with a bit for each element.
 
     Raises: N/A
 
-    If a point group is specified, only points in that group are uniqued.  If
-    a primitive group is specified, only those primitives will have their
-    points uniqued.
+    The bits are indexed by element number, with the first element of each
+    byte stored in the lowest bit.  This is the same layout as
+    numpy.packbits(..., bitorder="little").  The bytes can be stored or sent
+    to other processes and turned back into a group using
+    hou.Geometry.createGroupFromBits().
 
     """
-    if group is not None:
-        # Check the group type.
-        if isinstance(group, hou.PrimGroup):
-            group_type = 1
-        # hou.PointGroup
-        else:
-            group_type = 0
+    import ctypes
 
-        _cpp_methods.uniquePoints(self, group.name(), group_type)
+    geometry = self.geometry()
 
+    if isinstance(self, hou.PrimGroup):
+        group_type = 1
+        num_elements = len(geometry.iterPrims())
+    # hou.PointGroup
     else:
-        _cpp_methods.uniquePoints(self, 0, 0)
+        group_type = 0
+        num_elements = len(geometry.iterPoints())
 
+    arr = ctypes.create_string_buffer((num_elements + 7) / 8)
 
-@addToClass(hou.PointGroup, hou.PrimGroup, name="boundingBox")
-def groupBoundingBox(self):
-    """Get the bounding box of this group.
+    _group_methods.groupMembershipBits(geometry, self.name(), group_type, arr)
 
-    Returns:
-        hou.BoundingBox
-            The bounding box of this group.
+    return arr.raw
 
-    Raises: N/A
 
-    """
-    # Calculate the bounds for the group.
-    if isinstance(self, hou.PrimGroup):
-        bounds = _cpp_methods.primGroupBoundingBox(
-            self.geometry(),
-            self.name()
-        )
-    # Point group.
-    else:
-        bounds = _cpp_methods.pointGroupBoundingBox(
-            self.geometry(),
-            self.name()
-        )
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def toggleMany(self, indices):
+    """Toggle group membership for many elements.
 
-    # Convert the bounds to a hou.BoundingBox and return it.
-    return _buildBoundingBox(bounds)
+    Args:
+        indices : (list|tuple|buffer|str)
+            The numbers of the elements to toggle, as a sequence or int
+            buffer, or a string of numbers and ranges like '0-10 15'.
 
+    Returns: N/A
+
+    Raises:
+        ValueError
+            This exception is raised if the string is invalid.
+        hou.OperationFailed
+            This exception is raised if an element number is invalid.
+
+    Elements that are part of the group will be removed and elements that
+    aren't will be added.  Elements listed more than once are toggled more
+    than once.
+
+    """
+    _modifyGroupMembership(self, 2, indices)
 
-@addToClass(hou.PointGroup, name="toggle")
-def togglePoint(self, point):
-    """Toggle group membership for a point.
+
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def addMany(self, indices):
+    """Add many elements to the group.
 
     Args:
-        point : (hou.Point)
-            The point whose membership to toggle.
+        indices : (list|tuple|buffer|str)
+            The numbers of the elements to add, as a sequence or int buffer,
+            or a string of numbers and ranges like '0-10 15'.
 
     Returns: N/A
 
-    Raises: N/A
-
-    If the point is a part of the group, it will be removed.  If it isn't, it
-    will be added.
+    Raises:
+        ValueError
+            This exception is raised if the string is invalid.
+        hou.OperationFailed
+            This exception is raised if an element number is invalid.
 
     """
-    geometry = self.geometry()
+    _modifyGroupMembership(self, 0, indices)
 
-    _cpp_methods.toggleMembership(geometry, self.name(), 0, point.number())
 
-
-@addToClass(hou.PrimGroup, name="toggle")
-def togglePrim(self, prim):
-    """Toggle group membership for a primitive.
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def removeMany(self, indices):
+    """Remove many elements from the group.
 
     Args:
-        prim : (hou.Prim)
-            The primitive whose membership to toggle.
+        indices : (list|tuple|buffer|str)
+            The numbers of the elements to remove, as a sequence or int
+            buffer, or a string of numbers and ranges like '0-10 15'.
 
     Returns: N/A
 
-    Raises: N/A
-
-    If the primitive is a part of the group, it will be removed.  If it isnt,
-    it will be added.
+    Raises:
+        ValueError
+            This exception is raised if the string is invalid.
+        hou.OperationFailed
+            This exception is raised if an element number is invalid.
 
     """
-    geometry = self.geometry()
-
-    _cpp_methods.toggleMembership(geometry, self.name(), 1, prim.number())
+    _modifyGroupMembership(self, 1, indices)
 
 
 @addToClass(hou.PointGroup, hou.PrimGroup)
@@ -3737,7 +9850,7 @@ def toggleEntries(self):
     else:
         group_type = 0
 
-    _cpp_methods.toggleEntries(geometry, self.name(), group_type)
+    _group_methods.toggleEntries(geometry, self.name(), group_type)
 
 
 @addToClass(hou.PointGroup, hou.PrimGroup, name="copy")
@@ -3782,7 +9895,7 @@ def copyGroup(self, new_group_name):
         raise hou.OperationFailed("A group with that name already exists.")
 
     # Copy the group.
-    _cpp_methods.copyGroup(geometry, group_type, self.name(), new_group_name)
+    _group_methods.copyGroup(geometry, group_type, self.name(), new_group_name)
 
 
 @addToClass(hou.PointGroup, name="containsAny")
@@ -3804,7 +9917,7 @@ def pointGroupContainsAny(self, group):
     """
     geometry = self.geometry()
 
-    return _cpp_methods.containsAny(geometry, self.name(), group.name(), 0)
+    return _group_methods.containsAny(geometry, self.name(), group.name(), 0)
 
 
 @addToClass(hou.PrimGroup, name="containsAny")
@@ -3826,7 +9939,85 @@ def primGroupContainsAny(self, group):
     """
     geometry = self.geometry()
 
-    return _cpp_methods.containsAny(geometry, self.name(), group.name(), 1)
+    return _group_methods.containsAny(geometry, self.name(), group.name(), 1)
+
+
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def intersectionCount(self, group):
+    """Get the number of elements in both this group and another group.
+
+    Args:
+        group : (hou.PointGroup|hou.PrimGroup)
+            A group of the same type as this group.
+
+    Returns:
+        int
+            The number of elements in both groups.
+
+    Raises:
+        hou.OperationFailed
+            This exception is raised if the groups are different types.
+
+    """
+    counts = _getGroupOverlapCounts(self.geometry(), (self, group))
+
+    return counts[1]
+
+
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def containsAll(self, group):
+    """Returns whether or not all the elements in the group are in this group.
+
+    Args:
+        group : (hou.PointGroup|hou.PrimGroup)
+            A group of the same type as this group.
+
+    Returns:
+        bool
+            Returns True if every element of the group is in this group,
+            otherwise False.
+
+    Raises:
+        hou.OperationFailed
+            This exception is raised if the groups are different types.
+
+    """
+    counts = _getGroupOverlapCounts(self.geometry(), (self, group))
+
+    # The number of shared elements equals the size of the other group.
+    return counts[1] == counts[3]
+
+
+@addToClass(hou.PointGroup, hou.PrimGroup)
+def jaccard(self, group):
+    """Get the Jaccard similarity of this group and another group.
+
+    Args:
+        group : (hou.PointGroup|hou.PrimGroup)
+            A group of the same type as this group.
+
+    Returns:
+        float
+            The number of elements in both groups divided by the number of
+            elements in either group.
+
+    Raises:
+        hou.OperationFailed
+            This exception is raised if the groups are different types.
+
+    The similarity is between 0, when the groups share no elements, and 1,
+    when they contain the same elements.  Two empty groups have a similarity
+    of 1.
+
+    """
+    counts = _getGroupOverlapCounts(self.geometry(), (self, group))
+
+    union = counts[0] + counts[3] - counts[1]
+
+    if not union:
+        return 1.0
+
+    return float(counts[1]) / union
 
 
 @addToClass(hou.PrimGroup)
@@ -3864,7 +10055,7 @@ def convertToPointGroup(self, new_group_name=None, destroy=True):
         raise hou.OperationFailed("Group already exists.")
 
     # Convert the group.
-    _cpp_methods.primToPointGroup(
+    _group_methods.primToPointGroup(
         geometry,
         self.name(),
         new_group_name,
@@ -3910,7 +10101,7 @@ def convertToPrimGroup(self, new_group_name=None, destroy=True):
         raise hou.OperationFailed("Group already exists.")
 
     # Convert the group.
-    _cpp_methods.pointToPrimGroup(
+    _group_methods.pointToPrimGroup(
         geometry,
         self.name(),
         new_group_name,
@@ -3937,7 +10128,7 @@ def isInside(self, bbox):
     Raises: N/A
 
     """
-    return _cpp_methods.isInside(self, bbox)
+    return _math_methods.isInside(self, bbox)
 
 
 @addToClass(hou.BoundingBox)
@@ -3955,7 +10146,7 @@ def intersects(self, bbox):
     Raises: N/A
 
     """
-    return _cpp_methods.intersects(self, bbox)
+    return _math_methods.intersects(self, bbox)
 
 
 @addToClass(hou.BoundingBox)
@@ -3976,7 +10167,7 @@ def computeIntersection(self, bbox):
     intersection of this box and the supplied box.
 
     """
-    return _cpp_methods.computeIntersection(self, bbox)
+    return _math_methods.computeIntersection(self, bbox)
 
 
 @addToClass(hou.BoundingBox)
@@ -3996,7 +10187,7 @@ def expandBounds(self, dltx, dlty, dltz):
     Raises: N/A
 
     """
-    _cpp_methods.expandBounds(self, dltx, dlty, dltz)
+    _math_methods.expandBounds(self, dltx, dlty, dltz)
 
 
 @addToClass(hou.BoundingBox)
@@ -4012,7 +10203,7 @@ def addToMin(self, vec):
     Raises: N/A
 
     """
-    _cpp_methods.addToClassMin(self, vec)
+    _math_methods.addToMin(self, vec)
 
 
 @addToClass(hou.BoundingBox)
@@ -4028,7 +10219,7 @@ def addToMax(self, vec):
     Raises: N/A
 
     """
-    _cpp_methods.addToClassMax(self, vec)
+    _math_methods.addToMax(self, vec)
 
 
 @addToClass(hou.BoundingBox, name="area")
@@ -4042,7 +10233,7 @@ def boundingBoxArea(self):
     Raises: N/A
 
     """
-    return _cpp_methods.boundingBoxArea(self)
+    return _math_methods.boundingBoxArea(self)
 
 
 @addToClass(hou.BoundingBox, name="volume")
@@ -4056,7 +10247,7 @@ def boundingBoxVolume(self):
     Raises: N/A
 
     """
-    return _cpp_methods.boundingBoxVolume(self)
+    return _math_methods.boundingBoxVolume(self)
 
 
 @addToClass(hou.Parm, name="isDefault")
@@ -4077,7 +10268,7 @@ def isParmDefault(self):
     index = self.componentIndex()
 
     # Pass in the tuple name since we have to access the actual parm index.
-    return _cpp_methods.isParmDefault(node, self.tuple().name(), index)
+    return _node_methods.isParmDefault(node, self.tuple().name(), index)
 
 
 @addToClass(hou.ParmTuple, name="isDefault")
@@ -4096,7 +10287,7 @@ def isParmTupleDefault(self):
 
     # Pass in an index of -1 to say we care about the entire parameter, not
     # just a specific index.
-    return _cpp_methods.isParmDefault(node, self.name(), -1)
+    return _node_methods.isParmDefault(node, self.name(), -1)
 
 
 @addToClass(hou.Parm)
@@ -4114,7 +10305,7 @@ def getReferencingParms(self):
     node = self.node()
 
     # Get any paths to referencing parms.
-    result = _cpp_methods.getReferencingParms(node, self.name())
+    result = _node_methods.getReferencingParms(node, self.name())
 
     # Create a tuple of parms.
     return tuple([hou.parm(parm_path) for parm_path in result if parm_path])
@@ -4177,7 +10368,7 @@ def insertMultiParmItem(self, index):
     if not self.isMultiParm():
         raise hou.OperationFailed("Not a multiparm.")
 
-    _cpp_methods.insertMultiParmItem(node, self.name(), index)
+    _node_methods.insertMultiParmItem(node, self.name(), index)
 
 
 @addToClass(hou.Parm, hou.ParmTuple)
@@ -4204,7 +10395,7 @@ def removeMultiParmItem(self, index):
     if not self.isMultiParm():
         raise hou.OperationFailed("Not a multiparm.")
 
-    _cpp_methods.removeMultiParmItem(node, self.name(), index)
+    _node_methods.removeMultiParmItem(node, self.name(), index)
 
 
 @addToClass(hou.Parm, hou.ParmTuple)
@@ -4230,7 +10421,7 @@ def getMultiParmInstances(self):
         raise hou.OperationFailed("Not a multiparm.")
 
     # Get the multiparm parameter names.
-    result = _cpp_methods.getMultiParmInstances(node, self.name())
+    result = _node_methods.getMultiParmInstances(node, self.name())
 
     multi_parms = []
 
@@ -4287,7 +10478,7 @@ def disconnectAllInputs(self):
     Raises: N/A
 
     """
-    return _cpp_methods.disconnectAllInputs(self)
+    return _node_methods.disconnectAllInputs(self)
 
 
 @addToClass(hou.Node)
@@ -4299,7 +10490,7 @@ def disconnectAllOutputs(self):
     Raises: N/A
 
     """
-    return _cpp_methods.disconnectAllOutputs(self)
+    return _node_methods.disconnectAllOutputs(self)
 
 
 @addToClass(hou.Node)
@@ -4322,7 +10513,7 @@ def inputLabel(self, index):
     if index not in range(0, self.nodeType.maxNumInputs()):
         raise IndexError("Index out of range.")
 
-    return _cpp_methods.inputLabel(self, index)
+    return _node_methods.inputLabel(self, index)
 
 
 @addToClass(hou.Node)
@@ -4338,7 +10529,7 @@ def messageNodes(self):
 
     """
     # Get any message node paths.
-    result = _cpp_methods.messageNodes(self)
+    result = _node_methods.messageNodes(self)
 
     # Convert them to hou.Nodes.
     return _getNodesFromPaths(result)
@@ -4355,7 +10546,7 @@ def representativeNode(self):
     Raises: N/A
 
     """
-    session_id = _cpp_methods.representativeNode(self)
+    session_id = _node_methods.representativeNode(self)
 
     return hou.nodeBySessionId(session_id)
 
@@ -4376,7 +10567,7 @@ def isContainedBy(self, node):
     Raises: N/A
 
     """
-    return _cpp_methods.isContainedBy(self, node)
+    return _node_methods.isContainedBy(self, node)
 
 
 @addToClass(hou.Node)
@@ -4391,7 +10582,7 @@ def isEditable(self):
     Raises: N/A
 
     """
-    return _cpp_methods.isEditable(self)
+    return _node_methods.isEditable(self)
 
 
 @addToClass(hou.Node)
@@ -4408,7 +10599,7 @@ def isCompiled(self):
     or has somehow become compiled on its own.
 
     """
-    return _cpp_methods.isCompiled(self)
+    return _node_methods.isCompiled(self)
 
 
 @addToClass(hou.Node)
@@ -4426,7 +10617,7 @@ def getOpReferences(self, recurse=False):
     Raises: N/A
 
     """
-    result = _cpp_methods.getExistingOpReferences(self, recurse)
+    result = _node_methods.getExistingOpReferences(self, recurse)
 
     return _getNodesFromPaths(result)
 
@@ -4446,7 +10637,7 @@ def getOpDependents(self, recurse=False):
     Raises: N/A
 
     """
-    result = _cpp_methods.getExistingOpDependents(self, recurse)
+    result = _node_methods.getExistingOpDependents(self, recurse)
 
     return _getNodesFromPaths(result)
 
@@ -4492,7 +10683,7 @@ def setIcon(self, icon_name):
     Raises: N/A
 
     """
-    return _cpp_methods.setIcon(self, icon_name)
+    return _node_methods.setIcon(self, icon_name)
 
 
 @addToClass(hou.NodeType)
@@ -4504,7 +10695,7 @@ def setDefaultIcon(self):
     Raises: N/A
 
     """
-    return _cpp_methods.setDefaultIcon(self)
+    return _node_methods.setDefaultIcon(self)
 
 
 @addToClass(hou.NodeType)
@@ -4518,7 +10709,7 @@ def isPython(self):
     Raises: N/A
 
     """
-    return _cpp_methods.isPython(self)
+    return _node_methods.isPython(self)
 
 
 @addToClass(hou.NodeType)
@@ -4535,7 +10726,7 @@ def isSubnetType(self):
     This is the operator type which is used as a default container for nodes.
 
     """
-    return _cpp_methods.isSubnetType(self)
+    return _node_methods.isSubnetType(self)
 
 
 @addToClass(hou.Vector3)
@@ -4627,7 +10818,7 @@ def getDual(self):
     mat = hou.Matrix3()
 
     # Compute the dual.
-    _cpp_methods.getDual(self, mat)
+    _math_methods.getDual(self, mat)
 
     return mat
 
@@ -4708,7 +10899,7 @@ def buildLookat(from_vec, to_vec, up):
     mat = hou.Matrix3()
 
     # Calculate the lookat and stick it in the matrix.
-    _cpp_methods.buildLookat(mat, from_vec, to_vec, up)
+    _math_methods.buildLookat(mat, from_vec, to_vec, up)
 
     return mat
 
@@ -4805,7 +10996,7 @@ def getMetaSource(file_path):
     if file_path not in hou.hda.loadedFiles():
         return None
 
-    return _cpp_methods.getMetaSource(file_path)
+    return _node_methods.getMetaSource(file_path)
 
 
 @addToClass(hou.HDADefinition)